@@ -0,0 +1,87 @@
+import base64
+import json
+from datetime import datetime
+from decimal import Decimal
+from sqlalchemy import DateTime
+
+
+# Colonnes jamais renvoyées par l'API
+HIDDEN_COLUMNS = {"password"}
+
+
+def _json_value(value):
+    """Convertit une valeur de colonne en valeur JSON."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def to_dict(obj) -> dict:
+    """
+    Convertit un objet du modèle en dictionnaire JSON (colonnes seulement).
+    """
+    return {
+        column.key: _json_value(getattr(obj, column.key))
+        for column in obj.__table__.columns
+        if column.key not in HIDDEN_COLUMNS
+    }
+
+
+def encode_cursor(row, columns: list) -> str:
+    """
+    Encode le curseur de pagination (valeurs des colonnes de tri)
+    de la dernière ligne d'une page en une chaîne opaque.
+    """
+    values = [_json_value(getattr(row, column.key)) for column in columns]
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor: str, columns: list) -> tuple:
+    """
+    Décode un curseur produit par encode_cursor pour les mêmes colonnes.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError:
+        raise ValueError("Curseur de pagination invalide.")
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise ValueError("Curseur de pagination invalide.")
+    return tuple(
+        datetime.fromisoformat(value)
+        if isinstance(column.type, DateTime) and value is not None else value
+        for column, value in zip(columns, values)
+        )
+
+
+def parse_values(model, data: dict, allowed: tuple) -> dict:
+    """
+    Filtre le corps d'une requête sur les champs autorisés et convertit
+    les dates ISO 8601 des colonnes DateTime du modèle.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Le corps de la requête doit être un objet JSON.")
+    unknown = set(data) - set(allowed)
+    if unknown:
+        raise ValueError(f"Champs inconnus : {', '.join(sorted(unknown))}")
+
+    columns = model.__table__.columns
+    values = {}
+    for key, value in data.items():
+        if (
+            key in columns and isinstance(columns[key].type, DateTime)
+            and isinstance(value, str)
+        ):
+            value = datetime.fromisoformat(value)
+        values[key] = value
+    return values
+
+
+def require_fields(values: dict, required: tuple):
+    """
+    Vérifie que les champs obligatoires sont présents.
+    """
+    missing = [name for name in required if values.get(name) is None]
+    if missing:
+        raise ValueError(f"Champs obligatoires manquants : {', '.join(missing)}")
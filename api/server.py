@@ -0,0 +1,463 @@
+import asyncio
+from datetime import datetime
+from aiohttp import web
+from config import (
+    ALGORITHM,
+    API_MAX_PAGE_SIZE,
+    SECRET_KEY_TOKEN,
+    async_session,
+    dispose_async_engine
+    )
+from model.client_model import Client
+from model.contract_model import Contract
+from model.event_model import Event
+from model.user_model import User
+from authentication.auth_controller import authenticate_user_async
+from authentication.auth_service import get_current_user_role_async
+from authentication.auth_token import (
+    decode_jwt_token_async,
+    issue_session_tokens,
+    rotate_refresh_token
+    )
+from controller import (
+    async_client_controller as clients,
+    async_contract_controller as contracts,
+    async_event_controller as events,
+    async_user_controller as users
+    )
+from controller.client_controller import CLIENT_KEYSET
+from controller.contract_controller import CONTRACT_KEYSET, contract_filters
+from controller.event_controller import _event_keyset, event_filters
+from controller.pagination import DEFAULT_PAGE_SIZE
+from controller.user_controller import USER_KEYSET
+from api.serialization import (
+    decode_cursor,
+    encode_cursor,
+    parse_values,
+    require_fields,
+    to_dict
+    )
+from api.validation import (
+    validate_client,
+    validate_contract,
+    validate_event,
+    validate_login,
+    validate_user
+    )
+from monitoring import init_sentry
+
+
+# Routes accessibles sans jeton d'accès
+PUBLIC_PATHS = {"/api/login", "/api/refresh"}
+
+CLIENT_FIELDS = (
+    "full_name", "email", "phone_number", "company_name",
+    "commercial_contact_id"
+    )
+CONTRACT_FIELDS = (
+    "client_id", "commercial_contact_id", "total_price", "remaining_price",
+    "statut"
+    )
+EVENT_FIELDS = (
+    "event_name", "contract_id", "client_id", "client_name", "client_contact",
+    "date_start", "date_end", "support_contact_id", "location", "attendees",
+    "notes"
+    )
+EVENT_REQUIRED = (
+    "event_name", "contract_id", "client_id", "client_name", "client_contact",
+    "date_start", "date_end", "location"
+    )
+LOGIN_FIELDS = ("employee_number", "password")
+USER_FIELDS = (
+    "employee_number", "complete_name", "email", "password", "department_name"
+    )
+
+
+def _error(status: int, message: str) -> web.Response:
+    """Réponse JSON d'erreur."""
+    return web.json_response({"error": message}, status=status)
+
+
+@web.middleware
+async def error_middleware(request, handler):
+    """
+    Traduit les exceptions des contrôleurs en réponses HTTP.
+    """
+    try:
+        return await handler(request)
+    except web.HTTPException:
+        raise
+    except PermissionError as e:
+        return _error(403, str(e))
+    except ValueError as e:
+        return _error(400, str(e))
+    except Exception as e:
+        return _error(500, str(e))
+
+
+@web.middleware
+async def auth_middleware(request, handler):
+    """
+    Vérifie le jeton « Authorization: Bearer » sans bloquer la boucle
+    (révocation lue en base dans un thread, voir decode_jwt_token_async).
+    """
+    if request.path in PUBLIC_PATHS:
+        return await handler(request)
+
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return _error(401, "Jeton d'accès manquant.")
+    try:
+        payload = await decode_jwt_token_async(
+            token, SECRET_KEY_TOKEN, ALGORITHM
+            )
+    except PermissionError as e:
+        return _error(401, str(e))
+    request["user_id"] = int(payload["sub"]) if payload.get("sub") else None
+    request["token"] = token
+    return await handler(request)
+
+
+def session_middleware(session_factory):
+    """
+    Ouvre une session par requête ; sa connexion est prise dans le pool
+    du moteur asynchrone et y est rendue à la fin de la requête.
+    """
+    @web.middleware
+    async def middleware(request, handler):
+        async with session_factory() as db:
+            request["db"] = db
+            return await handler(request)
+    return middleware
+
+
+def _page_args(request, columns: list) -> tuple:
+    """
+    Lit les paramètres de pagination `limit` et `after` (curseur).
+    """
+    limit = int(request.query.get("limit", DEFAULT_PAGE_SIZE))
+    if not 0 < limit <= API_MAX_PAGE_SIZE:
+        raise ValueError(f"limit doit être compris entre 1 et {API_MAX_PAGE_SIZE}.")
+    after = request.query.get("after")
+    return limit, decode_cursor(after, columns) if after else None
+
+
+def _page_response(rows: list, columns: list, limit: int) -> web.Response:
+    """
+    Réponse d'une page : les lignes et le curseur de la page suivante.
+    """
+    next_cursor = (
+        encode_cursor(rows[-1], columns) if len(rows) == limit else None
+        )
+    return web.json_response({
+        "items": [to_dict(row) for row in rows],
+        "next": next_cursor,
+    })
+
+
+def _flag(request, name: str) -> bool:
+    """Lit un paramètre booléen de l'URL."""
+    return request.query.get(name, "false").lower() in ("1", "true", "yes")
+
+
+def _int_param(request, name: str):
+    """Lit un paramètre entier optionnel de l'URL."""
+    value = request.query.get(name)
+    return int(value) if value is not None else None
+
+
+def _date_param(request, name: str):
+    """Lit une date ISO 8601 optionnelle de l'URL."""
+    value = request.query.get(name)
+    return datetime.fromisoformat(value) if value else None
+
+
+def _id(request) -> int:
+    """Identifiant de la ressource dans l'URL."""
+    return int(request.match_info["id"])
+
+
+async def _json(request) -> dict:
+    """Lit le corps JSON de la requête, qui doit être un objet."""
+    try:
+        data = await request.json()
+    except ValueError:
+        data = None
+    if not isinstance(data, dict):
+        raise ValueError("Le corps de la requête doit être un objet JSON.")
+    return data
+
+
+async def _body(request, model, allowed: tuple, validate) -> dict:
+    """
+    Lit et filtre le corps JSON de la requête, puis vérifie
+    les champs présents avec la fonction `validate`.
+    """
+    return validate(parse_values(model, await _json(request), allowed))
+
+
+def _found(obj, status: int = 200) -> web.Response:
+    """Réponse pour une ressource, ou 404 si elle n'existe pas."""
+    if obj is None:
+        return _error(404, "Ressource introuvable.")
+    return web.json_response(to_dict(obj), status=status)
+
+
+def _deleted(obj) -> web.Response:
+    """Réponse d'une suppression, ou 404 si la ressource n'existe pas."""
+    if obj is None:
+        return _error(404, "Ressource introuvable.")
+    return web.Response(status=204)
+
+
+async def login(request):
+    """
+    Échange un numéro d'employé et un mot de passe contre un couple
+    de jetons. Le rôle est signé dans le jeton d'accès.
+    """
+    data = await _body(request, User, LOGIN_FIELDS, validate_login)
+    user = await authenticate_user_async(
+        request["db"], data["employee_number"], data["password"]
+        )
+    if user is None:
+        return _error(401, "Numéro d'employé ou mot de passe incorrect.")
+
+    role = await get_current_user_role_async(user.id, request["db"], None)
+    access_token, refresh_token = issue_session_tokens(user.id, role)
+    return web.json_response({
+        "access_token": access_token,
+        "refresh_token": refresh_token,
+        "token_type": "bearer",
+    })
+
+
+async def refresh(request):
+    """
+    Échange un jeton de rafraîchissement contre un nouveau couple de jetons.
+    """
+    data = await _json(request)
+    try:
+        # La révocation de l'ancien jeton utilise la session synchrone
+        access_token, refresh_token = await asyncio.to_thread(
+            rotate_refresh_token, data.get("refresh_token", ""), None, False
+            )
+    except PermissionError as e:
+        return _error(401, str(e))
+    return web.json_response({
+        "access_token": access_token,
+        "refresh_token": refresh_token,
+        "token_type": "bearer",
+    })
+
+
+async def list_clients(request):
+    """Page de clients (paramètres limit et after)."""
+    limit, after = _page_args(request, CLIENT_KEYSET)
+    rows = await clients.get_clients_page(
+        request["db"], request["token"], limit=limit, after=after
+        )
+    return _page_response(rows, CLIENT_KEYSET, limit)
+
+
+async def create_client(request):
+    """Crée un client."""
+    values = await _body(request, Client, CLIENT_FIELDS, validate_client)
+    require_fields(values, ("full_name", "email"))
+    client = await clients.create_client(
+        request["db"], request["user_id"], request["token"], **values
+        )
+    return _found(client, status=201)
+
+
+async def update_client(request):
+    """Met à jour un client."""
+    values = await _body(request, Client, CLIENT_FIELDS, validate_client)
+    client = await clients.update_client(
+        request["db"], request["user_id"], request["token"], _id(request),
+        **values
+        )
+    return _found(client)
+
+
+async def delete_client(request):
+    """Supprime un client."""
+    client = await clients.delete_client(
+        request["db"], request["user_id"], request["token"], _id(request)
+        )
+    return _deleted(client)
+
+
+async def list_contracts(request):
+    """
+    Page de contrats, filtrée par statut, fully_paid, date_from et date_to.
+    """
+    limit, after = _page_args(request, CONTRACT_KEYSET)
+    filters = contract_filters(
+        statut=request.query.get("statut"),
+        fully_paid=_flag(request, "fully_paid"),
+        date_from=_date_param(request, "date_from"),
+        date_to=_date_param(request, "date_to")
+        )
+    rows = await contracts.get_contracts_page(
+        request["db"], request["token"], limit=limit, after=after,
+        filters=filters
+        )
+    return _page_response(rows, CONTRACT_KEYSET, limit)
+
+
+async def create_contract(request):
+    """Crée un contrat."""
+    values = await _body(request, Contract, CONTRACT_FIELDS, validate_contract)
+    require_fields(values, CONTRACT_FIELDS)
+    contract = await contracts.create_contract(
+        request["db"], request["user_id"], request["token"], **values
+        )
+    return _found(contract, status=201)
+
+
+async def update_contract(request):
+    """Met à jour un contrat."""
+    values = await _body(request, Contract, CONTRACT_FIELDS, validate_contract)
+    contract = await contracts.update_contract(
+        request["db"], request["user_id"], request["token"], _id(request),
+        **values
+        )
+    return _found(contract)
+
+
+async def delete_contract(request):
+    """Supprime un contrat."""
+    contract = await contracts.delete_contract(
+        request["db"], request["user_id"], request["token"], _id(request)
+        )
+    return _deleted(contract)
+
+
+async def list_events(request):
+    """Page d'événements, triée par id ou date_start (order_by) et filtrée."""
+    order_by = request.query.get("order_by", "id")
+    columns = _event_keyset(order_by)
+    limit, after = _page_args(request, columns)
+    filters = event_filters(
+        unassigned=_flag(request, "unassigned"),
+        support_contact_id=_int_param(request, "support_contact_id"),
+        date_from=_date_param(request, "date_from"),
+        date_to=_date_param(request, "date_to")
+        )
+    rows = await events.get_events_page(
+        request["db"], request["token"], limit=limit, after=after,
+        order_by=order_by, filters=filters
+        )
+    return _page_response(rows, columns, limit)
+
+
+async def create_event(request):
+    """Crée un événement."""
+    values = await _body(request, Event, EVENT_FIELDS, validate_event)
+    require_fields(values, EVENT_REQUIRED)
+    for name in EVENT_FIELDS:
+        values.setdefault(name, None)
+    event = await events.create_event(
+        request["db"], request["user_id"], request["token"], **values
+        )
+    return _found(event, status=201)
+
+
+async def update_event(request):
+    """Met à jour un événement."""
+    values = await _body(request, Event, EVENT_FIELDS, validate_event)
+    event = await events.update_event(
+        request["db"], request["user_id"], request["token"], _id(request),
+        **values
+        )
+    return _found(event)
+
+
+async def delete_event(request):
+    """Supprime un événement."""
+    event = await events.delete_event(
+        request["db"], request["user_id"], request["token"], _id(request)
+        )
+    return _deleted(event)
+
+
+async def list_users(request):
+    """Page d'utilisateurs hors managers (paramètres limit et after)."""
+    limit, after = _page_args(request, USER_KEYSET)
+    rows = await users.get_users_page(
+        request["db"], request["token"], limit=limit, after=after
+        )
+    return _page_response(rows, USER_KEYSET, limit)
+
+
+async def create_user(request):
+    """Crée un utilisateur."""
+    values = await _body(request, User, USER_FIELDS, validate_user)
+    require_fields(values, USER_FIELDS)
+    user = await users.create_user(
+        request["db"], request["user_id"], request["token"], **values
+        )
+    return _found(user, status=201)
+
+
+async def update_user(request):
+    """Met à jour un utilisateur."""
+    values = await _body(request, User, USER_FIELDS, validate_user)
+    user = await users.update_user(
+        request["db"], request["user_id"], request["token"], _id(request),
+        **values
+        )
+    return _found(user)
+
+
+async def delete_user(request):
+    """Supprime un utilisateur."""
+    user = await users.delete_user(
+        request["db"], request["user_id"], request["token"], _id(request)
+        )
+    return _deleted(user)
+
+
+async def _on_startup(app):
+    """Initialise Sentry au démarrage du serveur."""
+    init_sentry()
+
+
+async def _on_cleanup(app):
+    """Ferme les connexions du pool à l'arrêt du serveur."""
+    await dispose_async_engine()
+
+
+def create_app(session_factory=async_session) -> web.Application:
+    """
+    Crée l'application HTTP. Chaque requête utilise sa propre session
+    créée par `session_factory` (par défaut config.async_session).
+    """
+    app = web.Application(middlewares=[
+        error_middleware,
+        auth_middleware,
+        session_middleware(session_factory),
+    ])
+    app.add_routes([
+        web.post("/api/login", login),
+        web.post("/api/refresh", refresh),
+        web.get("/api/clients", list_clients),
+        web.post("/api/clients", create_client),
+        web.patch("/api/clients/{id:\\d+}", update_client),
+        web.delete("/api/clients/{id:\\d+}", delete_client),
+        web.get("/api/contracts", list_contracts),
+        web.post("/api/contracts", create_contract),
+        web.patch("/api/contracts/{id:\\d+}", update_contract),
+        web.delete("/api/contracts/{id:\\d+}", delete_contract),
+        web.get("/api/events", list_events),
+        web.post("/api/events", create_event),
+        web.patch("/api/events/{id:\\d+}", update_event),
+        web.delete("/api/events/{id:\\d+}", delete_event),
+        web.get("/api/users", list_users),
+        web.post("/api/users", create_user),
+        web.patch("/api/users/{id:\\d+}", update_user),
+        web.delete("/api/users/{id:\\d+}", delete_user),
+    ])
+    app.on_startup.append(_on_startup)
+    app.on_cleanup.append(_on_cleanup)
+    return app
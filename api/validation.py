@@ -0,0 +1,141 @@
+from datetime import datetime
+from model.contract_model import STATUTS_CONTRAT
+from controller.parsing import parse_price
+from view.validation import (
+    validate_email,
+    validate_employee_number,
+    validate_password,
+    validate_phone_number,
+    validate_text
+    )
+
+
+# Les corps des requêtes suivent les règles de saisie du CLI
+# (view/validation.py) et de l'import en masse. Seuls les champs
+# présents sont vérifiés : une mise à jour peut être partielle.
+
+
+def _check_text(values: dict, name: str, validate, message: str):
+    """Vérifie un champ texte avec une fonction de view/validation.py."""
+    value = values.get(name)
+    if value is None:
+        return
+    if not isinstance(value, str) or not validate(value):
+        raise ValueError(f"{message} : {value}")
+
+
+def _check_id(values: dict, name: str):
+    """Vérifie qu'un champ est un identifiant entier positif."""
+    value = values.get(name)
+    if value is None:
+        return
+    if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+        raise ValueError(f"Identifiant invalide pour {name} : {value}")
+
+
+def _check_date(values: dict, name: str):
+    """Vérifie qu'un champ date a été converti depuis l'ISO 8601."""
+    value = values.get(name)
+    if value is not None and not isinstance(value, datetime):
+        raise ValueError(f"Date invalide pour {name} : {value}")
+
+
+def validate_client(values: dict) -> dict:
+    """
+    Vérifie les champs d'un client (nom, email, téléphone, entreprise).
+    """
+    _check_text(values, "full_name", validate_text, "Nom invalide")
+    _check_text(values, "email", validate_email, "Email invalide")
+    _check_text(
+        values, "phone_number", validate_phone_number,
+        "Numéro de téléphone invalide"
+        )
+    _check_text(
+        values, "company_name", validate_text, "Nom d'entreprise invalide"
+        )
+    _check_id(values, "commercial_contact_id")
+    return values
+
+
+def validate_contract(values: dict) -> dict:
+    """
+    Vérifie les champs d'un contrat et convertit les prix en Decimal.
+    Le prix restant ne peut pas dépasser le prix total.
+    """
+    _check_id(values, "client_id")
+    _check_id(values, "commercial_contact_id")
+    for name in ("total_price", "remaining_price"):
+        if values.get(name) is not None:
+            values[name] = parse_price(values[name], name)
+    if (
+        values.get("total_price") is not None
+        and values.get("remaining_price") is not None
+        and values["remaining_price"] > values["total_price"]
+    ):
+        raise ValueError("Le prix restant dépasse le prix total.")
+
+    statut = values.get("statut")
+    if statut is not None and statut not in STATUTS_CONTRAT:
+        raise ValueError(f"Statut invalide : {statut}")
+    return values
+
+
+def validate_event(values: dict) -> dict:
+    """
+    Vérifie les champs d'un événement : identifiants, noms, dates
+    (la fin après le début), lieu et nombre de participants.
+    """
+    for name in ("contract_id", "client_id", "support_contact_id"):
+        _check_id(values, name)
+    _check_text(values, "client_name", validate_text, "Nom invalide")
+    _check_text(values, "location", validate_text, "Lieu invalide")
+    for name in ("date_start", "date_end"):
+        _check_date(values, name)
+    if (
+        values.get("date_start") is not None
+        and values.get("date_end") is not None
+        and values["date_end"] <= values["date_start"]
+    ):
+        raise ValueError("La date de fin doit être après la date de début.")
+
+    attendees = values.get("attendees")
+    if attendees is not None and (
+        isinstance(attendees, bool) or not isinstance(attendees, int)
+        or attendees < 0
+    ):
+        raise ValueError(f"Nombre de participants invalide : {attendees}")
+    return values
+
+
+def validate_user(values: dict) -> dict:
+    """
+    Vérifie les champs d'un utilisateur (numéro d'employé, nom,
+    email et robustesse du mot de passe).
+    """
+    _check_text(
+        values, "employee_number", validate_employee_number,
+        "Numéro d'employé invalide"
+        )
+    _check_text(values, "complete_name", validate_text, "Nom invalide")
+    _check_text(values, "email", validate_email, "Email invalide")
+    password = values.get("password")
+    if password is not None and (
+        not isinstance(password, str) or not validate_password(password)
+    ):
+        raise ValueError(
+            "Le mot de passe doit contenir au moins 8 caractères, "
+            "une majuscule, une minuscule et un chiffre."
+            )
+    return values
+
+
+def validate_login(values: dict) -> dict:
+    """
+    Vérifie que le numéro d'employé et le mot de passe de la connexion
+    sont des chaînes non vides.
+    """
+    for name in ("employee_number", "password"):
+        value = values.get(name)
+        if not isinstance(value, str) or not value:
+            raise ValueError(f"Champ obligatoire invalide : {name}")
+    return values
@@ -0,0 +1,22 @@
+import argparse
+from aiohttp import web
+from config import API_HOST, API_PORT
+from api.server import create_app
+
+
+def main():
+    """Lance le serveur de l'API HTTP."""
+    parser = argparse.ArgumentParser(
+        description="Lance l'API HTTP JSON d'Epic Events."
+    )
+    parser.add_argument("--host", default=API_HOST,
+                        help="Adresse d'écoute")
+    parser.add_argument("--port", type=int, default=API_PORT,
+                        help="Port d'écoute")
+    args = parser.parse_args()
+
+    web.run_app(create_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
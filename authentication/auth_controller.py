@@ -1,15 +1,84 @@
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from model.user_model import User
+from config import API_PASSWORD_WORKERS
+from model.user_model import User, hash_password
+
+
+# Le hachage bcrypt est exécuté hors du thread de l'interface
+# (un seul utilisateur par processus CLI)
+_password_executor = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="bcrypt"
+    )
+# L'API vérifie les connexions simultanées dans son propre pool
+_api_password_executor = ThreadPoolExecutor(
+    max_workers=API_PASSWORD_WORKERS, thread_name_prefix="bcrypt-api"
+    )
+
+
+def check_password_in_background(
+    user: User, password: str, executor: ThreadPoolExecutor = None
+) -> Future:
+    """
+    Lance la vérification bcrypt du mot de passe dans un thread dédié
+    (par défaut celui du CLI).
+    """
+    executor = executor or _password_executor
+    return executor.submit(user.check_password, password)
 
 
 def authenticate_user(db: Session, employee_number: str, password: str):
     """
     Authentifie un utilisateur en vérifiant
     le numéro d'employé et le mot de passe.
+    Si le mot de passe a été haché avec un autre coût que BCRYPT_ROUNDS,
+    il est haché à nouveau avec le coût configuré.
     """
     user = db.query(User).filter(
         User.employee_number == employee_number
         ).first()
-    if user and user.check_password(password):
-        return user
-    return None
+    if not user:
+        return None
+
+    if not check_password_in_background(user, password).result():
+        return None
+
+    if user.needs_rehash():
+        user.set_password(password)
+        db.commit()
+    return user
+
+
+async def authenticate_user_async(db, employee_number: str, password: str):
+    """
+    Équivalent de authenticate_user pour une AsyncSession : la boucle
+    asyncio n'est pas bloquée pendant la vérification bcrypt, faite dans
+    le pool de l'API (API_PASSWORD_WORKERS threads), ni pendant le
+    nouveau hachage d'un mot de passe au coût dépassé.
+    """
+    user = await db.scalar(
+        select(User).where(User.employee_number == employee_number)
+        )
+    if not user:
+        return None
+
+    if not await asyncio.wrap_future(
+        check_password_in_background(user, password, _api_password_executor)
+    ):
+        return None
+
+    if user.needs_rehash():
+        await set_password_async(user, password)
+        await db.commit()
+    return user
+
+
+async def set_password_async(user: User, password: str):
+    """
+    Équivalent de User.set_password pour la boucle asyncio : le hachage
+    bcrypt est fait dans le pool de l'API.
+    """
+    user.password = await asyncio.wrap_future(
+        _api_password_executor.submit(hash_password, password)
+        )
@@ -1,11 +1,28 @@
+import time
 from typing import Optional
-from datetime import timedelta
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from config import SECRET_KEY_TOKEN, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
+from config import ROLE_CACHE_TTL_SECONDS
 from authentication.auth import logout
 from authentication.auth_controller import authenticate_user
-from model.user_model import User
-from authentication.auth_token import create_jwt_token, save_token
+from model.user_model import User, Department
+from authentication.auth_token import create_session_tokens
+
+
+def authenticate_and_login(
+    db: Session, employee_number: str, password: str
+) -> Optional[tuple]:
+    """
+    Service de connexion : vérifie le mot de passe une seule fois puis
+    crée le jeton d'accès et le jeton de rafraîchissement. Retourne (utilisateur, jeton, département) ou None.
+    """
+    user = authenticate_user(db, employee_number, password)
+    if not user:
+        return None
+
+    department = user.department.name if user.department else None
+    token, _ = create_session_tokens(user.id, department)
+    return user, token, department
 
 
 def login_user(
@@ -14,15 +31,8 @@ def login_user(
     """
     Service pour authentifier et connecter un utilisateur.
     """
-    user = authenticate_user(db, employee_number, password)
-    if user:
-        token = create_jwt_token(
-            user.id, SECRET_KEY_TOKEN, ALGORITHM,
-            timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-            )
-        save_token(token)
-        return token
-    return None
+    session = authenticate_and_login(db, employee_number, password)
+    return session[1] if session else None
 
 
 def logout_user():
@@ -32,19 +42,81 @@ def logout_user():
     logout()
 
 
+# Cache des rôles par ID utilisateur : {user_id: (rôle, date d'expiration)}
+_role_cache = {}
+role_cache_stats = {"hits": 0, "misses": 0}
+
+
 def get_current_user_role(user_id: int, db: Session, token: str) -> str:
     """
     Obtient le rôle de l'utilisateur actuellement
     connecté en utilisant son ID.
+    Le rôle est conservé en cache pendant ROLE_CACHE_TTL_SECONDS.
     """
+    cached = _role_cache.get(user_id)
+    if cached and cached[1] > time.monotonic():
+        role_cache_stats["hits"] += 1
+        return cached[0]
+
+    role_cache_stats["misses"] += 1
     user = db.query(User).filter(User.id == user_id).first()
 
     if user and user.department:
+        _role_cache[user_id] = (
+            user.department.name, time.monotonic() + ROLE_CACHE_TTL_SECONDS
+            )
         return user.department.name
 
+    _role_cache.pop(user_id, None)
+    return None
+
+
+async def get_current_user_role_async(
+    user_id: int, db, token: str
+) -> str:
+    """
+    Équivalent de get_current_user_role pour une AsyncSession.
+    Partage le même cache de rôles.
+    """
+    cached = _role_cache.get(user_id)
+    if cached and cached[1] > time.monotonic():
+        role_cache_stats["hits"] += 1
+        return cached[0]
+
+    role_cache_stats["misses"] += 1
+    role = await db.scalar(
+        select(Department.name)
+        .join(User, User.department_id == Department.id)
+        .where(User.id == user_id)
+        )
+
+    if role:
+        _role_cache[user_id] = (
+            role, time.monotonic() + ROLE_CACHE_TTL_SECONDS
+            )
+        return role
+
+    _role_cache.pop(user_id, None)
     return None
 
 
+def invalidate_role_cache(user_id: int = None):
+    """
+    Supprime le rôle d'un utilisateur du cache, ou vide tout le cache.
+    """
+    if user_id is None:
+        _role_cache.clear()
+    else:
+        _role_cache.pop(user_id, None)
+
+
+def get_role_cache_stats() -> dict:
+    """
+    Retourne le nombre de succès et d'échecs du cache des rôles.
+    """
+    return dict(role_cache_stats, size=len(_role_cache))
+
+
 def get_current_user_department(user_id: int, db: Session) -> str:
     """
     Obtient le département de l'utilisateur
@@ -54,93 +126,83 @@ def get_current_user_department(user_id: int, db: Session) -> str:
     return user.department.name if user else None
 
 
+# Matrice déclarative des actions autorisées par rôle.
+# Les rôles inconnus utilisent les permissions "default".
+ACTIONS = [
+    "get_all_clients", "create_client", "update_client", "delete_client",
+    "get_all_contracts", "create_contract", "update_contract",
+    "delete_contract",
+    "get_all_users", "create_user", "update_user", "delete_user",
+    "get_all_events", "create_event", "update_event", "delete_event",
+]
+
+PERMISSIONS = {
+    "manager": ACTIONS,
+    "gestion": [
+        "get_all_clients",
+        "get_all_contracts", "create_contract", "update_contract",
+        "delete_contract",
+        "get_all_users", "create_user", "update_user", "delete_user",
+        "get_all_events", "update_event", "delete_event",
+    ],
+    "commercial": [
+        "get_all_clients", "create_client", "update_client", "delete_client",
+        "get_all_contracts", "update_contract",
+        "get_all_users",
+        "get_all_events", "create_event",
+    ],
+    "support": [
+        "get_all_clients",
+        "get_all_contracts",
+        "get_all_users",
+        "get_all_events", "update_event",
+    ],
+    "default": [
+        "get_all_clients",
+        "get_all_contracts",
+        "get_all_events",
+    ],
+}
+
+
+def _compile_permissions(permissions: dict) -> tuple:
+    """
+    Compile la matrice en masques de bits : un bit par action
+    et un entier par rôle. Retourne (bits, masques, ensembles).
+    """
+    bits = {action: 1 << index for index, action in enumerate(ACTIONS)}
+    masks = {}
+    allowed_sets = {}
+    for role, actions in permissions.items():
+        mask = 0
+        for action in actions:
+            mask |= bits[action]
+        masks[role] = mask
+        allowed_sets[role] = frozenset(actions)
+    return bits, masks, allowed_sets
+
+
+ACTION_BITS, ROLE_MASKS, _ALLOWED_ACTIONS = _compile_permissions(PERMISSIONS)
+
+
+def allowed(role: str, action: str) -> bool:
+    """
+    Vérifie dans la matrice compilée si le rôle autorise l'action.
+    """
+    mask = ROLE_MASKS.get(role, ROLE_MASKS["default"])
+    return bool(mask & ACTION_BITS.get(action, 0))
+
+
+def allowed_actions(role: str) -> frozenset:
+    """
+    Retourne en un appel l'ensemble des actions autorisées pour un rôle,
+    utilisé pour construire les menus.
+    """
+    return _ALLOWED_ACTIONS.get(role, _ALLOWED_ACTIONS["default"])
+
+
 def can_perform_action(user_department: str, action: str) -> bool:
     """
     Vérifie si le rôle de l'utilisateur autorise l'action demandée.
     """
-
-    permissions = {
-        "manager": {
-            "get_all_clients": True,
-            "create_client": True,
-            "update_client": True,
-            "delete_client": True,
-            "get_all_contracts": True,
-            "create_contract": True,
-            "update_contract": True,
-            "delete_contract": True,
-            "get_all_users": True,
-            "create_user": True,
-            "update_user": True,
-            "delete_user": True,
-            "get_all_events": True,
-            "create_event": True,
-            "update_event": True,
-            "delete_event": True,
-        },
-        "gestion": {
-            "get_all_clients": True,
-            "create_client": False,
-            "update_client": False,
-            "delete_client": False,
-            "get_all_contracts": True,
-            "create_contract": True,
-            "update_contract": True,
-            "delete_contract": True,
-            "get_all_users": True,
-            "create_user": True,
-            "update_user": True,
-            "delete_user": True,
-            "get_all_events": True,
-            "create_event": False,
-            "update_event": True,
-            "delete_event": True,
-        },
-        "commercial": {
-            "get_all_clients": True,
-            "create_client": True,
-            "update_client": True,
-            "delete_client": True,
-            "get_all_contracts": True,
-            "create_contract": False,
-            "update_contract": True,
-            "delete_contract": False,
-            "get_all_users": True,
-            "create_user": False,
-            "update_user": False,
-            "delete_user": False,
-            "get_all_events": True,
-            "create_event": True,
-            "update_event": False,
-            "delete_event": False,
-        },
-        "support": {
-            "get_all_clients": True,
-            "create_client": False,
-            "update_client": False,
-            "delete_client": False,
-            "get_all_contracts": True,
-            "create_contract": False,
-            "update_contract": False,
-            "delete_contract": False,
-            "get_all_users": True,
-            "create_user": False,
-            "update_user": False,
-            "delete_user": False,
-            "get_all_events": True,
-            "create_event": False,
-            "update_event": True,
-            "delete_event": False,
-        },
-        "default": {
-            "get_all_clients": True,
-            "get_all_contracts": True,
-            "get_all_events": True,
-            "get_all_users": False,
-        }
-    }
-
-    result = permissions.get(
-        user_department, permissions["default"]
-        ).get(action, False)
-    return result
+    return allowed(user_department, action)
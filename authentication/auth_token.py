@@ -1,28 +1,142 @@
 import jwt
 import os
-from config import SECRET_KEY_TOKEN, ALGORITHM, TOKEN_FILE
+import time
+import uuid
+from collections import OrderedDict, namedtuple
+from config import (
+    SECRET_KEY_TOKEN,
+    ALGORITHM,
+    ACCESS_TOKEN_EXPIRE_MINUTES,
+    REFRESH_TOKEN_EXPIRE_MINUTES,
+    TOKEN_FILE,
+    REFRESH_TOKEN_FILE,
+    TOKEN_CACHE_SIZE
+    )
 from typing import Optional
 from datetime import datetime, timedelta, timezone
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from model.user_model import User
+from authentication.revocation import (
+    is_token_revoked,
+    is_token_revoked_async,
+    revoke_token,
+    token_digest
+    )
+
+
+# Copie détachée de la session des informations utiles d'un utilisateur
+CachedUser = namedtuple(
+    "CachedUser",
+    ["id", "employee_number", "complete_name", "email", "department_id"]
+    )
+
+# Cache LRU des jetons vérifiés : {empreinte: (date d'expiration, CachedUser)}
+_token_cache = OrderedDict()
+token_cache_stats = {"hits": 0, "misses": 0}
+
+# Jetons d'accès renouvelés : {empreinte de l'ancien jeton: nouveau jeton}
+_renewed_tokens = OrderedDict()
+# Version des droits de chaque utilisateur, incrémentée quand ils changent
+_permission_versions = {}
+
+
+class TokenExpiredError(PermissionError):
+    """Le jeton est valide mais sa date d'expiration est dépassée."""
+
+
+def permission_version(user_id: int) -> int:
+    """
+    Version actuelle des droits d'un utilisateur.
+    """
+    return _permission_versions.get(user_id, 0)
+
+
+def bump_permission_version(user_id: int):
+    """
+    Incrémente la version des droits d'un utilisateur : les jetons émis
+    avant ce changement ne suffisent plus pour autoriser une action.
+    """
+    _permission_versions[user_id] = permission_version(user_id) + 1
 
 
 def create_jwt_token(
-        user_id: int, secret_key: str, algorithm: str, expires_delta: timedelta
+        user_id: int, secret_key: str, algorithm: str,
+        expires_delta: timedelta, token_type: str = "access",
+        role: str = None
         ) -> str:
     """
     Crée un jeton JWT pour l'utilisateur.
+    Si le rôle est donné, il est signé dans le jeton avec
+    la version des droits de l'utilisateur.
     """
     expiration = datetime.now(tz=timezone.utc) + expires_delta
-    to_encode = {"exp": expiration, "sub": user_id}
+    # La norme JWT impose que "sub" soit une chaîne
+    to_encode = {"exp": expiration, "sub": str(user_id), "type": token_type}
+    if role is not None:
+        to_encode["role"] = role
+        to_encode["pv"] = permission_version(user_id)
+    if token_type == "refresh":
+        # Identifiant unique pour refuser la réutilisation après rotation
+        to_encode["jti"] = uuid.uuid4().hex
     encoded_jwt = jwt.encode(to_encode, secret_key, algorithm=algorithm)
     return encoded_jwt
 
 
+def issue_session_tokens(user_id: int, role: str = None) -> tuple:
+    """
+    Crée le couple (jeton d'accès, jeton de rafraîchissement)
+    d'une session sans les enregistrer.
+    """
+    access_token = create_jwt_token(
+        user_id, SECRET_KEY_TOKEN, ALGORITHM,
+        timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES), role=role
+        )
+    refresh_token = create_jwt_token(
+        user_id, SECRET_KEY_TOKEN, ALGORITHM,
+        timedelta(minutes=REFRESH_TOKEN_EXPIRE_MINUTES), token_type="refresh"
+        )
+    return access_token, refresh_token
+
+
+def create_session_tokens(user_id: int, role: str = None) -> tuple:
+    """
+    Crée le couple (jeton d'accès, jeton de rafraîchissement)
+    d'une session et les enregistre.
+    """
+    access_token, refresh_token = issue_session_tokens(user_id, role)
+    save_token(access_token)
+    save_refresh_token(refresh_token)
+    return access_token, refresh_token
+
+
+def _write_file(path: str, token: str):
+    """Écrit un jeton dans un fichier."""
+    with open(path, "w") as file:
+        file.write(token)
+
+
+def _read_file(path: str) -> Optional[str]:
+    """Lit un jeton dans un fichier, ou None si le fichier n'existe pas."""
+    if os.path.exists(path):
+        with open(path, "r") as file:
+            return file.read().strip() or None
+    return None
+
+
 def save_token(token: str):
     """Enregistre le jeton JWT dans un fichier."""
-    with open(TOKEN_FILE, "w") as file:
-        file.write(token)
+    _write_file(TOKEN_FILE, token)
+
+
+def save_refresh_token(token: str):
+    """Enregistre le jeton de rafraîchissement dans un fichier."""
+    _write_file(REFRESH_TOKEN_FILE, token)
+
+
+def load_refresh_token() -> Optional[str]:
+    """Charge le jeton de rafraîchissement à partir d'un fichier."""
+    return _read_file(REFRESH_TOKEN_FILE)
 
 
 def load_token() -> Optional[str]:
@@ -40,40 +154,327 @@ def load_token() -> Optional[str]:
 
 
 def delete_token():
-    """Supprime le fichier contenant le jeton JWT."""
+    """
+    Révoque puis supprime les fichiers contenant le jeton JWT
+    et le jeton de rafraîchissement.
+    """
     if os.path.exists(TOKEN_FILE):
+        token = load_token()
+        if token:
+            revoke_token(token)
+            invalidate_token_cache(token=token)
         os.remove(TOKEN_FILE)
+    if os.path.exists(REFRESH_TOKEN_FILE):
+        refresh_token = load_refresh_token()
+        if refresh_token:
+            revoke_token(refresh_token)
+        os.remove(REFRESH_TOKEN_FILE)
+    _renewed_tokens.clear()
 
 
-def verify_jwt_token(token: str, secret_key: str, algorithm: str):
+def _signed_payload(
+        token: str, secret_key: str, algorithm: str, token_type: str
+        ) -> dict:
     """
-    Vérifie et décode un jeton JWT.
+    Vérifie la signature, l'expiration et le type d'un jeton JWT
+    et retourne ses informations, sans consulter la révocation.
     """
     try:
-        # Décoder le token
         payload = jwt.decode(token, secret_key, algorithms=[algorithm])
-        return payload["sub"]
 
     except jwt.ExpiredSignatureError:
-        raise PermissionError("Le jeton a expiré.")
+        raise TokenExpiredError("Le jeton a expiré.")
     except jwt.InvalidTokenError:
         raise PermissionError("Erreur lors de la vérification du jeton.")
 
+    # Les jetons émis avant l'ajout du type sont des jetons d'accès
+    if payload.get("type", "access") != token_type:
+        raise PermissionError("Type de jeton invalide.")
+    return payload
+
+
+def decode_jwt_token(
+        token: str, secret_key: str, algorithm: str,
+        token_type: str = "access"
+        ) -> dict:
+    """
+    Vérifie un jeton JWT et retourne l'ensemble de ses informations.
+    Un jeton de rafraîchissement n'est pas accepté comme jeton d'accès,
+    ni un jeton présent dans la liste de révocation.
+    """
+    payload = _signed_payload(token, secret_key, algorithm, token_type)
+    if is_token_revoked(token):
+        raise PermissionError("Le jeton a été révoqué.")
+    return payload
+
+
+async def decode_jwt_token_async(
+        token: str, secret_key: str, algorithm: str,
+        token_type: str = "access"
+        ) -> dict:
+    """
+    Équivalent de decode_jwt_token pour la boucle asyncio : la liste de
+    révocation n'est pas lue en base depuis la boucle.
+    """
+    payload = _signed_payload(token, secret_key, algorithm, token_type)
+    if await is_token_revoked_async(token):
+        raise PermissionError("Le jeton a été révoqué.")
+    return payload
+
+
+def verify_jwt_token(token: str, secret_key: str, algorithm: str):
+    """
+    Vérifie et décode un jeton JWT.
+    """
+    payload = decode_jwt_token(token, secret_key, algorithm)
+    return int(payload["sub"]) if payload.get("sub") else None
+
+
+def _token_digest(token: str) -> str:
+    """
+    Empreinte du jeton utilisée comme clé du cache.
+    """
+    return token_digest(token)
+
+
+def _get_cached_user(token: str) -> Optional[CachedUser]:
+    """
+    Retourne l'utilisateur en cache pour ce jeton s'il n'a pas expiré.
+    """
+    digest = _token_digest(token)
+    cached = _token_cache.get(digest)
+    if cached is None:
+        return None
+
+    expiration, user = cached
+    if expiration <= time.time():
+        del _token_cache[digest]
+        raise TokenExpiredError("Le jeton a expiré.")
+
+    _token_cache.move_to_end(digest)
+    return user
+
+
+def _cache_user(token: str, expiration: float, user: CachedUser):
+    """
+    Ajoute un jeton vérifié au cache en retirant le plus ancien si plein.
+    """
+    _token_cache[_token_digest(token)] = (expiration, user)
+    while len(_token_cache) > TOKEN_CACHE_SIZE:
+        _token_cache.popitem(last=False)
+
+
+def invalidate_token_cache(token: str = None, user_id: int = None):
+    """
+    Retire du cache un jeton, tous les jetons d'un utilisateur,
+    ou vide tout le cache si aucun argument n'est donné.
+    """
+    if token is not None:
+        _token_cache.pop(_token_digest(token), None)
+    elif user_id is not None:
+        for digest, (_, user) in list(_token_cache.items()):
+            if user.id == user_id:
+                del _token_cache[digest]
+    else:
+        _token_cache.clear()
+
+
+def _load_role(db: Session, user_id: int) -> Optional[str]:
+    """
+    Lit en base le rôle (nom du département) d'un utilisateur.
+    """
+    user = db.query(User).filter(User.id == user_id).first()
+    return user.department.name if user and user.department else None
+
+
+def rotate_refresh_token(
+        refresh_token: str, db: Session = None, save: bool = True
+        ) -> tuple:
+    """
+    Échange un jeton de rafraîchissement contre un nouveau couple
+    (jeton d'accès, jeton de rafraîchissement).
+    La durée du nouveau jeton de rafraîchissement repart de zéro et l'ancien
+    est révoqué. Seule la signature HMAC est vérifiée ; si une session est
+    donnée, le rôle du nouveau jeton d'accès est relu en base.
+    Avec save=False, les jetons ne sont pas enregistrés dans les fichiers.
+    """
+    payload = decode_jwt_token(
+        refresh_token, SECRET_KEY_TOKEN, ALGORITHM, token_type="refresh"
+        )
+    if not payload.get("jti") or not revoke_token(refresh_token):
+        raise PermissionError("Jeton de rafraîchissement déjà utilisé.")
+
+    user_id = int(payload["sub"])
+    role = _load_role(db, user_id) if db is not None else None
+    if not save:
+        return issue_session_tokens(user_id, role)
+    return create_session_tokens(user_id, role)
+
+
+def get_role_claim(token: str, user_id: int) -> Optional[str]:
+    """
+    Retourne le rôle signé dans le jeton d'accès, sans requête en base.
+    Retourne None si le jeton est invalide, n'appartient pas à l'utilisateur,
+    ne contient pas de rôle ou a été émis avant un changement de ses droits.
+    """
+    try:
+        payload = decode_jwt_token(token, SECRET_KEY_TOKEN, ALGORITHM)
+    except PermissionError:
+        return None
+    return _payload_role(payload, user_id)
+
+
+async def get_role_claim_async(token: str, user_id: int) -> Optional[str]:
+    """
+    Équivalent de get_role_claim pour la boucle asyncio.
+    """
+    try:
+        payload = await decode_jwt_token_async(
+            token, SECRET_KEY_TOKEN, ALGORITHM
+            )
+    except PermissionError:
+        return None
+    return _payload_role(payload, user_id)
+
+
+def _payload_role(payload: dict, user_id: int) -> Optional[str]:
+    """
+    Rôle signé dans le contenu d'un jeton, s'il est encore à jour.
+    """
+    if payload.get("sub") != str(user_id) or "role" not in payload:
+        return None
+    if payload.get("pv") != permission_version(user_id):
+        return None
+    return payload["role"]
+
 
-def get_user_from_token(token: str, db: Session):
+def renew_access_token(token: str, db: Session = None) -> str:
+    """
+    Retourne un jeton d'accès valide pour la session : le jeton lui-même
+    s'il n'a pas expiré, sinon un nouveau jeton obtenu avec le jeton de
+    rafraîchissement. Un jeton déjà renouvelé est remplacé par le plus récent
+    sans nouvelle rotation.
+    """
+    digest = _token_digest(token)
+    current = _renewed_tokens.get(digest, token)
+    try:
+        decode_jwt_token(current, SECRET_KEY_TOKEN, ALGORITHM)
+        return current
+    except TokenExpiredError:
+        pass
+
+    refresh_token = load_refresh_token()
+    if refresh_token is None:
+        raise TokenExpiredError("Le jeton a expiré.")
+    access_token, _ = rotate_refresh_token(refresh_token, db)
+
+    for old in {digest, _token_digest(current)}:
+        _renewed_tokens[old] = access_token
+        _renewed_tokens.move_to_end(old)
+    while len(_renewed_tokens) > TOKEN_CACHE_SIZE:
+        _renewed_tokens.popitem(last=False)
+    return access_token
+
+
+def _user_or_payload(token: str) -> tuple:
+    """
+    Retourne (utilisateur, None) si le jeton est en cache,
+    sinon (None, contenu du jeton décodé).
+    """
+    user = _get_cached_user(token)
+    if user is not None:
+        if is_token_revoked(token):
+            invalidate_token_cache(token=token)
+            raise PermissionError("Le jeton a été révoqué.")
+        token_cache_stats["hits"] += 1
+        return user, None
+    token_cache_stats["misses"] += 1
+    return None, decode_jwt_token(token, SECRET_KEY_TOKEN, ALGORITHM)
+
+
+async def _user_or_payload_async(token: str) -> tuple:
+    """
+    Équivalent de _user_or_payload pour la boucle asyncio.
+    """
+    user = _get_cached_user(token)
+    if user is not None:
+        if await is_token_revoked_async(token):
+            invalidate_token_cache(token=token)
+            raise PermissionError("Le jeton a été révoqué.")
+        token_cache_stats["hits"] += 1
+        return user, None
+    token_cache_stats["misses"] += 1
+    return None, await decode_jwt_token_async(
+        token, SECRET_KEY_TOKEN, ALGORITHM
+        )
+
+
+def _payload_user_id(payload: dict) -> int:
+    """Extrait l'ID utilisateur du contenu d'un jeton."""
+    user_id = payload.get("sub")
+    if not user_id:
+        raise PermissionError("ID utilisateur non trouvé dans le jeton.")
+    return int(user_id)
+
+
+def _cache_db_user(token: str, payload: dict, db_user) -> CachedUser:
+    """Met en cache l'utilisateur chargé depuis la base."""
+    if db_user is None:
+        raise PermissionError("Utilisateur introuvable.")
+
+    user = CachedUser(
+        db_user.id, db_user.employee_number, db_user.complete_name,
+        db_user.email, db_user.department_id
+        )
+    _cache_user(token, payload["exp"], user)
+    return user
+
+
+def get_user_from_token(token: str, db: Session) -> CachedUser:
     """
     Récupère l'utilisateur à partir du jeton JWT.
+    Les jetons déjà vérifiés sont servis depuis le cache jusqu'à leur expiration.
+    Un jeton d'accès expiré est renouvelé sans redemander le mot de passe.
     """
     try:
-        user_id = verify_jwt_token(token, SECRET_KEY_TOKEN, ALGORITHM)
+        try:
+            user, payload = _user_or_payload(token)
+            if user is not None:
+                return user
+        except TokenExpiredError:
+            renewed = renew_access_token(token, db)
+            if renewed == token:
+                raise
+            return get_user_from_token(renewed, db)
+
+        db_user = db.query(User).filter(
+            User.id == _payload_user_id(payload)
+            ).first()
+        return _cache_db_user(token, payload, db_user)
+    except PermissionError as e:
+        raise e
+    except Exception as e:
+        raise PermissionError(
+            f"Erreur lors de la récupération de l'utilisateur: {str(e)}"
+            )
+
 
-        if not user_id:
-            raise PermissionError("ID utilisateur non trouvé dans le jeton.")
+async def get_user_from_token_async(token: str, db) -> CachedUser:
+    """
+    Équivalent de get_user_from_token pour une AsyncSession.
+    Un jeton d'accès expiré n'est pas renouvelé ici (les jetons locaux
+    appartiennent au CLI) : TokenExpiredError est levée et le client
+    utilise son jeton de rafraîchissement (/api/refresh).
+    """
+    try:
+        user, payload = await _user_or_payload_async(token)
+        if user is not None:
+            return user
 
-        user = db.query(User).filter(User.id == user_id).first()
-        if user is None:
-            raise PermissionError("Utilisateur introuvable.")
-        return user
+        db_user = await db.scalar(
+            select(User).where(User.id == _payload_user_id(payload))
+            )
+        return _cache_db_user(token, payload, db_user)
     except PermissionError as e:
         raise e
     except Exception as e:
@@ -1,11 +1,14 @@
+import inspect
 from functools import wraps
-import sentry_sdk
 from jwt import ExpiredSignatureError
 from rich.console import Console
 from authentication.auth_service import (
     get_current_user_role,
+    get_current_user_role_async,
     can_perform_action
     )
+from authentication.auth_token import get_role_claim, get_role_claim_async
+from monitoring import capture_exception, trace_operation
 
 
 console = Console()
@@ -15,11 +18,29 @@ def requires_permission(action):
     """
     Décorateur pour vérifier les permissions de
     l'utilisateur avant d'exécuter une fonction.
+    Le rôle signé dans le jeton suffit ; la base n'est consultée que si le
+    jeton n'en contient pas ou si les droits ont changé depuis son émission.
+    Fonctionne aussi sur les contrôleurs asynchrones (AsyncSession).
     """
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(db, user_id, token, *args, **kwargs):
+                user_role = await get_role_claim_async(token, user_id)
+                if user_role is None:
+                    user_role = await get_current_user_role_async(
+                        user_id, db, token
+                        )
+                if not can_perform_action(user_role, action):
+                    raise PermissionError("Action non autorisée.")
+                return await func(db, user_id, token, *args, **kwargs)
+            return async_wrapper
+
         @wraps(func)
         def wrapper(db, user_id, token, *args, **kwargs):
-            user_role = get_current_user_role(user_id, db, token)
+            user_role = get_role_claim(token, user_id)
+            if user_role is None:
+                user_role = get_current_user_role(user_id, db, token)
             if not can_perform_action(user_role, action):
                 raise PermissionError("Action non autorisée.")
             return func(db, user_id, token, *args, **kwargs)
@@ -27,28 +48,46 @@ def requires_permission(action):
     return decorator
 
 
+def _raise_handled(error: Exception):
+    """
+    Affiche l'erreur et la relance sous une forme cohérente.
+    Doit être appelée depuis un bloc except.
+    """
+    if isinstance(error, PermissionError):
+        console.print(f"[red]Erreur de permission : {str(error)}[/red]")
+        raise PermissionError(str(error))
+    if isinstance(error, ValueError):
+        console.print(f"[yellow]Erreur de validation : {str(error)}[/yellow]")
+        raise ValueError(str(error))
+    if isinstance(error, ExpiredSignatureError):
+        console.print(
+            "[red]Jeton expiré. Veuillez vous reconnecter.[/red]"
+            )
+        raise PermissionError("Jeton expiré. Veuillez vous reconnecter.")
+    console.print(f"[red]Erreur inattendue : {str(error)}[/red]")
+    capture_exception(error)
+    raise Exception(f"Erreur inattendue : {str(error)}")
+
+
 def handle_errors(func):
     """
     Décorateur pour gérer les exceptions courantes
     et fournir des messages d'erreur cohérents.
+    L'appel est tracé dans Sentry (voir monitoring.trace_operation).
     """
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                _raise_handled(e)
+        return trace_operation(async_wrapper)
+
     @wraps(func)
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
-        except PermissionError as pe:
-            console.print(f"[red]Erreur de permission : {str(pe)}[/red]")
-            raise PermissionError(str(pe))
-        except ValueError as ve:
-            console.print(f"[yellow]Erreur de validation : {str(ve)}[/yellow]")
-            raise ValueError(str(ve))
-        except ExpiredSignatureError:
-            console.print(
-                "[red]Jeton expiré. Veuillez vous reconnecter.[/red]"
-                )
-            raise PermissionError("Jeton expiré. Veuillez vous reconnecter.")
         except Exception as e:
-            console.print(f"[red]Erreur inattendue : {str(e)}[/red]")
-            sentry_sdk.capture_exception(e)
-            raise Exception(f"Erreur inattendue : {str(e)}")
-    return wrapper
+            _raise_handled(e)
+    return trace_operation(wrapper)
@@ -0,0 +1,271 @@
+import asyncio
+import math
+import time
+import hashlib
+import jwt
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+from config import (
+    SessionLocal,
+    SECRET_KEY_TOKEN,
+    ALGORITHM,
+    REVOCATION_REFRESH_SECONDS,
+    REVOCATION_REFRESH_MARGIN_SECONDS,
+    REVOCATION_BLOOM_CAPACITY,
+    REVOCATION_BLOOM_ERROR_RATE
+    )
+from model.revoked_token_model import RevokedToken
+from monitoring import capture_exception
+
+
+class BloomFilter:
+    """
+    Filtre de Bloom sur des empreintes SHA-256 : un jeton absent du filtre
+    n'est certainement pas révoqué, un jeton présent l'est probablement.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.size = max(
+            8,
+            math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+            )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, digest: str):
+        # Double hachage à partir de l'empreinte déjà calculée
+        first = int(digest[:16], 16)
+        second = int(digest[16:32], 16) | 1
+        for index in range(self.hash_count):
+            yield (first + index * second) % self.size
+
+    def add(self, digest: str):
+        for position in self._positions(digest):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, digest: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(digest)
+        )
+
+
+_bloom = BloomFilter(REVOCATION_BLOOM_CAPACITY, REVOCATION_BLOOM_ERROR_RATE)
+# Petits ensembles exacts : révocations confirmées et faux positifs du filtre
+_revoked = set()
+_not_revoked = set()
+# Date (UTC) du début de la dernière lecture de la table
+# et date (monotone) de la dernière mise à jour
+_refresh_state = {"read_at": None, "refreshed_at": None}
+revocation_stats = {"fast_path": 0, "confirmed": 0, "false_positives": 0}
+
+
+def token_digest(token: str) -> str:
+    """
+    Empreinte du jeton utilisée comme clé du cache et de la table.
+    """
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def _utcnow() -> datetime:
+    """Date UTC sans fuseau, comme les colonnes DateTime de la table."""
+    return datetime.now(tz=timezone.utc).replace(tzinfo=None)
+
+
+def rebuild_revocation_filter(db: Session):
+    """
+    Supprime les révocations expirées puis reconstruit le filtre
+    à partir de toutes les révocations encore valides.
+    """
+    global _bloom
+    read_at = _utcnow()
+    db.query(RevokedToken).filter(
+        RevokedToken.expires_at <= read_at
+        ).delete(synchronize_session=False)
+    db.commit()
+
+    digests = [digest for digest, in db.query(RevokedToken.token_digest)]
+    bloom = BloomFilter(
+        max(REVOCATION_BLOOM_CAPACITY, 2 * len(digests)),
+        REVOCATION_BLOOM_ERROR_RATE
+        )
+    for digest in digests:
+        bloom.add(digest)
+
+    _bloom = bloom
+    _revoked.clear()
+    _not_revoked.clear()
+    _refresh_state["read_at"] = read_at
+
+
+def refresh_revocation_filter(db: Session):
+    """
+    Ajoute au filtre les révocations enregistrées depuis la dernière lecture.
+    Les id ne sont pas validés dans l'ordre sous MySQL : la lecture reprend
+    à la date de la précédente moins REVOCATION_REFRESH_MARGIN_SECONDS, et
+    les jetons déjà présents dans le filtre n'y sont pas ajoutés à nouveau.
+    Le filtre est reconstruit lorsqu'il dépasse sa capacité.
+    """
+    read_at = _utcnow()
+    since = _refresh_state["read_at"] - timedelta(
+        seconds=REVOCATION_REFRESH_MARGIN_SECONDS
+        )
+    digests = db.query(RevokedToken.token_digest).filter(
+        RevokedToken.revoked_at >= since
+        )
+    for digest, in digests:
+        if digest not in _bloom:
+            _bloom.add(digest)
+        _not_revoked.discard(digest)
+    _refresh_state["read_at"] = read_at
+
+    if _bloom.count > _bloom.capacity:
+        rebuild_revocation_filter(db)
+
+
+def _refresh_due() -> bool:
+    """Indique si le filtre doit être relu depuis la table."""
+    refreshed_at = _refresh_state["refreshed_at"]
+    return refreshed_at is None or (
+        time.monotonic() - refreshed_at >= REVOCATION_REFRESH_SECONDS
+    )
+
+
+def _refresh_if_due():
+    """
+    Met à jour le filtre depuis la table toutes les
+    REVOCATION_REFRESH_SECONDS secondes.
+    """
+    if not _refresh_due():
+        return
+
+    refreshed_at = _refresh_state["refreshed_at"]
+    now = time.monotonic()
+    db = SessionLocal()
+    try:
+        if refreshed_at is None:
+            rebuild_revocation_filter(db)
+        else:
+            refresh_revocation_filter(db)
+    except SQLAlchemyError as e:
+        # Sans lecture initiale de la table, aucun jeton n'est accepté
+        if refreshed_at is None:
+            raise PermissionError(
+                "Impossible de vérifier la révocation du jeton."
+                )
+        capture_exception(e)
+    finally:
+        db.close()
+    _refresh_state["refreshed_at"] = now
+
+
+def is_token_revoked(token: str) -> bool:
+    """
+    Indique si le jeton a été révoqué.
+    Un jeton absent du filtre de Bloom est accepté sans requête ; sinon la
+    table est consultée une seule fois et la réponse est conservée.
+    """
+    _refresh_if_due()
+    digest = token_digest(token)
+    if digest not in _bloom:
+        revocation_stats["fast_path"] += 1
+        return False
+    if digest in _revoked:
+        return True
+    if digest in _not_revoked:
+        return False
+
+    db = SessionLocal()
+    try:
+        revoked = db.query(RevokedToken.id).filter(
+            RevokedToken.token_digest == digest
+            ).first() is not None
+    finally:
+        db.close()
+
+    if revoked:
+        revocation_stats["confirmed"] += 1
+        _revoked.add(digest)
+    else:
+        revocation_stats["false_positives"] += 1
+        _not_revoked.add(digest)
+    return revoked
+
+
+async def is_token_revoked_async(token: str) -> bool:
+    """
+    Équivalent de is_token_revoked pour la boucle asyncio.
+    Le chemin rapide (filtre et ensembles en mémoire) reste dans la boucle ;
+    les lectures de la table, faites avec une session synchrone,
+    passent par un thread.
+    """
+    if not _refresh_due():
+        digest = token_digest(token)
+        if digest not in _bloom:
+            revocation_stats["fast_path"] += 1
+            return False
+        if digest in _revoked:
+            return True
+        if digest in _not_revoked:
+            return False
+    return await asyncio.to_thread(is_token_revoked, token)
+
+
+def revoke_token(token: str) -> bool:
+    """
+    Révoque un jeton jusqu'à sa date d'expiration.
+    Retourne False si le jeton est invalide, expiré ou déjà révoqué.
+    L'écriture utilise sa propre session courte : la transaction
+    de l'appelant n'est ni validée ni annulée.
+    """
+    try:
+        payload = jwt.decode(
+            token, SECRET_KEY_TOKEN, algorithms=[ALGORITHM],
+            options={"verify_exp": False}
+            )
+    except jwt.InvalidTokenError:
+        return False
+
+    expires_at = datetime.fromtimestamp(
+        payload["exp"], tz=timezone.utc
+        ).replace(tzinfo=None)
+    if expires_at <= _utcnow():
+        return False
+
+    digest = token_digest(token)
+    db = SessionLocal()
+    try:
+        db.add(RevokedToken(
+            token_digest=digest,
+            user_id=int(payload["sub"]) if payload.get("sub") else None,
+            expires_at=expires_at,
+            revoked_at=_utcnow()
+        ))
+        db.commit()
+        revoked = True
+    except IntegrityError:
+        db.rollback()
+        revoked = False
+    finally:
+        db.close()
+
+    _bloom.add(digest)
+    _revoked.add(digest)
+    _not_revoked.discard(digest)
+    return revoked
+
+
+def reset_revocation_filter():
+    """
+    Vide le filtre et force sa relecture complète au prochain contrôle.
+    """
+    global _bloom
+    _bloom = BloomFilter(REVOCATION_BLOOM_CAPACITY, REVOCATION_BLOOM_ERROR_RATE)
+    _revoked.clear()
+    _not_revoked.clear()
+    _refresh_state.update(read_at=None, refreshed_at=None)
+    revocation_stats.update(fast_path=0, confirmed=0, false_positives=0)
@@ -0,0 +1,119 @@
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import aiohttp
+from config import API_HOST, API_PORT
+
+
+DEFAULT_TARGET_P99_MS = float(os.getenv("API_TARGET_P99_MS", "200"))
+
+
+def percentile(values: list, fraction: float) -> float:
+    """
+    Retourne le percentile `fraction` (entre 0 et 1) d'une liste de durées.
+    """
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def login(session, base_url: str, employee_number: str,
+                password: str) -> str:
+    """Se connecte à l'API et retourne le jeton d'accès."""
+    async with session.post(f"{base_url}/api/login", json={
+        "employee_number": employee_number, "password": password
+    }) as response:
+        if response.status != 200:
+            raise SystemExit(f"Connexion refusée : {await response.text()}")
+        return (await response.json())["access_token"]
+
+
+async def run_load(base_url: str, path: str, token: str, requests: int,
+                   concurrency: int) -> dict:
+    """
+    Envoie `requests` requêtes GET avec `concurrency` clients simultanés
+    et mesure la durée de chacune.
+    """
+    latencies = []
+    errors = 0
+    remaining = iter(range(requests))
+    headers = {"Authorization": f"Bearer {token}"}
+    connector = aiohttp.TCPConnector(limit=concurrency)
+
+    async with aiohttp.ClientSession(
+        headers=headers, connector=connector
+    ) as session:
+        async def worker():
+            nonlocal errors
+            for _ in remaining:
+                start = time.perf_counter()
+                async with session.get(f"{base_url}{path}") as response:
+                    await response.read()
+                    if response.status != 200:
+                        errors += 1
+                latencies.append(time.perf_counter() - start)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed,
+        "p50": statistics.median(latencies),
+        "p99": percentile(latencies, 0.99),
+    }
+
+
+async def benchmark(args) -> dict:
+    """Se connecte puis lance la charge sur l'API."""
+    async with aiohttp.ClientSession() as session:
+        token = await login(
+            session, args.url, args.employee_number, args.password
+            )
+    return await run_load(
+        args.url, args.path, token, args.requests, args.concurrency
+        )
+
+
+def main():
+    """Mesure le débit et la latence de l'API et les compare à l'objectif."""
+    parser = argparse.ArgumentParser(
+        description="Test de charge de l'API HTTP (api_server.py)."
+    )
+    parser.add_argument("--url", default=f"http://{API_HOST}:{API_PORT}",
+                        help="Adresse du serveur")
+    parser.add_argument("--path", default="/api/clients?limit=50",
+                        help="Route appelée")
+    parser.add_argument("--employee-number", required=True,
+                        help="Numéro d'employé utilisé pour la connexion")
+    parser.add_argument("--password", required=True,
+                        help="Mot de passe de cet employé")
+    parser.add_argument("--requests", type=int, default=2000,
+                        help="Nombre total de requêtes")
+    parser.add_argument("--concurrency", type=int, default=20,
+                        help="Nombre de clients simultanés")
+    parser.add_argument("--target-p99", type=float,
+                        default=DEFAULT_TARGET_P99_MS,
+                        help="Latence p99 maximale (millisecondes)")
+    args = parser.parse_args()
+
+    results = asyncio.run(benchmark(args))
+    print(f"Requêtes       : {results['requests']} "
+          f"({results['errors']} en erreur)")
+    print(f"Débit          : {results['rps']:.0f} requêtes/s")
+    print(f"Latence p50    : {results['p50'] * 1000:.1f} ms")
+    print(f"Latence p99    : {results['p99'] * 1000:.1f} ms")
+
+    if results["errors"] or results["p99"] * 1000 > args.target_p99:
+        print(f"Objectif de {args.target_p99} ms (p99) non respecté.")
+        sys.exit(1)
+    print(f"Objectif de {args.target_p99} ms (p99) respecté.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+# Exécuté dans un nouvel interpréteur : importe main puis s'arrête
+# au premier affichage du menu principal.
+PROBE = """
+import sys
+import time
+start = time.perf_counter()
+import main
+imported = time.perf_counter()
+
+
+class FirstPrompt(Exception):
+    pass
+
+
+def select(**kwargs):
+    print(time.time(), imported - start, time.perf_counter() - start)
+    raise FirstPrompt
+
+
+main.inquirer.select = select
+try:
+    main.main_menu()
+except FirstPrompt:
+    pass
+"""
+
+DEFAULT_TARGET_SECONDS = float(os.getenv("STARTUP_TARGET_SECONDS", "0.5"))
+
+
+def measure_startup() -> dict:
+    """
+    Lance main.py dans un nouveau processus et mesure, en secondes :
+    l'import de main, le temps jusqu'au premier menu depuis le début de
+    l'import, et le temps total depuis le lancement du processus.
+    """
+    launched = time.time()
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__))
+    ).stdout.split()
+    prompt_at, import_time, first_prompt = (float(value) for value in output)
+    return {
+        "import": import_time,
+        "first_prompt": first_prompt,
+        "process": prompt_at - launched,
+    }
+
+
+def run_benchmark(runs: int) -> dict:
+    """
+    Répète la mesure et retourne la médiane de chaque temps.
+    """
+    results = [measure_startup() for _ in range(runs)]
+    return {
+        name: statistics.median(result[name] for result in results)
+        for name in results[0]
+    }
+
+
+def main():
+    """Mesure le temps de démarrage du programme et le compare à l'objectif."""
+    parser = argparse.ArgumentParser(
+        description="Mesure le temps de démarrage de main.py."
+    )
+    parser.add_argument("--runs", type=int, default=5,
+                        help="Nombre de lancements mesurés")
+    parser.add_argument("--target", type=float,
+                        default=DEFAULT_TARGET_SECONDS,
+                        help="Temps maximal entre le lancement du processus "
+                             "et le premier menu (secondes)")
+    args = parser.parse_args()
+
+    medians = run_benchmark(args.runs)
+    print(f"Import de main.py         : {medians['import'] * 1000:.0f} ms")
+    print(
+        f"Import → premier menu     : {medians['first_prompt'] * 1000:.0f} ms"
+        )
+    print(f"Lancement → premier menu  : {medians['process'] * 1000:.0f} ms")
+
+    # L'objectif porte sur le délai vu par l'utilisateur, démarrage
+    # de l'interpréteur compris
+    if medians["process"] > args.target:
+        print(f"Objectif de {args.target} s dépassé.")
+        sys.exit(1)
+    print(f"Objectif de {args.target} s respecté.")
+
+
+if __name__ == "__main__":
+    main()
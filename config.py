@@ -1,7 +1,14 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
+import contextvars
+import inspect
+import itertools
 import os
+import time
+from functools import wraps
 from dotenv import load_dotenv
 
 
@@ -11,17 +18,399 @@ load_dotenv()
 # Configuration de la base de données
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-# Création de l'instance
-engine = create_engine(DATABASE_URL)
+# Configuration du pool de connexions
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "5"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+DB_CONNECT_TIMEOUT = int(os.getenv("DB_CONNECT_TIMEOUT", "10"))
+
+# Réplicas en lecture seule (URLs séparées par des virgules) et choix du
+# réplica : "round_robin" ou "least_loaded" (le moins de connexions prêtées)
+DATABASE_REPLICA_URLS = [
+    url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",")
+    if url.strip()
+    ]
+DB_REPLICA_SELECTION = os.getenv("DB_REPLICA_SELECTION", "round_robin")
+# Après une écriture, la session relit le primaire pendant cette durée
+DB_REPLICA_STICKY_SECONDS = float(os.getenv("DB_REPLICA_STICKY_SECONDS", "5"))
+
+
+def engine_options(database_url: str) -> dict:
+    """
+    Options de create_engine pour le pool de connexions.
+    Une base SQLite en mémoire n'a qu'une connexion : pas de taille de pool.
+    """
+    url = make_url(database_url)
+    options = {"pool_pre_ping": DB_POOL_PRE_PING}
+
+    if url.get_backend_name() == "sqlite":
+        if url.database in (None, "", ":memory:"):
+            return options
+        options["connect_args"] = {"timeout": DB_CONNECT_TIMEOUT}
+    else:
+        options["connect_args"] = {"connect_timeout": DB_CONNECT_TIMEOUT}
+
+    options.update(
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+    )
+    return options
+
+
+# Le moteur (et le pilote de la base) n'est créé qu'à la première requête
+_engine = None
+
+# Compteurs d'activité du pool : connexions ouvertes, prêtées et rendues
+pool_stats = {"connects": 0, "checkouts": 0, "checkins": 0}
+
+
+def _count_pool_event(name):
+    """Crée un écouteur qui incrémente le compteur donné."""
+    def listener(*args):
+        pool_stats[name] += 1
+    return listener
+
+
+def get_engine():
+    """
+    Retourne le moteur de la base de données en le créant au premier appel.
+    """
+    global _engine
+    if _engine is None:
+        _engine = create_engine(DATABASE_URL, **engine_options(DATABASE_URL))
+        event.listen(_engine, "connect", _count_pool_event("connects"))
+        event.listen(_engine, "checkout", _count_pool_event("checkouts"))
+        event.listen(_engine, "checkin", _count_pool_event("checkins"))
+    return _engine
+
+
+def __getattr__(name):
+    """Permet de continuer à importer config.engine."""
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module 'config' has no attribute '{name}'")
+
+
+def get_pool_stats() -> dict:
+    """
+    Retourne l'état du pool de connexions et ses compteurs d'activité.
+    """
+    pool = get_engine().pool
+    stats = dict(pool_stats, status=pool.status())
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    return stats
+
+
+# Moteurs des réplicas, créés au premier appel de get_replica_engines
+_replica_engines = None
+_replica_cursor = itertools.count()
+# Connexions actuellement prêtées par réplica
+replica_load = {}
+# Lectures en lecture seule envoyées au primaire ou à un réplica
+routing_stats = {"primary": 0, "replica": 0}
+# Vrai pendant l'exécution d'une fonction décorée par read_only
+_read_only = contextvars.ContextVar("read_only", default=False)
+
+
+def _count_replica_load(replica, delta: int):
+    """Crée un écouteur qui met à jour la charge d'un réplica."""
+    def listener(*args):
+        replica_load[replica] += delta
+    return listener
+
+
+def get_replica_engines() -> list:
+    """
+    Retourne les moteurs des réplicas (DATABASE_REPLICA_URLS),
+    en les créant au premier appel.
+    """
+    global _replica_engines
+    if _replica_engines is None:
+        engines = []
+        for url in DATABASE_REPLICA_URLS:
+            replica = create_engine(url, **engine_options(url))
+            replica_load[replica] = 0
+            event.listen(replica, "checkout", _count_replica_load(replica, 1))
+            event.listen(replica, "checkin", _count_replica_load(replica, -1))
+            engines.append(replica)
+        _replica_engines = engines
+    return _replica_engines
+
+
+def choose_replica(engines: list):
+    """
+    Choisit le réplica d'une lecture selon DB_REPLICA_SELECTION.
+    En cas d'égalité de charge, le tourniquet départage les réplicas.
+    """
+    start = next(_replica_cursor) % len(engines)
+    if DB_REPLICA_SELECTION == "least_loaded":
+        ordered = engines[start:] + engines[:start]
+        return min(ordered, key=lambda replica: replica_load.get(replica, 0))
+    return engines[start]
+
+
+def read_only(func):
+    """
+    Décorateur des fonctions qui ne font que lire : leurs requêtes peuvent
+    être envoyées à un réplica (voir LazySession.get_bind).
+    """
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            token = _read_only.set(True)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _read_only.reset(token)
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        token = _read_only.set(True)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _read_only.reset(token)
+    return wrapper
+
+
+# Pilotes asynchrones correspondant aux pilotes synchrones
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def async_database_url(database_url: str):
+    """
+    Convertit l'URL de la base pour un pilote asynchrone
+    (mysql+pymysql -> mysql+aiomysql, sqlite -> sqlite+aiosqlite).
+    """
+    if not database_url:
+        return None
+    url = make_url(database_url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        return database_url
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+ASYNC_DATABASE_URL = (
+    os.getenv("ASYNC_DATABASE_URL") or async_database_url(DATABASE_URL)
+    )
+_async_engine = None
+
+
+def get_async_engine():
+    """
+    Retourne le moteur asynchrone en le créant au premier appel.
+    """
+    global _async_engine
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        _async_engine = create_async_engine(
+            ASYNC_DATABASE_URL, **engine_options(ASYNC_DATABASE_URL)
+            )
+    return _async_engine
+
+
+async def dispose_async_engine():
+    """
+    Ferme les connexions du moteur asynchrone s'il a été créé.
+    """
+    global _async_engine
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+
+
+def async_session():
+    """
+    Crée une session asynchrone (AsyncSession) avec la même configuration
+    que SessionLocal, à utiliser avec `async with`.
+    """
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    return AsyncSession(
+        bind=get_async_engine(), autoflush=False, expire_on_commit=False
+        )
+
 
 # Créer une classe de base pour les modèles
 Base = declarative_base()
 
-# Créer une session pour interagir avec la base de données
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+class LazySession(Session):
+    """
+    Session liée au moteur au moment de sa première requête.
+    Sans moteur imposé, les lectures des fonctions read_only vont à un
+    réplica, sauf si la session vient d'écrire (lecture de ses écritures).
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.bind is not None:
+            return super().get_bind(mapper, clause=clause, **kwargs)
+        return self._replica_bind() or get_engine()
+
+    def _replica_bind(self):
+        """
+        Retourne le réplica à utiliser, ou None pour lire le primaire.
+        """
+        if not _read_only.get() or not DATABASE_REPLICA_URLS:
+            return None
+        if (
+            self._flushing or self.info.get("wrote")
+            or self.new or self.dirty or self.deleted
+            or self.info.get("sticky_until", 0) > time.monotonic()
+        ):
+            routing_stats["primary"] += 1
+            return None
+        routing_stats["replica"] += 1
+        return choose_replica(get_replica_engines())
+
+
+@event.listens_for(LazySession, "after_flush")
+def _mark_flush(session, flush_context):
+    """Note que la transaction en cours a écrit sur le primaire."""
+    session.info["wrote"] = True
+
+
+@event.listens_for(LazySession, "do_orm_execute")
+def _mark_bulk_write(orm_execute_state):
+    """Les UPDATE et DELETE groupés ne passent pas par un flush."""
+    if orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["wrote"] = True
+
+
+@event.listens_for(LazySession, "after_commit")
+def _stick_to_primary(session):
+    """Après une écriture validée, relit le primaire un moment."""
+    if session.info.pop("wrote", False):
+        session.info["sticky_until"] = (
+            time.monotonic() + DB_REPLICA_STICKY_SECONDS
+            )
+
+
+@event.listens_for(LazySession, "after_transaction_end")
+def _forget_writes(session, transaction):
+    """Oublie les écritures d'une transaction terminée."""
+    if transaction.parent is None:
+        session.info.pop("wrote", None)
+
+
+# Créer une session pour interagir avec la base de données.
+# Les objets ne sont pas expirés au commit : l'objet en mémoire reste la
+# référence et aucun SELECT n'est relancé après une écriture.
+SessionLocal = sessionmaker(
+    class_=LazySession,
+    autocommit=False, autoflush=False, expire_on_commit=False
+    )
+
+# Une seule session par processus CLI (par thread) : le menu principal et
+# les sous-menus la partagent au lieu d'ouvrir chacun une connexion.
+db_session = scoped_session(SessionLocal)
+
+
+def get_session():
+    """Retourne la session partagée du processus."""
+    return db_session()
+
+
+def release_session():
+    """
+    Termine la transaction en cours et rend la connexion au pool.
+    La session reste utilisable pour l'action suivante.
+    """
+    db_session.close()
+
+
+def remove_session():
+    """Ferme et oublie la session partagée en fin de programme."""
+    db_session.remove()
+
+
+# Configuration de l'API HTTP (api_server.py)
+API_HOST = os.getenv("API_HOST", "127.0.0.1")
+API_PORT = int(os.getenv("API_PORT", "8000"))
+API_MAX_PAGE_SIZE = int(os.getenv("API_MAX_PAGE_SIZE", "200"))
+# Threads de vérification bcrypt de l'API (connexions simultanées)
+API_PASSWORD_WORKERS = int(
+    os.getenv("API_PASSWORD_WORKERS", str(os.cpu_count() or 4))
+    )
+
+
+# Configuration de Sentry (désactivé si SENTRY_DSN est vide).
+# Les opérations lentes ou en erreur sont toujours conservées, les autres
+# selon SENTRY_TRACES_SAMPLE_RATE.
+SENTRY_DSN = os.getenv("SENTRY_DSN", "")
+SENTRY_ENVIRONMENT = os.getenv("SENTRY_ENVIRONMENT", "production")
+SENTRY_TRACES_SAMPLE_RATE = float(os.getenv("SENTRY_TRACES_SAMPLE_RATE", "0.1"))
+SENTRY_PROFILES_SAMPLE_RATE = float(
+    os.getenv("SENTRY_PROFILES_SAMPLE_RATE", "0.0")
+    )
+SENTRY_SLOW_OPERATION_MS = int(os.getenv("SENTRY_SLOW_OPERATION_MS", "500"))
+# Taille de la file d'envoi et délai maximal pour la vider en fin de programme
+SENTRY_QUEUE_SIZE = int(os.getenv("SENTRY_QUEUE_SIZE", "100"))
+SENTRY_SHUTDOWN_TIMEOUT = float(os.getenv("SENTRY_SHUTDOWN_TIMEOUT", "2"))
+
+# Facteur de coût bcrypt pour le hachage des mots de passe
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
 
 # Configuration pour JWT
 SECRET_KEY_TOKEN = os.getenv("SECRET_KEY_TOKEN")
 ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 30
+ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "15"))
 TOKEN_FILE = "authentication/token.txt"
+
+# Jeton de rafraîchissement : sa durée repart à chaque renouvellement
+REFRESH_TOKEN_EXPIRE_MINUTES = int(
+    os.getenv("REFRESH_TOKEN_EXPIRE_MINUTES", "480")
+    )
+REFRESH_TOKEN_FILE = "authentication/refresh_token.txt"
+
+# Liste de révocation : intervalle de mise à jour du filtre de Bloom
+# depuis la table, capacité prévue et taux de faux positifs du filtre
+REVOCATION_REFRESH_SECONDS = int(os.getenv("REVOCATION_REFRESH_SECONDS", "30"))
+REVOCATION_BLOOM_CAPACITY = int(os.getenv("REVOCATION_BLOOM_CAPACITY", "10000"))
+REVOCATION_BLOOM_ERROR_RATE = float(
+    os.getenv("REVOCATION_BLOOM_ERROR_RATE", "0.001")
+    )
+# Chaque mise à jour relit les révocations datées d'après la précédente
+# moins cette marge (transactions validées en retard, horloges décalées)
+REVOCATION_REFRESH_MARGIN_SECONDS = int(
+    os.getenv("REVOCATION_REFRESH_MARGIN_SECONDS", "60")
+    )
+
+# Nombre maximal de jetons vérifiés conservés en cache
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "128"))
+
+# Durée de conservation en cache du rôle d'un utilisateur
+ROLE_CACHE_TTL_SECONDS = int(os.getenv("ROLE_CACHE_TTL_SECONDS", "300"))
+
+# Durée de conservation en cache des listes de référence
+# (utilisateurs par rôle, départements par nom)
+REFERENCE_CACHE_TTL_SECONDS = int(
+    os.getenv("REFERENCE_CACHE_TTL_SECONDS", "300")
+    )
+
+# Nombre de lignes affichées par page dans les tableaux du CLI
+DISPLAY_PAGE_SIZE = int(os.getenv("DISPLAY_PAGE_SIZE", "20"))
+
+# Nombre maximal de résultats proposés par les listes de sélection
+# avec recherche (au-delà, l'utilisateur affine sa saisie)
+SEARCH_RESULT_LIMIT = int(os.getenv("SEARCH_RESULT_LIMIT", "15"))
+
+# Délai sans frappe avant de lancer la recherche des propositions
+SEARCH_DEBOUNCE_SECONDS = float(os.getenv("SEARCH_DEBOUNCE_SECONDS", "0.25"))
@@ -0,0 +1,55 @@
+from sqlalchemy import delete, select, update
+from controller.search_index import (
+    index_documents,
+    remove_documents,
+    touches_index
+    )
+
+
+async def _affected_ids(db, model, filters: list) -> list:
+    """Id des lignes correspondant aux filtres."""
+    result = await db.execute(select(model.id).where(*filters))
+    return list(result.scalars())
+
+
+async def bulk_update(db, model, filters: list, values: dict,
+                      search_entity: str = None) -> int:
+    """
+    Équivalent asynchrone de bulk.bulk_update : une seule requête
+    UPDATE ... WHERE. Retourne le nombre de lignes modifiées.
+    """
+    if not filters:
+        raise ValueError("Un filtre est obligatoire pour une mise à jour groupée.")
+    if not values:
+        raise ValueError("Aucune valeur à mettre à jour.")
+
+    reindex = search_entity is not None and touches_index(search_entity, values)
+    ids = await _affected_ids(db, model, filters) if reindex else []
+    result = await db.execute(
+        update(model).where(*filters).values(values)
+        .execution_options(synchronize_session=False)
+        )
+    if reindex:
+        await db.run_sync(index_documents, search_entity, ids)
+    await db.commit()
+    return result.rowcount
+
+
+async def bulk_delete(db, model, filters: list,
+                      search_entity: str = None) -> int:
+    """
+    Équivalent asynchrone de bulk.bulk_delete : une seule requête
+    DELETE ... WHERE. Retourne le nombre de lignes supprimées.
+    """
+    if not filters:
+        raise ValueError("Un filtre est obligatoire pour une suppression groupée.")
+
+    if search_entity is not None:
+        ids = await _affected_ids(db, model, filters)
+        await db.run_sync(remove_documents, search_entity, ids)
+    result = await db.execute(
+        delete(model).where(*filters)
+        .execution_options(synchronize_session=False)
+        )
+    await db.commit()
+    return result.rowcount
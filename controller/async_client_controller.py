@@ -0,0 +1,195 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from model.client_model import Client
+from model.user_model import User
+from datetime import datetime
+from authentication.auth_utils import handle_errors, requires_permission
+from controller.round_trips import track_round_trips
+from authentication.auth_token import get_user_from_token_async
+from controller.async_pagination import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_PAGE_SIZE,
+    iter_pages,
+    keyset_page,
+    stream
+    )
+from controller.loading import apply_loading_profile
+from controller.async_bulk import bulk_update
+from controller.search_index import (
+    index_documents,
+    remove_documents,
+    touches_index
+    )
+from controller.client_controller import (
+    CLIENT_KEYSET,
+    CLIENT_LOADING_PROFILES
+    )
+
+
+# Version asynchrone de client_controller : mêmes fonctions et signatures,
+# avec une AsyncSession. Les relations ne peuvent pas être chargées à la
+# demande : utiliser load="display" pour les afficher.
+
+
+def _clients_query(load: str = None):
+    """
+    Construit la requête de base des clients avec le profil de chargement.
+    """
+    return apply_loading_profile(
+        select(Client), CLIENT_LOADING_PROFILES, load
+        )
+
+
+@handle_errors
+async def get_all_clients(db: AsyncSession, token: str, load: str = None):
+    """
+    Fonction pour récupérer tous les clients de la base de données.
+    """
+    clients = await stream_clients(db, token, load=load)
+    return [client async for client in clients]
+
+
+@handle_errors
+async def get_clients_page(
+    db: AsyncSession, token: str, limit: int = DEFAULT_PAGE_SIZE,
+    after: tuple = None, load: str = None
+):
+    """
+    Récupère une page de clients après le curseur `after` (id).
+    """
+    await get_user_from_token_async(token, db)
+    return await keyset_page(
+        db, _clients_query(load), CLIENT_KEYSET, after, limit
+        )
+
+
+async def iter_client_pages(
+    db: AsyncSession, token: str, page_size: int = DEFAULT_PAGE_SIZE,
+    load: str = None
+):
+    """
+    Générateur asynchrone qui retourne les clients page par page.
+    """
+    await get_user_from_token_async(token, db)
+    async for page in iter_pages(
+        db, _clients_query(load), CLIENT_KEYSET, page_size
+    ):
+        yield page
+
+
+async def stream_clients(
+    db: AsyncSession, token: str, batch_size: int = DEFAULT_BATCH_SIZE,
+    load: str = None
+):
+    """
+    Parcourt les clients un par un (async for), chargés par lots.
+    """
+    await get_user_from_token_async(token, db)
+    return await stream(db, _clients_query(load), CLIENT_KEYSET, batch_size)
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("create_client")
+async def create_client(
+    db: AsyncSession, user_id: int, token: str, full_name: str, email: str,
+    phone_number: str = None, company_name: str = None,
+    commercial_contact_id: int = None
+):
+    """
+    Fonction pour créer un nouveau client.
+    """
+    commercial_contact = await db.get(
+        User, commercial_contact_id
+        ) if commercial_contact_id else None
+
+    if commercial_contact_id and not commercial_contact:
+        raise ValueError(
+            f"Aucun commercial trouvé avec l'ID {commercial_contact_id}."
+            )
+
+    new_client = Client(
+        full_name=full_name,
+        email=email,
+        phone_number=phone_number,
+        company_name=company_name,
+        creation_date=datetime.now(),
+        last_update=datetime.now(),
+        commercial_contact_id=commercial_contact_id
+    )
+
+    db.add(new_client)
+    await db.flush()
+    await db.run_sync(
+        index_documents, "client", [new_client.id], new=True
+        )
+    await db.commit()
+    return new_client
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("update_client")
+async def update_client(
+    db: AsyncSession, user_id: int, token: str, client_id: int, **kwargs
+):
+    """
+    Fonction pour mettre à jour un client existant.
+    """
+    client = await db.get(Client, client_id)
+    if not client:
+        return None
+
+    for key, value in kwargs.items():
+        setattr(client, key, value)
+
+    if touches_index("client", kwargs):
+        await db.flush()
+        await db.run_sync(index_documents, "client", [client.id])
+    await db.commit()
+    return client
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("delete_client")
+async def delete_client(
+    db: AsyncSession, user_id: int, token: str, client_id: int
+):
+    """
+    Fonction pour supprimer un client.
+    """
+    client = await db.get(Client, client_id)
+    if not client:
+        return None
+
+    await db.run_sync(remove_documents, "client", [client.id])
+    await db.delete(client)
+    await db.commit()
+    return client
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("update_client")
+async def reassign_commercial_contact(
+    db: AsyncSession, user_id: int, token: str, client_ids: list,
+    commercial_contact_id: int
+) -> int:
+    """
+    Attribue un commercial à une liste de clients en une requête.
+    """
+    return await bulk_update(
+        db, Client, [Client.id.in_(client_ids)],
+        {
+            "commercial_contact_id": commercial_contact_id,
+            "last_update": datetime.now(),
+        }
+        )
+
+
+async def get_client_by_id(db: AsyncSession, client_id: int):
+    """
+    Récupère un client spécifique par son ID.
+    """
+    return await db.get(Client, client_id)
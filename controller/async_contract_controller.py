@@ -0,0 +1,216 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from model.contract_model import Contract, STATUTS_CONTRAT
+from datetime import datetime
+from authentication.auth_utils import handle_errors, requires_permission
+from controller.round_trips import track_round_trips
+from controller.async_pagination import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_PAGE_SIZE,
+    iter_pages,
+    keyset_page,
+    stream
+    )
+from controller.loading import apply_loading_profile
+from controller.async_bulk import bulk_delete, bulk_update
+from controller.search_index import index_documents, remove_documents
+from controller.contract_controller import (
+    CONTRACT_KEYSET,
+    CONTRACT_LOADING_PROFILES,
+    _check_remaining_price
+    )
+
+
+# Version asynchrone de contract_controller : les filtres sont construits
+# avec contract_controller.contract_filters, comme pour la version synchrone.
+
+
+def _contracts_query(load: str = None, filters: list = None):
+    """
+    Construit la requête de base des contrats avec le profil
+    de chargement et les filtres éventuels.
+    """
+    stmt = apply_loading_profile(
+        select(Contract), CONTRACT_LOADING_PROFILES, load
+        )
+    if filters:
+        stmt = stmt.where(*filters)
+    return stmt
+
+
+@handle_errors
+async def get_all_contracts(
+    db: AsyncSession, token: str, load: str = None, filters: list = None
+):
+    """
+    Fonction pour récupéré et afficher tous
+    les contrats de la base de données
+    """
+    contracts = await stream_contracts(db, token, load=load, filters=filters)
+    return [contract async for contract in contracts]
+
+
+@handle_errors
+async def get_contracts_page(
+    db: AsyncSession, token: str, limit: int = DEFAULT_PAGE_SIZE,
+    after: tuple = None, load: str = None, filters: list = None
+):
+    """
+    Récupère une page de contrats après le curseur `after` (id).
+    """
+    return await keyset_page(
+        db, _contracts_query(load, filters), CONTRACT_KEYSET, after, limit
+        )
+
+
+async def iter_contract_pages(
+    db: AsyncSession, token: str, page_size: int = DEFAULT_PAGE_SIZE,
+    load: str = None, filters: list = None
+):
+    """
+    Générateur asynchrone qui retourne les contrats page par page.
+    """
+    async for page in iter_pages(
+        db, _contracts_query(load, filters), CONTRACT_KEYSET, page_size
+    ):
+        yield page
+
+
+async def stream_contracts(
+    db: AsyncSession, token: str, batch_size: int = DEFAULT_BATCH_SIZE,
+    load: str = None, filters: list = None
+):
+    """
+    Parcourt les contrats un par un (async for), chargés par lots.
+    """
+    return await stream(
+        db, _contracts_query(load, filters), CONTRACT_KEYSET, batch_size
+        )
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("create_contract")
+async def create_contract(
+    db: AsyncSession, user_id: int, token: str, client_id: int,
+    commercial_contact_id: int, total_price: float,
+    remaining_price: float, statut: str
+):
+    """
+    Fonction pour créer un nouveau contrat dans la base de données
+    """
+    new_contract = Contract(
+        client_id=client_id,
+        commercial_contact_id=commercial_contact_id,
+        total_price=total_price,
+        remaining_price=remaining_price,
+        creation_date=datetime.now(),
+        statut=statut
+    )
+
+    db.add(new_contract)
+    await db.flush()
+    await db.run_sync(
+        index_documents, "contract", [new_contract.id], new=True
+        )
+    await db.commit()
+    return new_contract
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("update_contract")
+async def update_contract(
+    db: AsyncSession, user_id: int, token: str, contract_id: int, **kwargs
+):
+    """
+    Met à jour un contrat existant avec les informations fournies.
+    """
+    contract = await db.get(Contract, contract_id)
+    if not contract:
+        return None
+
+    _check_remaining_price(contract, kwargs)
+    for key, value in kwargs.items():
+        setattr(contract, key, value)
+
+    contract.last_update = datetime.now()
+    await db.commit()
+    return contract
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("delete_contract")
+async def delete_contract(
+    db: AsyncSession, user_id: int, token: str, contract_id: int
+):
+    """
+    Supprime un contrat de la base de données.
+    """
+    contract = await db.get(Contract, contract_id)
+    if not contract:
+        return None
+
+    await db.run_sync(remove_documents, "contract", [contract.id])
+    await db.delete(contract)
+    await db.commit()
+    return contract
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("update_contract")
+async def update_contracts(
+    db: AsyncSession, user_id: int, token: str, filters: list, **kwargs
+) -> int:
+    """
+    Met à jour en une requête tous les contrats correspondant
+    aux filtres (voir contract_filters). Retourne le nombre modifié.
+    """
+    return await bulk_update(db, Contract, filters, kwargs)
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("update_contract")
+async def update_contracts_status(
+    db: AsyncSession, user_id: int, token: str, filters: list, statut: str
+) -> int:
+    """
+    Change le statut de tous les contrats correspondant aux filtres.
+    """
+    if statut not in STATUTS_CONTRAT:
+        raise ValueError(f"Statut invalide : {statut}")
+    return await bulk_update(db, Contract, filters, {"statut": statut})
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("delete_contract")
+async def delete_contracts(
+    db: AsyncSession, user_id: int, token: str, filters: list
+) -> int:
+    """
+    Supprime en une requête tous les contrats correspondant aux filtres.
+    """
+    return await bulk_delete(
+        db, Contract, filters, search_entity="contract"
+        )
+
+
+async def get_contract_by_id(db: AsyncSession, contract_id: int):
+    """
+    Récupère un contrat spécifique par son ID.
+    """
+    return await db.get(Contract, contract_id)
+
+
+async def get_contracts_by_client_id(db: AsyncSession, client_id: int):
+    """
+    Récupère tous les contrats associés à un client spécifique.
+    """
+    result = await db.scalars(
+        select(Contract).where(Contract.client_id == client_id)
+        )
+    return result.all()
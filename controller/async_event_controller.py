@@ -0,0 +1,232 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from model.event_model import Event
+from datetime import datetime
+from authentication.auth_utils import handle_errors, requires_permission
+from controller.round_trips import track_round_trips
+from controller.async_pagination import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_PAGE_SIZE,
+    iter_pages,
+    keyset_page,
+    stream
+    )
+from controller.loading import apply_loading_profile
+from controller.async_bulk import bulk_delete, bulk_update
+from controller.search_index import (
+    index_documents,
+    remove_documents,
+    touches_index
+    )
+from controller.event_controller import (
+    EVENT_LOADING_PROFILES,
+    _event_keyset
+    )
+
+
+# Version asynchrone de event_controller : les filtres sont construits
+# avec event_controller.event_filters, comme pour la version synchrone.
+
+
+def _events_query(load: str = None, filters: list = None):
+    """
+    Construit la requête de base des événements avec le profil
+    de chargement et les filtres éventuels.
+    """
+    stmt = apply_loading_profile(select(Event), EVENT_LOADING_PROFILES, load)
+    if filters:
+        stmt = stmt.where(*filters)
+    return stmt
+
+
+@handle_errors
+async def get_all_events(
+    db: AsyncSession, token: str, load: str = None, filters: list = None
+):
+    """
+    Récupère tous les événements de la base de données.
+    """
+    events = await stream_events(db, token, load=load, filters=filters)
+    return [event async for event in events]
+
+
+@handle_errors
+async def get_events_page(
+    db: AsyncSession, token: str, limit: int = DEFAULT_PAGE_SIZE,
+    after: tuple = None, order_by: str = "id", load: str = None,
+    filters: list = None
+):
+    """
+    Récupère une page d'événements après le curseur `after`
+    (id, ou (date_start, id) si le tri est par date de début).
+    """
+    return await keyset_page(
+        db, _events_query(load, filters), _event_keyset(order_by),
+        after, limit
+        )
+
+
+async def iter_event_pages(
+    db: AsyncSession, token: str, page_size: int = DEFAULT_PAGE_SIZE,
+    order_by: str = "id", load: str = None, filters: list = None
+):
+    """
+    Générateur asynchrone qui retourne les événements page par page.
+    """
+    async for page in iter_pages(
+        db, _events_query(load, filters), _event_keyset(order_by), page_size
+    ):
+        yield page
+
+
+async def stream_events(
+    db: AsyncSession, token: str, batch_size: int = DEFAULT_BATCH_SIZE,
+    order_by: str = "id", load: str = None, filters: list = None
+):
+    """
+    Parcourt les événements un par un (async for), chargés par lots.
+    """
+    return await stream(
+        db, _events_query(load, filters), _event_keyset(order_by),
+        batch_size
+        )
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("create_event")
+async def create_event(
+    db: AsyncSession, user_id: int, token: str, event_name: str,
+    contract_id: int, client_id: int, client_name: str, client_contact: str,
+    date_start: datetime, date_end: datetime, support_contact_id: int,
+    location: str, attendees: int, notes: str
+):
+    """
+    Crée un nouvel événement dans la base de données.
+    """
+    new_event = Event(
+        event_name=event_name,
+        contract_id=contract_id,
+        client_id=client_id,
+        client_name=client_name,
+        client_contact=client_contact,
+        date_start=date_start,
+        date_end=date_end,
+        support_contact_id=support_contact_id,
+        location=location,
+        attendees=attendees,
+        notes=notes
+    )
+    db.add(new_event)
+    await db.flush()
+    await db.run_sync(
+        index_documents, "event", [new_event.id], new=True
+        )
+    await db.commit()
+    return new_event
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("update_event")
+async def update_event(
+    db: AsyncSession, user_id: int, token: str, event_id: int, **kwargs
+):
+    """
+    Met à jour un événement existant avec les informations fournies.
+    """
+    event = await db.get(Event, event_id)
+    if not event:
+        return None
+
+    for key, value in kwargs.items():
+        setattr(event, key, value)
+
+    if touches_index("event", kwargs):
+        await db.flush()
+        await db.run_sync(index_documents, "event", [event.id])
+    await db.commit()
+    return event
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("delete_event")
+async def delete_event(
+    db: AsyncSession, user_id: int, token: str, event_id: int
+):
+    """
+    Supprime un événement de la base de données.
+    """
+    event = await db.get(Event, event_id)
+    if not event:
+        return None
+
+    await db.run_sync(remove_documents, "event", [event.id])
+    await db.delete(event)
+    await db.commit()
+    return event
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("update_event")
+async def update_events(
+    db: AsyncSession, user_id: int, token: str, filters: list, **kwargs
+) -> int:
+    """
+    Met à jour en une requête tous les événements correspondant
+    aux filtres (voir event_filters). Retourne le nombre modifié.
+    """
+    return await bulk_update(
+        db, Event, filters, kwargs, search_entity="event"
+        )
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("update_event")
+async def reassign_support_contact(
+    db: AsyncSession, user_id: int, token: str, event_ids: list,
+    support_contact_id: int
+) -> int:
+    """
+    Attribue un contact support à une liste d'événements.
+    """
+    return await bulk_update(
+        db, Event, [Event.id.in_(event_ids)],
+        {"support_contact_id": support_contact_id}
+        )
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("delete_event")
+async def delete_events(
+    db: AsyncSession, user_id: int, token: str, filters: list
+) -> int:
+    """
+    Supprime en une requête tous les événements correspondant aux filtres.
+    """
+    return await bulk_delete(db, Event, filters, search_entity="event")
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("delete_event")
+async def delete_events_of_contract(
+    db: AsyncSession, user_id: int, token: str, contract_id: int
+) -> int:
+    """
+    Supprime tous les événements d'un contrat (par exemple annulé).
+    """
+    return await bulk_delete(
+        db, Event, [Event.contract_id == contract_id], search_entity="event"
+        )
+
+
+async def get_event_by_id(db: AsyncSession, event_id: int):
+    """
+    Récupère un événement spécifique par son ID.
+    """
+    return await db.get(Event, event_id)
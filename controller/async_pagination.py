@@ -0,0 +1,47 @@
+from sqlalchemy import Select
+from controller.pagination import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_PAGE_SIZE,
+    _after_clause,
+    cursor_of
+    )
+
+
+async def keyset_page(db, stmt: Select, columns: list, after=None,
+                      limit: int = DEFAULT_PAGE_SIZE) -> list:
+    """
+    Équivalent asynchrone de pagination.keyset_page pour une requête
+    select() exécutée sur une AsyncSession.
+    """
+    if after is not None:
+        stmt = stmt.where(_after_clause(columns, after))
+    result = await db.scalars(stmt.order_by(*columns).limit(limit))
+    return result.unique().all()
+
+
+async def iter_pages(db, stmt: Select, columns: list,
+                     page_size: int = DEFAULT_PAGE_SIZE):
+    """
+    Générateur asynchrone qui parcourt une requête page par page
+    en reprenant après le curseur de la dernière ligne.
+    """
+    after = None
+    while True:
+        rows = await keyset_page(db, stmt, columns, after, page_size)
+        if not rows:
+            return
+        yield rows
+        if len(rows) < page_size:
+            return
+        after = cursor_of(rows[-1], columns)
+
+
+async def stream(db, stmt: Select, columns: list,
+                 batch_size: int = DEFAULT_BATCH_SIZE):
+    """
+    Parcourt une requête ligne par ligne (async for) en chargeant
+    les objets par lots de `batch_size` (yield_per).
+    """
+    return await db.stream_scalars(
+        stmt.order_by(*columns).execution_options(yield_per=batch_size)
+        )
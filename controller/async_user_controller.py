@@ -0,0 +1,198 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from model.user_model import User, Department
+from datetime import datetime
+from authentication.auth_token import (
+    bump_permission_version,
+    get_user_from_token_async,
+    invalidate_token_cache
+    )
+from authentication.auth_controller import set_password_async
+from authentication.auth_service import invalidate_role_cache
+from authentication.auth_utils import handle_errors, requires_permission
+from controller.round_trips import track_round_trips
+from controller.loading import apply_loading_profile
+from controller.async_pagination import DEFAULT_PAGE_SIZE, keyset_page
+from controller.reference_cache import (
+    cached_department,
+    cached_users_by_role,
+    invalidate_users_by_role,
+    store_department,
+    store_users_by_role
+    )
+from controller.user_controller import USER_KEYSET, USER_LOADING_PROFILES
+from monitoring import capture_message
+
+
+async def _get_department(db: AsyncSession, department_name: str):
+    """
+    Récupère un département par son nom, depuis le cache si possible.
+    """
+    department = cached_department(department_name)
+    if department is None:
+        found = await db.scalar(
+            select(Department).where(Department.name == department_name)
+            )
+        if not found:
+            raise ValueError("Département non trouvé")
+        department = store_department(found)
+    return department
+
+
+def _users_query(load: str = None):
+    """
+    Construit la requête des utilisateurs affichés (hors managers).
+    """
+    stmt = (
+        select(User)
+        .join(Department)
+        .where(Department.name != "manager")
+    )
+    return apply_loading_profile(stmt, USER_LOADING_PROFILES, load)
+
+
+@handle_errors
+async def get_all_users(db: AsyncSession, token: str, load: str = None):
+    """
+    Fonction pour récupérer tous les utilisateurs de la base de données
+    """
+    await get_user_from_token_async(token, db)
+    return (await db.scalars(_users_query(load))).all()
+
+
+@handle_errors
+async def get_users_page(
+    db: AsyncSession, token: str, limit: int = DEFAULT_PAGE_SIZE,
+    after: tuple = None, load: str = None
+):
+    """
+    Récupère une page d'utilisateurs après le curseur `after` (id).
+    """
+    await get_user_from_token_async(token, db)
+    return await keyset_page(
+        db, _users_query(load), USER_KEYSET, after, limit
+        )
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("create_user")
+async def create_user(
+    db: AsyncSession, user_id: int, token: str, employee_number: str,
+    complete_name: str, email: str, password: str, department_name: str
+):
+    """
+    Fonction pour créer un nouvel utilisateur dans la base de données
+    """
+    department = await _get_department(db, department_name)
+
+    new_user = User(
+        employee_number=employee_number,
+        complete_name=complete_name,
+        email=email,
+        department_id=department.id,
+        creation_date=datetime.now()
+    )
+    await set_password_async(new_user, password)
+
+    db.add(new_user)
+    await db.commit()
+    invalidate_users_by_role()
+
+    capture_message(f"Utilisateur créé: {new_user.complete_name}, ID: {new_user.id}")
+
+    return new_user
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("update_user")
+async def update_user(
+    db: AsyncSession, user_id: int, token: str, selected_user_id: int,
+    **kwargs
+):
+    """
+    Fonction pour mettre à jour un utilisateur existant.
+    Un changement de département invalide le rôle signé dans ses jetons.
+    """
+    user_to_update = await db.get(User, selected_user_id)
+    if not user_to_update:
+        return None
+
+    department_name = kwargs.pop("department_name", None)
+    password = kwargs.pop("password", None)
+    department_changed = False
+
+    if department_name is not None:
+        department = await _get_department(db, department_name)
+        department_changed = department.id != user_to_update.department_id
+        user_to_update.department_id = department.id
+
+    # Un mot de passe vide (champ laissé vide) conserve l'actuel
+    if password:
+        await set_password_async(user_to_update, password)
+
+    for key, value in kwargs.items():
+        if value is not None:
+            setattr(user_to_update, key, value)
+
+    await db.commit()
+    invalidate_users_by_role()
+    if department_changed:
+        bump_permission_version(user_to_update.id)
+    invalidate_role_cache(user_to_update.id)
+    invalidate_token_cache(user_id=user_to_update.id)
+
+    capture_message(f"Utilisateur modifié: {user_to_update.complete_name}, ID: {user_to_update.id}")
+
+    return user_to_update
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("delete_user")
+async def delete_user(
+    db: AsyncSession, user_id: int, token: str, selected_user_id: int
+):
+    """
+    Fonction pour supprimer un utilisateur
+    """
+    user_to_delete = await db.get(User, selected_user_id)
+    if not user_to_delete:
+        return None
+
+    await db.delete(user_to_delete)
+    await db.commit()
+    invalidate_users_by_role()
+    bump_permission_version(user_to_delete.id)
+    invalidate_role_cache(user_to_delete.id)
+    invalidate_token_cache(user_id=user_to_delete.id)
+    return user_to_delete
+
+
+async def get_users_by_role(db: AsyncSession, role: str):
+    """
+    Récupère tous les utilisateurs ayant un rôle spécifique.
+    La liste est servie depuis le cache des données de référence.
+    """
+    users = cached_users_by_role(role)
+    if users is None:
+        result = await db.scalars(
+            select(User).join(Department).where(Department.name == role)
+            )
+        users = store_users_by_role(role, result.all())
+    return users
+
+
+async def get_user_by_id(db: AsyncSession, user_id: int) -> User:
+    """
+    Récupère un utilisateur spécifique par son ID.
+    """
+    return await db.get(User, user_id)
+
+
+async def get_commercials(db: AsyncSession):
+    """
+    Fonction pour récupérer tous les utilisateurs ayant le rôle de commercial.
+    """
+    return await get_users_by_role(db, "commercial")
@@ -0,0 +1,61 @@
+from sqlalchemy.orm import Session
+from controller.search_index import (
+    index_documents,
+    remove_documents,
+    touches_index
+    )
+
+
+def _affected_ids(db: Session, model, filters: list) -> list:
+    """Id des lignes correspondant aux filtres."""
+    return [row_id for row_id, in db.query(model.id).filter(*filters)]
+
+
+def bulk_update(db: Session, model, filters: list, values: dict,
+                search_entity: str = None) -> int:
+    """
+    Met à jour en une seule requête UPDATE ... WHERE toutes les lignes
+    correspondant aux filtres. Retourne le nombre de lignes modifiées.
+    Avec `search_entity`, les documents de l'index de recherche des lignes
+    modifiées sont reconstruits si une colonne indexée change.
+    """
+    if not filters:
+        raise ValueError("Un filtre est obligatoire pour une mise à jour groupée.")
+    if not values:
+        raise ValueError("Aucune valeur à mettre à jour.")
+
+    reindex = search_entity is not None and touches_index(search_entity, values)
+    # Les id sont lus avant : la mise à jour peut changer les colonnes filtrées
+    ids = _affected_ids(db, model, filters) if reindex else []
+    count = (
+        db.query(model)
+        .filter(*filters)
+        .update(values, synchronize_session=False)
+    )
+    if reindex:
+        index_documents(db, search_entity, ids)
+    db.commit()
+    return count
+
+
+def bulk_delete(db: Session, model, filters: list,
+                search_entity: str = None) -> int:
+    """
+    Supprime en une seule requête DELETE ... WHERE toutes les lignes
+    correspondant aux filtres. Retourne le nombre de lignes supprimées.
+    Avec `search_entity`, leurs documents sont retirés de l'index.
+    """
+    if not filters:
+        raise ValueError("Un filtre est obligatoire pour une suppression groupée.")
+
+    if search_entity is not None:
+        remove_documents(
+            db, search_entity, _affected_ids(db, model, filters)
+            )
+    count = (
+        db.query(model)
+        .filter(*filters)
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return count
@@ -1,22 +1,109 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from model.client_model import Client
 from model.user_model import User
 from datetime import datetime
+from config import read_only
 from authentication.auth_utils import handle_errors, requires_permission
+from controller.round_trips import track_round_trips
 from authentication.auth_token import get_user_from_token
+from controller.pagination import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_PAGE_SIZE,
+    iter_pages,
+    keyset_page,
+    stream
+    )
+from controller.loading import apply_loading_profile
+from controller.bulk import bulk_update
+from controller.name_search import DEFAULT_SEARCH_LIMIT, search_by_name
+from controller.search_index import (
+    index_documents,
+    remove_documents,
+    touches_index
+    )
+
+
+CLIENT_KEYSET = [Client.id]
+
+# Relations chargées avec la requête principale selon l'usage de la liste
+CLIENT_LOADING_PROFILES = {
+    "display": (
+        (joinedload, Client.commercial_contact),
+    ),
+}
+
+
+def _clients_query(db: Session, load: str = None):
+    """
+    Construit la requête de base des clients avec le profil de chargement.
+    """
+    return apply_loading_profile(
+        db.query(Client), CLIENT_LOADING_PROFILES, load
+        )
 
 
 @handle_errors
-def get_all_clients(db: Session, token: str):
+@read_only
+def get_all_clients(db: Session, token: str, load: str = None):
     """
     Fonction pour récupérer tous les clients de la base de données.
     """
-    get_user_from_token(token, db)
-    clients = db.query(Client).all()
+    clients = list(stream_clients(db, token, load=load))
     return clients
 
 
 @handle_errors
+@read_only
+def get_clients_page(
+    db: Session, token: str, limit: int = DEFAULT_PAGE_SIZE,
+    after: tuple = None, load: str = None
+):
+    """
+    Récupère une page de clients après le curseur `after` (id).
+    """
+    get_user_from_token(token, db)
+    return keyset_page(_clients_query(db, load), CLIENT_KEYSET, after, limit)
+
+
+@handle_errors
+@read_only
+def search_clients(
+    db: Session, token: str, text: str, limit: int = DEFAULT_SEARCH_LIMIT
+):
+    """
+    Recherche au plus `limit` clients par début puis partie du nom complet
+    (ou par id si le texte est numérique).
+    """
+    get_user_from_token(token, db)
+    return search_by_name(
+        db.query(Client), Client.full_name, Client.id, text, limit
+        )
+
+
+def iter_client_pages(
+    db: Session, token: str, page_size: int = DEFAULT_PAGE_SIZE,
+    load: str = None
+):
+    """
+    Générateur qui retourne les clients page par page.
+    """
+    get_user_from_token(token, db)
+    return iter_pages(_clients_query(db, load), CLIENT_KEYSET, page_size)
+
+
+def stream_clients(
+    db: Session, token: str, batch_size: int = DEFAULT_BATCH_SIZE,
+    load: str = None
+):
+    """
+    Parcourt les clients un par un, chargés par lots (yield_per).
+    """
+    get_user_from_token(token, db)
+    return stream(_clients_query(db, load), CLIENT_KEYSET, batch_size)
+
+
+@handle_errors
+@track_round_trips
 @requires_permission("create_client")
 def create_client(
     db: Session, user_id: int, token: str, full_name: str, email: str,
@@ -46,12 +133,14 @@ def create_client(
     )
 
     db.add(new_client)
+    db.flush()
+    index_documents(db, "client", [new_client.id], new=True)
     db.commit()
-    db.refresh(new_client)
     return new_client
 
 
 @handle_errors
+@track_round_trips
 @requires_permission("update_client")
 def update_client(
     db: Session, user_id: int, token: str, client_id: int, **kwargs
@@ -66,12 +155,15 @@ def update_client(
     for key, value in kwargs.items():
         setattr(client, key, value)
 
+    if touches_index("client", kwargs):
+        db.flush()
+        index_documents(db, "client", [client.id])
     db.commit()
-    db.refresh(client)
     return client
 
 
 @handle_errors
+@track_round_trips
 @requires_permission("delete_client")
 def delete_client(db: Session, user_id: int, token: str, client_id: int, ):
     """
@@ -81,11 +173,32 @@ def delete_client(db: Session, user_id: int, token: str, client_id: int, ):
     if not client:
         return None
 
+    remove_documents(db, "client", [client.id])
     db.delete(client)
     db.commit()
     return client
 
 
+@handle_errors
+@track_round_trips
+@requires_permission("update_client")
+def reassign_commercial_contact(
+    db: Session, user_id: int, token: str, client_ids: list,
+    commercial_contact_id: int
+) -> int:
+    """
+    Attribue un commercial à une liste de clients en une requête.
+    """
+    return bulk_update(
+        db, Client, [Client.id.in_(client_ids)],
+        {
+            "commercial_contact_id": commercial_contact_id,
+            "last_update": datetime.now(),
+        }
+        )
+
+
+@read_only
 def get_client_by_id(db: Session, client_id: int):
     """
     Récupère un client spécifique par son ID.
@@ -1,20 +1,137 @@
-from sqlalchemy.orm import Session
-from model.contract_model import Contract
+from sqlalchemy.orm import Session, contains_eager, joinedload
+from model.client_model import Client
+from model.contract_model import Contract, STATUTS_CONTRAT
 from datetime import datetime
+from config import read_only
 from authentication.auth_utils import handle_errors, requires_permission
+from controller.round_trips import track_round_trips
+from controller.pagination import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_PAGE_SIZE,
+    iter_pages,
+    keyset_page,
+    stream
+    )
+from controller.loading import apply_loading_profile
+from controller.bulk import bulk_delete, bulk_update
+from controller.name_search import DEFAULT_SEARCH_LIMIT, search_by_name
+from controller.search_index import index_documents, remove_documents
+
+
+CONTRACT_KEYSET = [Contract.id]
+
+# Relations chargées avec la requête principale selon l'usage de la liste
+CONTRACT_LOADING_PROFILES = {
+    "display": (
+        (joinedload, Contract.client),
+        (joinedload, Contract.commercial_contact),
+    ),
+}
+
+
+def contract_filters(
+    statut: str = None, fully_paid: bool = False,
+    date_from: datetime = None, date_to: datetime = None
+) -> list:
+    """
+    Construit la liste des conditions SQL (clauses WHERE) pour filtrer
+    les contrats. Les listes retournées peuvent être concaténées.
+    """
+    filters = []
+    if statut is not None:
+        filters.append(Contract.statut == statut)
+    if fully_paid:
+        filters.append(Contract.remaining_price == 0)
+    if date_from is not None:
+        filters.append(Contract.creation_date >= date_from)
+    if date_to is not None:
+        filters.append(Contract.creation_date < date_to)
+    return filters
+
+
+def _contracts_query(db: Session, load: str = None, filters: list = None):
+    """
+    Construit la requête de base des contrats avec le profil
+    de chargement et les filtres éventuels.
+    """
+    query = apply_loading_profile(
+        db.query(Contract), CONTRACT_LOADING_PROFILES, load
+        )
+    if filters:
+        query = query.filter(*filters)
+    return query
 
 
 @handle_errors
-def get_all_contracts(db: Session, token: str):
+@read_only
+def get_all_contracts(
+    db: Session, token: str, load: str = None, filters: list = None
+):
     """
     Fonction pour récupéré et afficher tous
     les contrats de la base de données
     """
-    contracts = db.query(Contract).all()
+    contracts = list(stream_contracts(db, token, load=load, filters=filters))
     return contracts
 
 
 @handle_errors
+@read_only
+def get_contracts_page(
+    db: Session, token: str, limit: int = DEFAULT_PAGE_SIZE,
+    after: tuple = None, load: str = None, filters: list = None
+):
+    """
+    Récupère une page de contrats après le curseur `after` (id).
+    """
+    return keyset_page(
+        _contracts_query(db, load, filters), CONTRACT_KEYSET, after, limit
+        )
+
+
+@handle_errors
+@read_only
+def search_contracts(
+    db: Session, token: str, text: str, limit: int = DEFAULT_SEARCH_LIMIT
+):
+    """
+    Recherche au plus `limit` contrats par id ou par nom du client,
+    le client étant chargé par la même requête.
+    """
+    query = (
+        db.query(Contract)
+        .join(Contract.client)
+        .options(contains_eager(Contract.client))
+    )
+    return search_by_name(query, Client.full_name, Contract.id, text, limit)
+
+
+def iter_contract_pages(
+    db: Session, token: str, page_size: int = DEFAULT_PAGE_SIZE,
+    load: str = None, filters: list = None
+):
+    """
+    Générateur qui retourne les contrats page par page.
+    """
+    return iter_pages(
+        _contracts_query(db, load, filters), CONTRACT_KEYSET, page_size
+        )
+
+
+def stream_contracts(
+    db: Session, token: str, batch_size: int = DEFAULT_BATCH_SIZE,
+    load: str = None, filters: list = None
+):
+    """
+    Parcourt les contrats un par un, chargés par lots (yield_per).
+    """
+    return stream(
+        _contracts_query(db, load, filters), CONTRACT_KEYSET, batch_size
+        )
+
+
+@handle_errors
+@track_round_trips
 @requires_permission("create_contract")
 def create_contract(
     db: Session, user_id: int, token: str, client_id: int,
@@ -34,12 +151,28 @@ def create_contract(
     )
 
     db.add(new_contract)
+    db.flush()
+    index_documents(db, "contract", [new_contract.id], new=True)
     db.commit()
-    db.refresh(new_contract)
     return new_contract
 
 
+def _check_remaining_price(contract: Contract, values: dict):
+    """
+    Vérifie qu'après la mise à jour le prix restant
+    ne dépasse pas le prix total.
+    """
+    total_price = values.get("total_price", contract.total_price)
+    remaining_price = values.get("remaining_price", contract.remaining_price)
+    if (
+        total_price is not None and remaining_price is not None
+        and remaining_price > total_price
+    ):
+        raise ValueError("Le prix restant dépasse le prix total.")
+
+
 @handle_errors
+@track_round_trips
 @requires_permission("update_contract")
 def update_contract(
     db: Session, user_id: int, token: str, contract_id: int, **kwargs
@@ -51,16 +184,17 @@ def update_contract(
     if not contract:
         return None
 
+    _check_remaining_price(contract, kwargs)
     for key, value in kwargs.items():
         setattr(contract, key, value)
 
     contract.last_update = datetime.now()
     db.commit()
-    db.refresh(contract)
     return contract
 
 
 @handle_errors
+@track_round_trips
 @requires_permission("delete_contract")
 def delete_contract(db: Session, user_id: int, token: str, contract_id: int):
     """
@@ -70,11 +204,52 @@ def delete_contract(db: Session, user_id: int, token: str, contract_id: int):
     if not contract:
         return None
 
+    remove_documents(db, "contract", [contract.id])
     db.delete(contract)
     db.commit()
     return contract
 
 
+@handle_errors
+@track_round_trips
+@requires_permission("update_contract")
+def update_contracts(
+    db: Session, user_id: int, token: str, filters: list, **kwargs
+) -> int:
+    """
+    Met à jour en une requête tous les contrats correspondant
+    aux filtres (voir contract_filters). Retourne le nombre modifié.
+    """
+    return bulk_update(db, Contract, filters, kwargs)
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("update_contract")
+def update_contracts_status(
+    db: Session, user_id: int, token: str, filters: list, statut: str
+) -> int:
+    """
+    Change le statut de tous les contrats correspondant aux filtres.
+    """
+    if statut not in STATUTS_CONTRAT:
+        raise ValueError(f"Statut invalide : {statut}")
+    return bulk_update(db, Contract, filters, {"statut": statut})
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("delete_contract")
+def delete_contracts(
+    db: Session, user_id: int, token: str, filters: list
+) -> int:
+    """
+    Supprime en une requête tous les contrats correspondant aux filtres.
+    """
+    return bulk_delete(db, Contract, filters, search_entity="contract")
+
+
+@read_only
 def get_contract_by_id(db: Session, contract_id: int):
     """
     Récupère un contrat spécifique par son ID.
@@ -82,6 +257,7 @@ def get_contract_by_id(db: Session, contract_id: int):
     return db.query(Contract).filter(Contract.id == contract_id).first()
 
 
+@read_only
 def get_contracts_by_client_id(db: Session, client_id: int):
     """
     Récupère tous les contrats associés à un client spécifique.
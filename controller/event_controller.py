@@ -1,18 +1,145 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from model.event_model import Event
 from datetime import datetime
+from config import read_only
 from authentication.auth_utils import handle_errors, requires_permission
+from controller.round_trips import track_round_trips
+from controller.pagination import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_PAGE_SIZE,
+    iter_pages,
+    keyset_page,
+    stream
+    )
+from controller.loading import apply_loading_profile
+from controller.bulk import bulk_delete, bulk_update
+from controller.name_search import DEFAULT_SEARCH_LIMIT, search_by_name
+from controller.search_index import (
+    index_documents,
+    remove_documents,
+    touches_index
+    )
+
+
+EVENT_KEYSET = [Event.id]
+
+# Relations chargées avec la requête principale selon l'usage de la liste
+EVENT_LOADING_PROFILES = {
+    "display": (
+        (joinedload, Event.client),
+        (joinedload, Event.support_contact),
+    ),
+}
+
+
+def event_filters(
+    unassigned: bool = False, support_contact_id: int = None,
+    date_from: datetime = None, date_to: datetime = None
+) -> list:
+    """
+    Construit la liste des conditions SQL (clauses WHERE) pour filtrer
+    les événements. Les listes retournées peuvent être concaténées.
+    """
+    filters = []
+    if unassigned:
+        filters.append(Event.support_contact_id.is_(None))
+    if support_contact_id is not None:
+        filters.append(Event.support_contact_id == support_contact_id)
+    if date_from is not None:
+        filters.append(Event.date_start >= date_from)
+    if date_to is not None:
+        filters.append(Event.date_start < date_to)
+    return filters
+
+
+def _events_query(db: Session, load: str = None, filters: list = None):
+    """
+    Construit la requête de base des événements avec le profil
+    de chargement et les filtres éventuels.
+    """
+    query = apply_loading_profile(db.query(Event), EVENT_LOADING_PROFILES, load)
+    if filters:
+        query = query.filter(*filters)
+    return query
+
+
+def _event_keyset(order_by: str = "id") -> list:
+    """
+    Retourne les colonnes de tri utilisées pour la pagination des événements.
+    """
+    if order_by == "date_start":
+        return [Event.date_start, Event.id]
+    if order_by == "id":
+        return EVENT_KEYSET
+    raise ValueError(f"Tri des événements non supporté : {order_by}")
 
 
 @handle_errors
-def get_all_events(db: Session, token: str):
+@read_only
+def get_all_events(
+    db: Session, token: str, load: str = None, filters: list = None
+):
     """
     Récupère tous les événements de la base de données.
     """
-    return db.query(Event).all()
+    return list(stream_events(db, token, load=load, filters=filters))
+
+
+@handle_errors
+@read_only
+def get_events_page(
+    db: Session, token: str, limit: int = DEFAULT_PAGE_SIZE,
+    after: tuple = None, order_by: str = "id", load: str = None,
+    filters: list = None
+):
+    """
+    Récupère une page d'événements après le curseur `after`
+    (id, ou (date_start, id) si le tri est par date de début).
+    """
+    return keyset_page(
+        _events_query(db, load, filters), _event_keyset(order_by), after, limit
+        )
+
+
+@handle_errors
+@read_only
+def search_events(
+    db: Session, token: str, text: str, limit: int = DEFAULT_SEARCH_LIMIT
+):
+    """
+    Recherche au plus `limit` événements par id ou par nom.
+    """
+    return search_by_name(
+        db.query(Event), Event.event_name, Event.id, text, limit
+        )
+
+
+def iter_event_pages(
+    db: Session, token: str, page_size: int = DEFAULT_PAGE_SIZE,
+    order_by: str = "id", load: str = None, filters: list = None
+):
+    """
+    Générateur qui retourne les événements page par page.
+    """
+    return iter_pages(
+        _events_query(db, load, filters), _event_keyset(order_by), page_size
+        )
+
+
+def stream_events(
+    db: Session, token: str, batch_size: int = DEFAULT_BATCH_SIZE,
+    order_by: str = "id", load: str = None, filters: list = None
+):
+    """
+    Parcourt les événements un par un, chargés par lots (yield_per).
+    """
+    return stream(
+        _events_query(db, load, filters), _event_keyset(order_by), batch_size
+        )
 
 
 @handle_errors
+@track_round_trips
 @requires_permission("create_event")
 def create_event(
     db: Session, user_id: int, token: str, event_name: str,
@@ -37,12 +164,14 @@ def create_event(
         notes=notes
     )
     db.add(new_event)
+    db.flush()
+    index_documents(db, "event", [new_event.id], new=True)
     db.commit()
-    db.refresh(new_event)
     return new_event
 
 
 @handle_errors
+@track_round_trips
 @requires_permission("update_event")
 def update_event(
     db: Session, user_id: int, token: str, event_id: int, **kwargs
@@ -57,12 +186,15 @@ def update_event(
     for key, value in kwargs.items():
         setattr(event, key, value)
 
+    if touches_index("event", kwargs):
+        db.flush()
+        index_documents(db, "event", [event.id])
     db.commit()
-    db.refresh(event)
     return event
 
 
 @handle_errors
+@track_round_trips
 @requires_permission("delete_event")
 def delete_event(db: Session, user_id: int, token: str, event_id: int):
     """
@@ -72,11 +204,66 @@ def delete_event(db: Session, user_id: int, token: str, event_id: int):
     if not event:
         return None
 
+    remove_documents(db, "event", [event.id])
     db.delete(event)
     db.commit()
     return event
 
 
+@handle_errors
+@track_round_trips
+@requires_permission("update_event")
+def update_events(
+    db: Session, user_id: int, token: str, filters: list, **kwargs
+) -> int:
+    """
+    Met à jour en une requête tous les événements correspondant
+    aux filtres (voir event_filters). Retourne le nombre modifié.
+    """
+    return bulk_update(db, Event, filters, kwargs, search_entity="event")
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("update_event")
+def reassign_support_contact(
+    db: Session, user_id: int, token: str, event_ids: list,
+    support_contact_id: int
+) -> int:
+    """
+    Attribue un contact support à une liste d'événements.
+    """
+    return bulk_update(
+        db, Event, [Event.id.in_(event_ids)],
+        {"support_contact_id": support_contact_id}
+        )
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("delete_event")
+def delete_events(db: Session, user_id: int, token: str, filters: list) -> int:
+    """
+    Supprime en une requête tous les événements correspondant aux filtres.
+    """
+    return bulk_delete(db, Event, filters, search_entity="event")
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("delete_event")
+def delete_events_of_contract(
+    db: Session, user_id: int, token: str, contract_id: int
+) -> int:
+    """
+    Supprime tous les événements d'un contrat (par exemple annulé).
+    """
+    return bulk_delete(
+        db, Event, [Event.contract_id == contract_id], search_entity="event"
+        )
+
+
+@read_only
 def get_event_by_id(db: Session, event_id: int):
     """
     Récupère un événement spécifique par son ID.
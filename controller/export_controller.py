@@ -0,0 +1,250 @@
+import bz2
+import csv
+import gzip
+import json
+from datetime import datetime
+from decimal import Decimal
+from sqlalchemy import DateTime, Integer, Numeric, select
+from sqlalchemy.orm import Session
+from model.client_model import Client
+from model.contract_model import Contract
+from model.event_model import Event
+from model.user_model import User, Department
+from config import read_only
+from authentication.auth_utils import handle_errors, requires_permission
+from controller.pagination import DEFAULT_BATCH_SIZE
+
+
+EXPORT_FORMATS = ["csv", "jsonl", "parquet"]
+TEXT_COMPRESSIONS = {"gzip": gzip.open, "bz2": bz2.open}
+PARQUET_COMPRESSIONS = ["snappy", "gzip", "zstd"]
+
+# Colonnes exportées par entité (le mot de passe n'est jamais exporté)
+CLIENT_EXPORT_COLUMNS = [
+    Client.id, Client.full_name, Client.email, Client.phone_number,
+    Client.company_name, Client.creation_date, Client.last_update,
+    Client.commercial_contact_id,
+]
+CONTRACT_EXPORT_COLUMNS = [
+    Contract.id, Contract.client_id, Contract.commercial_contact_id,
+    Contract.total_price, Contract.remaining_price, Contract.creation_date,
+    Contract.statut,
+]
+EVENT_EXPORT_COLUMNS = [
+    Event.id, Event.event_name, Event.contract_id, Event.client_id,
+    Event.client_name, Event.client_contact, Event.date_start,
+    Event.date_end, Event.support_contact_id, Event.location,
+    Event.attendees, Event.notes,
+]
+USER_EXPORT_COLUMNS = [
+    User.id, User.employee_number, User.complete_name, User.email,
+    Department.name.label("department"), User.creation_date,
+]
+
+
+def _open_text(path: str, compression: str = None):
+    """
+    Ouvre un fichier texte en écriture, compressé ou non.
+    """
+    if compression is None:
+        return open(path, "w", newline="", encoding="utf-8")
+    if compression not in TEXT_COMPRESSIONS:
+        raise ValueError(f"Compression non supportée : {compression}")
+    return TEXT_COMPRESSIONS[compression](
+        path, "wt", newline="", encoding="utf-8"
+        )
+
+
+def _json_value(value):
+    """
+    Convertit les dates et les décimaux pour la sérialisation JSON.
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _write_csv(path: str, names: list, partitions, compression: str = None):
+    """
+    Écrit les lots de lignes dans un fichier CSV avec en-tête.
+    """
+    count = 0
+    with _open_text(path, compression) as file:
+        writer = csv.writer(file)
+        writer.writerow(names)
+        for rows in partitions:
+            writer.writerows(rows)
+            count += len(rows)
+    return count
+
+
+def _write_jsonl(path: str, names: list, partitions, compression: str = None):
+    """
+    Écrit les lots de lignes dans un fichier JSONL (un objet par ligne).
+    """
+    count = 0
+    with _open_text(path, compression) as file:
+        for rows in partitions:
+            for row in rows:
+                record = {
+                    name: _json_value(value) for name, value in zip(names, row)
+                }
+                file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            count += len(rows)
+    return count
+
+
+def _parquet_schema(pa, columns: list):
+    """
+    Construit le schéma Parquet à partir des types des colonnes SQLAlchemy.
+    """
+    fields = []
+    for column in columns:
+        column_type = column.type
+        if isinstance(column_type, Integer):
+            arrow_type = pa.int64()
+        elif isinstance(column_type, Numeric):
+            arrow_type = pa.decimal128(column_type.precision, column_type.scale)
+        elif isinstance(column_type, DateTime):
+            arrow_type = pa.timestamp("us")
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(column.key, arrow_type))
+    return pa.schema(fields)
+
+
+def _write_parquet(path: str, columns: list, partitions,
+                   compression: str = None):
+    """
+    Écrit les lots de lignes dans un fichier Parquet, un groupe par lot.
+    Nécessite la dépendance optionnelle pyarrow.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("L'export Parquet nécessite le paquet pyarrow.")
+
+    if compression is not None and compression not in PARQUET_COMPRESSIONS:
+        raise ValueError(f"Compression non supportée : {compression}")
+
+    schema = _parquet_schema(pa, columns)
+    count = 0
+    with pq.ParquetWriter(
+        path, schema, compression=compression or "none"
+    ) as writer:
+        for rows in partitions:
+            writer.write_table(pa.Table.from_pylist(
+                [dict(zip(schema.names, row)) for row in rows], schema=schema
+                ))
+            count += len(rows)
+    return count
+
+
+@read_only
+def _export(db: Session, statement, columns: list, path: str, fmt: str,
+            compression: str = None, batch_size: int = DEFAULT_BATCH_SIZE):
+    """
+    Exécute la requête avec un curseur côté serveur et écrit les
+    lignes par lots de `batch_size`. Retourne le nombre de lignes.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Format d'export non supporté : {fmt}")
+
+    result = db.execute(
+        statement.execution_options(yield_per=batch_size)
+        )
+    partitions = result.partitions()
+    names = [column.key for column in columns]
+
+    try:
+        if fmt == "csv":
+            return _write_csv(path, names, partitions, compression)
+        if fmt == "jsonl":
+            return _write_jsonl(path, names, partitions, compression)
+        return _write_parquet(path, columns, partitions, compression)
+    finally:
+        result.close()
+
+
+@handle_errors
+@requires_permission("get_all_clients")
+def export_clients(
+    db: Session, user_id: int, token: str, path: str, fmt: str = "csv",
+    compression: str = None, batch_size: int = DEFAULT_BATCH_SIZE
+):
+    """
+    Exporte les clients dans un fichier CSV, JSONL ou Parquet.
+    """
+    statement = select(*CLIENT_EXPORT_COLUMNS).order_by(Client.id)
+    return _export(
+        db, statement, CLIENT_EXPORT_COLUMNS, path, fmt,
+        compression, batch_size
+        )
+
+
+@handle_errors
+@requires_permission("get_all_contracts")
+def export_contracts(
+    db: Session, user_id: int, token: str, path: str, fmt: str = "csv",
+    compression: str = None, filters: list = None,
+    batch_size: int = DEFAULT_BATCH_SIZE
+):
+    """
+    Exporte les contrats, avec les mêmes filtres que la liste
+    (voir contract_filters).
+    """
+    statement = (
+        select(*CONTRACT_EXPORT_COLUMNS)
+        .where(*(filters or []))
+        .order_by(Contract.id)
+    )
+    return _export(
+        db, statement, CONTRACT_EXPORT_COLUMNS, path, fmt,
+        compression, batch_size
+        )
+
+
+@handle_errors
+@requires_permission("get_all_events")
+def export_events(
+    db: Session, user_id: int, token: str, path: str, fmt: str = "csv",
+    compression: str = None, filters: list = None,
+    batch_size: int = DEFAULT_BATCH_SIZE
+):
+    """
+    Exporte les événements, avec les mêmes filtres que la liste
+    (voir event_filters).
+    """
+    statement = (
+        select(*EVENT_EXPORT_COLUMNS)
+        .where(*(filters or []))
+        .order_by(Event.id)
+    )
+    return _export(
+        db, statement, EVENT_EXPORT_COLUMNS, path, fmt,
+        compression, batch_size
+        )
+
+
+@handle_errors
+@requires_permission("get_all_users")
+def export_users(
+    db: Session, user_id: int, token: str, path: str, fmt: str = "csv",
+    compression: str = None, batch_size: int = DEFAULT_BATCH_SIZE
+):
+    """
+    Exporte les utilisateurs (hors managers, comme la liste).
+    """
+    statement = (
+        select(*USER_EXPORT_COLUMNS)
+        .join(Department, User.department_id == Department.id)
+        .where(Department.name != "manager")
+        .order_by(User.id)
+    )
+    return _export(
+        db, statement, USER_EXPORT_COLUMNS, path, fmt,
+        compression, batch_size
+        )
@@ -0,0 +1,447 @@
+import csv
+import json
+from datetime import datetime
+from sqlalchemy import func, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from model.client_model import Client
+from model.contract_model import Contract, STATUTS_CONTRAT
+from model.event_model import Event
+from model.user_model import User, Department
+from authentication.auth_utils import handle_errors, requires_permission
+from controller.round_trips import track_round_trips
+from controller.parsing import parse_price
+from controller.search_index import index_documents
+from view.validation import (
+    validate_digits,
+    validate_email,
+    validate_phone_number,
+    validate_text
+    )
+
+
+DEFAULT_IMPORT_BATCH_SIZE = 1000
+DATE_FORMAT = "%Y-%m-%d %H:%M"
+
+
+def iter_rows(path: str):
+    """
+    Lit un fichier CSV ou JSONL ligne par ligne.
+    Retourne des tuples (numéro de ligne, ligne, erreur de lecture).
+    """
+    if path.endswith(".jsonl"):
+        yield from _iter_jsonl(path)
+    elif path.endswith(".csv"):
+        yield from _iter_csv(path)
+    else:
+        raise ValueError("Format de fichier non supporté (CSV ou JSONL).")
+
+
+def _iter_csv(path: str):
+    """
+    Lit un fichier CSV avec une ligne d'en-tête.
+    """
+    with open(path, newline="", encoding="utf-8") as file:
+        reader = csv.DictReader(file)
+        for row in reader:
+            yield reader.line_num, row, None
+
+
+def _iter_jsonl(path: str):
+    """
+    Lit un fichier JSONL contenant un objet JSON par ligne.
+    """
+    with open(path, encoding="utf-8") as file:
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, None, f"JSON invalide : {e.msg}"
+                continue
+            if not isinstance(row, dict):
+                yield line_number, None, "La ligne doit être un objet JSON."
+                continue
+            yield line_number, row, None
+
+
+def _value(row: dict, key: str):
+    """
+    Retourne la valeur d'une colonne sous forme de texte nettoyé, ou None.
+    """
+    value = row.get(key)
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+def _required(row: dict, key: str) -> str:
+    """
+    Retourne la valeur d'une colonne obligatoire.
+    """
+    value = _value(row, key)
+    if value is None:
+        raise ValueError(f"Colonne obligatoire manquante : {key}")
+    return value
+
+
+def _parse_date(row: dict, key: str) -> datetime:
+    """
+    Convertit une colonne date au format YYYY-MM-DD HH:MM.
+    """
+    value = _required(row, key)
+    try:
+        return datetime.strptime(value, DATE_FORMAT)
+    except ValueError:
+        raise ValueError(f"Date invalide pour {key} : {value}")
+
+
+def _parse_client(row: dict):
+    """
+    Valide une ligne client et retourne (valeurs, références).
+    """
+    full_name = _required(row, "full_name")
+    if not validate_text(full_name):
+        raise ValueError(f"Nom invalide : {full_name}")
+
+    email = _required(row, "email")
+    if not validate_email(email):
+        raise ValueError(f"Email invalide : {email}")
+
+    phone_number = _value(row, "phone_number")
+    if phone_number and not validate_phone_number(phone_number):
+        raise ValueError(f"Numéro de téléphone invalide : {phone_number}")
+
+    company_name = _value(row, "company_name")
+    if company_name and not validate_text(company_name):
+        raise ValueError(f"Nom d'entreprise invalide : {company_name}")
+
+    now = datetime.now()
+    values = {
+        "full_name": full_name,
+        "email": email,
+        "phone_number": phone_number,
+        "company_name": company_name,
+        "creation_date": now,
+        "last_update": now,
+    }
+    references = {"commercial": _value(row, "commercial_employee_number")}
+    return values, references
+
+
+def _parse_contract(row: dict):
+    """
+    Valide une ligne contrat et retourne (valeurs, références).
+    """
+    total_price = parse_price(_required(row, "total_price"), "total_price")
+    remaining_price = parse_price(
+        _required(row, "remaining_price"), "remaining_price"
+        )
+    if remaining_price > total_price:
+        raise ValueError("Le prix restant dépasse le prix total.")
+
+    statut = _required(row, "statut")
+    if statut not in STATUTS_CONTRAT:
+        raise ValueError(f"Statut invalide : {statut}")
+
+    client_email = _value(row, "client_email")
+    if client_email is None:
+        raise ValueError("Colonne obligatoire manquante : client_email")
+
+    values = {
+        "total_price": total_price,
+        "remaining_price": remaining_price,
+        "statut": statut,
+        "creation_date": datetime.now(),
+    }
+    references = {
+        "client": client_email,
+        "commercial": _required(row, "commercial_employee_number"),
+    }
+    return values, references
+
+
+def _parse_event(row: dict):
+    """
+    Valide une ligne événement et retourne (valeurs, références).
+    """
+    contract_id = _required(row, "contract_id")
+    if not validate_digits(contract_id):
+        raise ValueError(f"ID de contrat invalide : {contract_id}")
+
+    date_start = _parse_date(row, "date_start")
+    date_end = _parse_date(row, "date_end")
+    if date_end <= date_start:
+        raise ValueError("La date de fin doit être après la date de début.")
+
+    location = _required(row, "location")
+    if not validate_text(location):
+        raise ValueError(f"Lieu invalide : {location}")
+
+    attendees = _value(row, "attendees")
+    if attendees and not validate_digits(attendees):
+        raise ValueError(f"Nombre de participants invalide : {attendees}")
+
+    values = {
+        "event_name": _required(row, "event_name"),
+        "client_contact": _required(row, "client_contact"),
+        "date_start": date_start,
+        "date_end": date_end,
+        "location": location,
+        "attendees": int(attendees) if attendees else None,
+        "notes": _value(row, "notes"),
+    }
+    references = {
+        "contract": int(contract_id),
+        "support": _value(row, "support_employee_number"),
+    }
+    return values, references
+
+
+def _users_by_employee_number(db: Session, numbers: set, role: str) -> dict:
+    """
+    Résout en une requête les numéros d'employé d'un rôle donné.
+    """
+    numbers = {number for number in numbers if number}
+    if not numbers:
+        return {}
+    rows = (
+        db.query(User.employee_number, User.id)
+        .join(Department)
+        .filter(Department.name == role, User.employee_number.in_(numbers))
+        .all()
+    )
+    return dict(rows)
+
+
+def _resolve_clients(db: Session, batch: list, errors: list) -> list:
+    """
+    Résout les commerciaux et rejette les emails déjà existants.
+    """
+    commercials = _users_by_employee_number(
+        db, {refs["commercial"] for _, _, refs in batch}, "commercial"
+        )
+    emails = {values["email"] for _, values, _ in batch}
+    existing = {
+        email for email, in
+        db.query(Client.email).filter(Client.email.in_(emails)).all()
+    }
+
+    resolved = []
+    for line, values, refs in batch:
+        if values["email"] in existing:
+            errors.append((line, f"Email déjà utilisé : {values['email']}"))
+            continue
+        commercial = refs["commercial"]
+        if commercial and commercial not in commercials:
+            errors.append((line, f"Commercial introuvable : {commercial}"))
+            continue
+        existing.add(values["email"])
+        values["commercial_contact_id"] = commercials.get(commercial)
+        resolved.append((line, values))
+    return resolved
+
+
+def _resolve_contracts(db: Session, batch: list, errors: list) -> list:
+    """
+    Résout les clients (par email) et les commerciaux des contrats.
+    """
+    commercials = _users_by_employee_number(
+        db, {refs["commercial"] for _, _, refs in batch}, "commercial"
+        )
+    client_emails = {refs["client"] for _, _, refs in batch}
+    clients = dict(
+        db.query(Client.email, Client.id)
+        .filter(Client.email.in_(client_emails))
+        .all()
+    )
+
+    resolved = []
+    for line, values, refs in batch:
+        if refs["client"] not in clients:
+            errors.append((line, f"Client introuvable : {refs['client']}"))
+            continue
+        if refs["commercial"] not in commercials:
+            errors.append(
+                (line, f"Commercial introuvable : {refs['commercial']}")
+                )
+            continue
+        values["client_id"] = clients[refs["client"]]
+        values["commercial_contact_id"] = commercials[refs["commercial"]]
+        resolved.append((line, values))
+    return resolved
+
+
+def _resolve_events(db: Session, batch: list, errors: list) -> list:
+    """
+    Résout les contrats (et leur client) et les supports des événements.
+    """
+    supports = _users_by_employee_number(
+        db, {refs["support"] for _, _, refs in batch}, "support"
+        )
+    contract_ids = {refs["contract"] for _, _, refs in batch}
+    contracts = {
+        contract_id: (client_id, client_name)
+        for contract_id, client_id, client_name in (
+            db.query(Contract.id, Client.id, Client.full_name)
+            .join(Client, Contract.client_id == Client.id)
+            .filter(Contract.id.in_(contract_ids))
+            .all()
+        )
+    }
+
+    resolved = []
+    for line, values, refs in batch:
+        if refs["contract"] not in contracts:
+            errors.append((line, f"Contrat introuvable : {refs['contract']}"))
+            continue
+        support = refs["support"]
+        if support and support not in supports:
+            errors.append((line, f"Support introuvable : {support}"))
+            continue
+        client_id, client_name = contracts[refs["contract"]]
+        values["contract_id"] = refs["contract"]
+        values["client_id"] = client_id
+        values["client_name"] = client_name
+        values["support_contact_id"] = supports.get(support)
+        resolved.append((line, values))
+    return resolved
+
+
+def _insert_rows(db: Session, model, values: list) -> list:
+    """
+    Insère des lignes (executemany) et retourne leurs id. Sans RETURNING
+    (MySQL), les id sont relus dans la transaction : ce sont ceux au-delà
+    du plus grand id lu avant l'insertion.
+    """
+    if db.get_bind().dialect.insert_executemany_returning:
+        return list(db.scalars(insert(model).returning(model.id), values))
+    last_id = db.query(func.max(model.id)).scalar() or 0
+    db.execute(insert(model), values)
+    return [
+        row_id for row_id, in
+        db.query(model.id).filter(model.id > last_id).all()
+    ]
+
+
+def _insert_batch(db: Session, model, rows: list, errors: list,
+                  search_entity: str) -> int:
+    """
+    Insère un lot de lignes dans une seule transaction (executemany)
+    et indexe ces seules lignes pour la recherche plein texte.
+    En cas d'erreur d'intégrité, le lot est rejoué ligne par ligne
+    pour identifier les lignes fautives.
+    """
+    if not rows:
+        return 0
+    try:
+        ids = _insert_rows(db, model, [values for _, values in rows])
+        index_documents(db, search_entity, ids, new=True)
+        db.commit()
+        return len(rows)
+    except IntegrityError:
+        db.rollback()
+
+    inserted = 0
+    for line, values in rows:
+        try:
+            ids = _insert_rows(db, model, [values])
+            index_documents(db, search_entity, ids, new=True)
+            db.commit()
+            inserted += 1
+        except IntegrityError as e:
+            db.rollback()
+            errors.append((line, f"Erreur d'intégrité : {e.orig}"))
+    return inserted
+
+
+def _run_import(db: Session, rows, model, parse_row, resolve_batch,
+                batch_size: int, search_entity: str) -> dict:
+    """
+    Valide, résout et insère les lignes par lots ; chaque lot est
+    indexé pour la recherche plein texte dans sa transaction.
+    Retourne un rapport {"inserted": nombre, "errors": [(ligne, message)]}.
+    """
+    report = {"inserted": 0, "errors": []}
+    batch = []
+
+    def flush():
+        resolved = resolve_batch(db, batch, report["errors"])
+        report["inserted"] += _insert_batch(
+            db, model, resolved, report["errors"], search_entity
+            )
+        batch.clear()
+
+    for line, row, error in rows:
+        if error:
+            report["errors"].append((line, error))
+            continue
+        try:
+            values, references = parse_row(row)
+        except ValueError as e:
+            report["errors"].append((line, str(e)))
+            continue
+        batch.append((line, values, references))
+        if len(batch) >= batch_size:
+            flush()
+
+    if batch:
+        flush()
+    report["errors"].sort()
+    return report
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("create_client")
+def import_clients(
+    db: Session, user_id: int, token: str, rows,
+    batch_size: int = DEFAULT_IMPORT_BATCH_SIZE
+):
+    """
+    Importe des clients à partir de lignes (voir iter_rows).
+    Colonnes : full_name, email, phone_number, company_name,
+    commercial_employee_number.
+    """
+    return _run_import(
+        db, rows, Client, _parse_client, _resolve_clients, batch_size,
+        search_entity="client"
+        )
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("create_contract")
+def import_contracts(
+    db: Session, user_id: int, token: str, rows,
+    batch_size: int = DEFAULT_IMPORT_BATCH_SIZE
+):
+    """
+    Importe des contrats à partir de lignes (voir iter_rows).
+    Colonnes : client_email, commercial_employee_number, total_price,
+    remaining_price, statut.
+    """
+    return _run_import(
+        db, rows, Contract, _parse_contract, _resolve_contracts, batch_size,
+        search_entity="contract"
+        )
+
+
+@handle_errors
+@track_round_trips
+@requires_permission("create_event")
+def import_events(
+    db: Session, user_id: int, token: str, rows,
+    batch_size: int = DEFAULT_IMPORT_BATCH_SIZE
+):
+    """
+    Importe des événements à partir de lignes (voir iter_rows).
+    Colonnes : contract_id, event_name, client_contact, date_start,
+    date_end, location, attendees, notes, support_employee_number.
+    """
+    return _run_import(
+        db, rows, Event, _parse_event, _resolve_events, batch_size,
+        search_entity="event"
+        )
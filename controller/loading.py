@@ -0,0 +1,17 @@
+from sqlalchemy.orm import Query
+
+
+def apply_loading_profile(query: Query, profiles: dict, load: str = None):
+    """
+    Ajoute à la requête les options de chargement du profil `load`.
+    Un profil est une liste de couples (stratégie, relation), par exemple
+    (joinedload, Event.client). Sans profil, les relations restent
+    chargées à la demande (lazy loading).
+    """
+    if load is None:
+        return query
+    if load not in profiles:
+        raise ValueError(f"Profil de chargement inconnu : {load}")
+    return query.options(
+        *(strategy(relationship) for strategy, relationship in profiles[load])
+        )
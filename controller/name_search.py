@@ -0,0 +1,62 @@
+from sqlalchemy.orm import Query
+
+
+DEFAULT_SEARCH_LIMIT = 20
+LIKE_ESCAPE = "\\"
+
+
+def escape_like(text: str) -> str:
+    """
+    Échappe les caractères spéciaux de LIKE (%, _ et le caractère
+    d'échappement) pour rechercher le texte tel quel.
+    """
+    return (
+        text.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", LIKE_ESCAPE + "%")
+        .replace("_", LIKE_ESCAPE + "_")
+    )
+
+
+def search_by_name(query: Query, column, id_column, text: str,
+                   limit: int = DEFAULT_SEARCH_LIMIT) -> list:
+    """
+    Recherche les lignes dont `column` commence par `text`, puis, s'il
+    reste de la place, celles qui le contiennent. Un texte numérique
+    retourne d'abord la ligne de cet id.
+    Chaque requête est limitée à `limit` lignes : la recherche par préfixe
+    utilise l'index de la colonne et la recherche par contenu s'arrête dès
+    que la limite est atteinte.
+    """
+    text = text.strip()
+    if limit <= 0:
+        return []
+
+    if not text:
+        return query.order_by(column, id_column).limit(limit).all()
+
+    results = []
+    if text.isdigit():
+        results.extend(query.filter(id_column == int(text)).all())
+
+    pattern = escape_like(text)
+    prefix = column.like(f"{pattern}%", escape=LIKE_ESCAPE)
+    searches = (
+        query.filter(prefix),
+        query.filter(
+            column.like(f"%{pattern}%", escape=LIKE_ESCAPE), ~prefix
+            ),
+    )
+    for search in searches:
+        if len(results) >= limit:
+            break
+        # Les lignes déjà trouvées sont exclues de la requête :
+        # la limite ne compte que de nouvelles lignes
+        found = [getattr(row, id_column.key) for row in results]
+        if found:
+            search = search.filter(~id_column.in_(found))
+        results.extend(
+            search.order_by(column, id_column)
+            .limit(limit - len(results))
+            .all()
+        )
+    return results
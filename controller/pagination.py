@@ -0,0 +1,63 @@
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+
+DEFAULT_PAGE_SIZE = 50
+DEFAULT_BATCH_SIZE = 500
+
+
+def keyset_page(query: Query, columns: list, after=None,
+                limit: int = DEFAULT_PAGE_SIZE):
+    """
+    Récupère une page d'une requête en pagination par clé (keyset).
+    `columns` est la liste ordonnée des colonnes de tri, la dernière
+    devant être unique (l'id). `after` contient les valeurs de ces
+    colonnes pour la dernière ligne de la page précédente.
+    """
+    if after is not None:
+        query = query.filter(_after_clause(columns, after))
+    return query.order_by(*columns).limit(limit).all()
+
+
+def _after_clause(columns: list, values):
+    """
+    Construit la condition (c1, c2, ...) > (v1, v2, ...) de façon portable.
+    """
+    clauses = []
+    for index, column in enumerate(columns):
+        equal = [columns[i] == values[i] for i in range(index)]
+        clauses.append(and_(*equal, column > values[index]))
+    return or_(*clauses)
+
+
+def cursor_of(row, columns: list) -> tuple:
+    """
+    Retourne le curseur (valeurs des colonnes de tri) d'une ligne.
+    """
+    return tuple(getattr(row, column.key) for column in columns)
+
+
+def iter_pages(query: Query, columns: list,
+               page_size: int = DEFAULT_PAGE_SIZE):
+    """
+    Générateur qui parcourt une requête page par page
+    en reprenant après le curseur de la dernière ligne.
+    """
+    after = None
+    while True:
+        rows = keyset_page(query, columns, after, page_size)
+        if not rows:
+            return
+        yield rows
+        if len(rows) < page_size:
+            return
+        after = cursor_of(rows[-1], columns)
+
+
+def stream(query: Query, columns: list,
+           batch_size: int = DEFAULT_BATCH_SIZE):
+    """
+    Parcourt une requête ligne par ligne en chargeant
+    les objets par lots de `batch_size` (yield_per).
+    """
+    return query.order_by(*columns).yield_per(batch_size)
@@ -0,0 +1,19 @@
+from decimal import Decimal, InvalidOperation
+
+
+def parse_price(value, key: str) -> Decimal:
+    """
+    Convertit un prix (texte ou nombre) en nombre décimal positif.
+    Utilisé par l'import en masse et par l'API.
+    """
+    if isinstance(value, bool):
+        raise ValueError(f"Prix invalide pour {key} : {value}")
+    try:
+        price = Decimal(str(value).strip())
+    except InvalidOperation:
+        raise ValueError(f"Prix invalide pour {key} : {value}")
+    if not price.is_finite():
+        raise ValueError(f"Prix invalide pour {key} : {value}")
+    if price < 0:
+        raise ValueError(f"Le prix {key} doit être positif.")
+    return price
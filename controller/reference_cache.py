@@ -0,0 +1,99 @@
+import time
+from collections import namedtuple
+from config import REFERENCE_CACHE_TTL_SECONDS
+
+
+# Copies figées des lignes en cache : elles restent utilisables
+# quelle que soit la session qui les a chargées
+ReferenceUser = namedtuple(
+    "ReferenceUser",
+    ["id", "employee_number", "complete_name", "email", "department_id"]
+    )
+ReferenceDepartment = namedtuple("ReferenceDepartment", ["id", "name"])
+
+# Caches : {clé: (valeur, date d'expiration)}
+_users_by_role = {}
+_departments = {}
+reference_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _lookup(cache: dict, key):
+    """
+    Retourne la valeur en cache si elle n'a pas expiré, sinon None.
+    """
+    cached = cache.get(key)
+    if cached and cached[1] > time.monotonic():
+        reference_cache_stats["hits"] += 1
+        return cached[0]
+    reference_cache_stats["misses"] += 1
+    return None
+
+
+def _store(cache: dict, key, value):
+    """Met une valeur en cache pour REFERENCE_CACHE_TTL_SECONDS."""
+    cache[key] = (value, time.monotonic() + REFERENCE_CACHE_TTL_SECONDS)
+    return value
+
+
+def cached_users_by_role(role: str):
+    """
+    Retourne les utilisateurs du rôle en cache, ou None.
+    """
+    return _lookup(_users_by_role, role)
+
+
+def store_users_by_role(role: str, users: list) -> list:
+    """
+    Met en cache les utilisateurs d'un rôle et retourne leurs copies.
+    """
+    return _store(_users_by_role, role, [
+        ReferenceUser(
+            user.id, user.employee_number, user.complete_name, user.email,
+            user.department_id
+            )
+        for user in users
+    ])
+
+
+def cached_department(name: str):
+    """
+    Retourne le département en cache, ou None.
+    """
+    return _lookup(_departments, name)
+
+
+def store_department(department) -> ReferenceDepartment:
+    """
+    Met en cache un département et retourne sa copie.
+    """
+    return _store(
+        _departments, department.name,
+        ReferenceDepartment(department.id, department.name)
+        )
+
+
+def invalidate_users_by_role():
+    """
+    Vide les listes d'utilisateurs par rôle après une écriture
+    sur les utilisateurs.
+    """
+    _users_by_role.clear()
+
+
+def invalidate_reference_cache():
+    """
+    Vide tout le cache des données de référence.
+    """
+    _users_by_role.clear()
+    _departments.clear()
+
+
+def get_reference_cache_stats() -> dict:
+    """
+    Retourne les statistiques du cache des données de référence.
+    """
+    return dict(
+        reference_cache_stats,
+        roles=len(_users_by_role),
+        departments=len(_departments)
+        )
@@ -0,0 +1,94 @@
+import contextvars
+import inspect
+from functools import wraps
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+# Statistiques par opération : {"nom": {"calls", "round_trips", "last"}}
+round_trip_stats = {}
+# Compteurs des opérations en cours dans le contexte courant (thread ou tâche
+# asyncio) : chaque opération ajoute le sien à la fin du tuple.
+_counters = contextvars.ContextVar("round_trip_counters", default=())
+
+
+def _count_round_trip(*args):
+    """
+    Compte un aller-retour avec la base pour l'opération en cours.
+    """
+    counters = _counters.get()
+    if counters:
+        counters[-1][0] += 1
+
+
+# Chaque requête envoyée et chaque commit/rollback est un aller-retour
+event.listen(Engine, "before_cursor_execute", _count_round_trip)
+event.listen(Engine, "commit", _count_round_trip)
+event.listen(Engine, "rollback", _count_round_trip)
+
+
+def _start():
+    """
+    Ajoute un compteur pour l'opération qui commence.
+    """
+    counter = [0]
+    token = _counters.set(_counters.get() + (counter,))
+    return counter, token
+
+
+def _stop(name: str, counter: list, token):
+    """
+    Retire le compteur de l'opération terminée, reporte ses allers-retours
+    sur l'opération parente et met à jour les statistiques.
+    """
+    _counters.reset(token)
+    count = counter[0]
+    parents = _counters.get()
+    if parents:
+        parents[-1][0] += count
+    stats = round_trip_stats.setdefault(
+        name, {"calls": 0, "round_trips": 0, "last": 0}
+        )
+    stats["calls"] += 1
+    stats["round_trips"] += count
+    stats["last"] = count
+
+
+def track_round_trips(func):
+    """
+    Décorateur qui compte les allers-retours avec la base de données
+    effectués pendant l'appel et les ajoute aux statistiques de l'opération.
+    Fonctionne aussi sur les fonctions asynchrones.
+    """
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            counter, token = _start()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _stop(func.__name__, counter, token)
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        counter, token = _start()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _stop(func.__name__, counter, token)
+    return wrapper
+
+
+def get_round_trip_stats() -> dict:
+    """
+    Retourne une copie des statistiques d'allers-retours par opération.
+    """
+    return {name: dict(stats) for name, stats in round_trip_stats.items()}
+
+
+def reset_round_trip_stats():
+    """
+    Remet à zéro les statistiques d'allers-retours.
+    """
+    round_trip_stats.clear()
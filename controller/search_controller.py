@@ -0,0 +1,116 @@
+import re
+from collections import namedtuple
+from sqlalchemy import func, literal_column, select
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import Session
+from config import read_only
+from authentication.auth_utils import handle_errors
+from authentication.auth_token import get_user_from_token
+from controller.name_search import DEFAULT_SEARCH_LIMIT
+from controller.search_index import (
+    SEARCH_ENTITIES,
+    SEARCH_TABLE,
+    doc_id,
+    search_table
+    )
+
+
+SearchResult = namedtuple(
+    "SearchResult", ["entity", "id", "title", "detail", "score"]
+    )
+
+# Poids du titre et du corps dans le classement BM25 de FTS5
+TITLE_WEIGHT = 10.0
+BODY_WEIGHT = 1.0
+
+
+def search_terms(query: str) -> list:
+    """
+    Découpe la recherche en mots (lettres et chiffres seulement, les
+    opérateurs des syntaxes FTS5 et MySQL ne sont pas transmis).
+    """
+    return re.findall(r"\w+", query)
+
+
+def _ranked_statement(db: Session, table, terms: list):
+    """
+    Requête classée de l'index : chaque mot, pris comme préfixe,
+    doit apparaître dans le titre ou le corps.
+    """
+    columns = [table.c.doc_id, table.c.entity, table.c.title, table.c.body]
+    if db.get_bind().dialect.name == "sqlite":
+        fts_query = " ".join(f'"{term}"*' for term in terms)
+        # bm25 est négatif : plus il est petit, plus le document est pertinent
+        score = func.bm25(
+            literal_column(SEARCH_TABLE), 0.0, TITLE_WEIGHT, BODY_WEIGHT
+            )
+        return (
+            select(*columns, (-score).label("score"))
+            .where(literal_column(SEARCH_TABLE).op("MATCH")(fts_query))
+            .order_by(score)
+        )
+
+    boolean_query = " ".join(f"+{term}*" for term in terms)
+    score = match(
+        table.c.title, table.c.body, against=boolean_query
+        ).in_boolean_mode()
+    return (
+        select(*columns, score.label("score"))
+        .where(score > 0)
+        .order_by(score.desc())
+    )
+
+
+def _result(row) -> SearchResult:
+    return SearchResult(
+        row.entity, row.doc_id // 10, row.title, row.body, row.score
+        )
+
+
+@handle_errors
+@read_only
+def search(
+    db: Session, token: str, query: str, entity: str = None,
+    limit: int = DEFAULT_SEARCH_LIMIT
+) -> list:
+    """
+    Recherche plein texte dans les clients (nom, email, entreprise), les
+    événements (nom, lieu, notes) et les contrats (id). Retourne au plus
+    `limit` SearchResult, les plus pertinents d'abord. `entity` limite la
+    recherche à "client", "contract" ou "event".
+    """
+    get_user_from_token(token, db)
+    if entity is not None and entity not in SEARCH_ENTITIES:
+        raise ValueError(f"Type de recherche inconnu : {entity}")
+    table = search_table(db)
+    if table is None:
+        raise ValueError(
+            "La recherche plein texte demande une base SQLite ou MySQL."
+            )
+
+    terms = search_terms(query)
+    if not terms or limit <= 0:
+        return []
+
+    results = []
+    # Un numéro seul désigne d'abord le contrat de cet id (MySQL n'indexe
+    # pas les mots trop courts)
+    if query.strip().isdigit() and entity in (None, "contract"):
+        exact = db.execute(
+            select(table.c.doc_id, table.c.entity, table.c.title,
+                   table.c.body, literal_column("0").label("score"))
+            .where(table.c.doc_id == doc_id("contract", int(query)))
+        ).first()
+        if exact is not None:
+            results.append(_result(exact))
+
+    statement = _ranked_statement(db, table, terms)
+    if entity is not None:
+        statement = statement.where(table.c.entity == entity)
+    rows = db.execute(statement.limit(limit)).all()
+    found = {(result.entity, result.id) for result in results}
+    results.extend(
+        result for result in map(_result, rows)
+        if (result.entity, result.id) not in found
+    )
+    return results[:limit]
@@ -0,0 +1,200 @@
+from collections import namedtuple
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    MetaData,
+    String,
+    Table,
+    Text,
+    cast,
+    delete,
+    event,
+    func,
+    insert,
+    inspect,
+    literal,
+    select
+    )
+from sqlalchemy.orm import Session
+from config import Base
+from model.client_model import Client
+from model.contract_model import Contract
+from model.event_model import Event
+
+
+SEARCH_TABLE = "search_index"
+
+# Nombre d'id par requête DELETE/INSERT ... IN (...)
+INDEX_CHUNK_SIZE = 500
+
+# Le document d'une ligne a pour clé id * 10 + code de l'entité
+SearchEntity = namedtuple(
+    "SearchEntity", ["code", "model", "title", "body", "columns"]
+    )
+
+SEARCH_ENTITIES = {
+    "client": SearchEntity(
+        1, Client, Client.full_name,
+        Client.email + " " + func.coalesce(Client.company_name, ""),
+        {"full_name", "email", "company_name"},
+    ),
+    "contract": SearchEntity(
+        2, Contract, literal("Contrat ") + cast(Contract.id, String),
+        literal(""), set(),
+    ),
+    "event": SearchEntity(
+        3, Event, Event.event_name,
+        Event.location + " " + func.coalesce(Event.notes, ""),
+        {"event_name", "location", "notes"},
+    ),
+}
+
+# Table plein texte selon le SGBD : FTS5 (SQLite) ou FULLTEXT (MySQL)
+SEARCH_INDEX_DDL = {
+    "sqlite": (
+        f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5("
+        "entity UNINDEXED, title, body, "
+        "tokenize = 'unicode61 remove_diacritics 2')"
+    ),
+    "mysql": (
+        f"CREATE TABLE {SEARCH_TABLE} ("
+        "doc_id BIGINT NOT NULL PRIMARY KEY, "
+        "entity VARCHAR(20) NOT NULL, "
+        "title VARCHAR(500) NOT NULL, "
+        "body TEXT NOT NULL, "
+        "FULLTEXT INDEX ft_search_index (title, body)"
+        ") ENGINE=InnoDB DEFAULT CHARSET=utf8mb4"
+    ),
+}
+
+
+def _search_table(key_column: str) -> Table:
+    """
+    Décrit la table de l'index. La clé du document est le rowid
+    de la table FTS5 et une colonne doc_id sous MySQL.
+    """
+    return Table(
+        SEARCH_TABLE, MetaData(),
+        Column(key_column, BigInteger, key="doc_id", primary_key=True),
+        Column("entity", String(20)),
+        Column("title", String(500)),
+        Column("body", Text),
+    )
+
+
+SEARCH_TABLES = {
+    "sqlite": _search_table("rowid"),
+    "mysql": _search_table("doc_id"),
+}
+
+
+def doc_id(entity: str, entity_id: int) -> int:
+    """Clé du document d'une ligne dans l'index."""
+    return entity_id * 10 + SEARCH_ENTITIES[entity].code
+
+
+def search_table(db: Session):
+    """
+    Retourne la table de l'index pour le moteur de la session,
+    ou None si le SGBD n'est pas pris en charge.
+    """
+    return SEARCH_TABLES.get(db.get_bind().dialect.name)
+
+
+def _documents(entity: str):
+    """
+    Requête qui construit les documents de l'entité à partir de sa table.
+    """
+    spec = SEARCH_ENTITIES[entity]
+    return select(
+        spec.model.id * 10 + spec.code, literal(entity),
+        spec.title, spec.body
+        )
+
+
+def _insert_documents(table: Table, entity: str, *conditions):
+    """
+    INSERT ... SELECT des documents des lignes correspondant aux conditions.
+    """
+    return insert(table).from_select(
+        list(table.c), _documents(entity).where(*conditions)
+        )
+
+
+def _chunks(ids: list):
+    ids = list(ids)
+    for start in range(0, len(ids), INDEX_CHUNK_SIZE):
+        yield ids[start:start + INDEX_CHUNK_SIZE]
+
+
+def index_documents(db: Session, entity: str, ids, new: bool = False) -> None:
+    """
+    (Ré)indexe les lignes de l'entité dans la transaction en cours.
+    Les modifications des objets doivent avoir été envoyées (flush).
+    `new` indique des lignes qui viennent d'être créées : il n'y a
+    pas d'ancien document à supprimer.
+    """
+    table = search_table(db)
+    if table is None:
+        return
+    model = SEARCH_ENTITIES[entity].model
+    for chunk in _chunks(ids):
+        if not new:
+            db.execute(delete(table).where(
+                table.c.doc_id.in_([doc_id(entity, value) for value in chunk])
+                ))
+        db.execute(_insert_documents(table, entity, model.id.in_(chunk)))
+
+
+def remove_documents(db: Session, entity: str, ids) -> None:
+    """
+    Retire de l'index les documents des lignes supprimées.
+    """
+    table = search_table(db)
+    if table is None:
+        return
+    for chunk in _chunks(ids):
+        db.execute(delete(table).where(
+            table.c.doc_id.in_([doc_id(entity, value) for value in chunk])
+            ))
+
+
+def touches_index(entity: str, values: dict) -> bool:
+    """
+    Indique si une mise à jour modifie une colonne indexée de l'entité.
+    """
+    return bool(SEARCH_ENTITIES[entity].columns.intersection(values))
+
+
+def create_search_index(connection) -> bool:
+    """
+    Crée l'index plein texte s'il n'existe pas et y indexe les lignes
+    existantes, dans la transaction de la connexion. Retourne True si
+    l'index a été créé, False s'il existait déjà ou si le SGBD n'est
+    pas pris en charge.
+    """
+    dialect_name = connection.dialect.name
+    table = SEARCH_TABLES.get(dialect_name)
+    inspector = inspect(connection)
+    if table is None or inspector.has_table(SEARCH_TABLE):
+        return False
+    if not all(
+        inspector.has_table(spec.model.__tablename__)
+        for spec in SEARCH_ENTITIES.values()
+    ):
+        # Schéma partiel : l'index sera créé avec les tables indexées
+        return False
+
+    connection.exec_driver_sql(SEARCH_INDEX_DDL[dialect_name])
+    for entity in SEARCH_ENTITIES:
+        connection.execute(_insert_documents(table, entity))
+    return True
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_search_index_with_tables(target, connection, **kw):
+    """
+    L'index est créé avec le schéma (Base.metadata.create_all) : ce
+    n'est pas une table du modèle, FTS5 demandant une table virtuelle.
+    """
+    create_search_index(connection)
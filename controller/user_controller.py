@@ -1,32 +1,112 @@
-from sqlalchemy.orm import Session
-import sentry_sdk
+from sqlalchemy.orm import Session, contains_eager
 from rich.console import Console
 from model.user_model import User, Department
 from datetime import datetime
-from authentication.auth_token import get_user_from_token
+from authentication.auth_token import (
+    bump_permission_version,
+    get_user_from_token,
+    invalidate_token_cache
+    )
+from authentication.auth_service import invalidate_role_cache
+from config import read_only
 from authentication.auth_utils import handle_errors, requires_permission
+from controller.round_trips import track_round_trips
+from controller.loading import apply_loading_profile
+from controller.pagination import DEFAULT_PAGE_SIZE, keyset_page
+from controller.name_search import DEFAULT_SEARCH_LIMIT, search_by_name
+from controller.reference_cache import (
+    cached_department,
+    cached_users_by_role,
+    invalidate_users_by_role,
+    store_department,
+    store_users_by_role
+    )
+from monitoring import capture_message
 
 
 console = Console()
 
+USER_KEYSET = [User.id]
 
-@handle_errors
-def get_all_users(db: Session, token: str):
+# Les requêtes utilisateurs joignent déjà Department : on réutilise la jointure
+USER_LOADING_PROFILES = {
+    "display": (
+        (contains_eager, User.department),
+    ),
+}
+
+
+def _get_department(db: Session, department_name: str):
     """
-    Fonction pour récupérer et afficher tous les
-    utilisateurs de la base de données
+    Récupère un département par son nom, depuis le cache si possible.
     """
-    get_user_from_token(token, db)
-    users = (
+    department = cached_department(department_name)
+    if department is None:
+        found = (
+            db.query(Department)
+            .filter(Department.name == department_name)
+            .first()
+        )
+        if not found:
+            raise ValueError("Département non trouvé")
+        department = store_department(found)
+    return department
+
+
+def _users_query(db: Session, load: str = None):
+    """
+    Construit la requête des utilisateurs affichés (hors managers).
+    """
+    query = (
         db.query(User)
         .join(Department)
         .filter(Department.name != "manager")
-        .all()
     )
+    return apply_loading_profile(query, USER_LOADING_PROFILES, load)
+
+
+@handle_errors
+@read_only
+def get_all_users(db: Session, token: str, load: str = None):
+    """
+    Fonction pour récupérer et afficher tous les
+    utilisateurs de la base de données
+    """
+    get_user_from_token(token, db)
+    users = _users_query(db, load).all()
     return users
 
 
 @handle_errors
+@read_only
+def get_users_page(
+    db: Session, token: str, limit: int = DEFAULT_PAGE_SIZE,
+    after: tuple = None, load: str = None
+):
+    """
+    Récupère une page d'utilisateurs après le curseur `after` (id).
+    """
+    get_user_from_token(token, db)
+    return keyset_page(_users_query(db, load), USER_KEYSET, after, limit)
+
+
+@handle_errors
+@read_only
+def search_users(
+    db: Session, token: str, text: str, limit: int = DEFAULT_SEARCH_LIMIT
+):
+    """
+    Recherche au plus `limit` utilisateurs (hors managers) par début
+    puis partie du nom complet (ou par id si le texte est numérique).
+    """
+    get_user_from_token(token, db)
+    return search_by_name(
+        _users_query(db), User.complete_name, User.id, text, limit
+        )
+
+
+@handle_errors
+@track_round_trips
 @requires_permission("create_user")
 def create_user(
     db: Session, user_id: int, token: str, employee_number: str,
@@ -35,13 +115,7 @@ def create_user(
     """
     Fonction pour créer un nouvel utilisateur dans la base de données
     """
-    department = (
-        db.query(Department)
-        .filter(Department.name == department_name)
-        .first()
-    )
-    if not department:
-        raise ValueError("Département non trouvé")
+    department = _get_department(db, department_name)
 
     new_user = User(
         employee_number=employee_number,
@@ -55,36 +129,62 @@ def create_user(
 
     db.add(new_user)
     db.commit()
-    db.refresh(new_user)
+    invalidate_users_by_role()
 
-    sentry_sdk.capture_message(f"Utilisateur créé: {new_user.complete_name}, ID: {new_user.id}")
+    capture_message(f"Utilisateur créé: {new_user.complete_name}, ID: {new_user.id}")
 
     return new_user
 
 
 @handle_errors
+@track_round_trips
 @requires_permission("update_user")
 def update_user(db: Session, user_id: int, token: str, selected_user_id: int, **kwargs):
     """
     Fonction pour mettre à jour un utilisateur existant.
+    Un changement de département invalide le rôle signé dans ses jetons.
     """
     user_to_update = db.query(User).filter(User.id == selected_user_id).first()
     if not user_to_update:
         return None
 
+    department_name = kwargs.pop("department_name", None)
+    password = kwargs.pop("password", None)
+    department_changed = False
+
+    if department_name is not None:
+        department = (
+            db.query(Department)
+            .filter(Department.name == department_name)
+            .first()
+        )
+        if not department:
+            raise ValueError("Département non trouvé")
+        department_changed = department.id != user_to_update.department_id
+        user_to_update.department = department
+
+    # Un mot de passe vide (champ laissé vide) conserve l'actuel
+    if password:
+        user_to_update.set_password(password)
+
     for key, value in kwargs.items():
         if value is not None:
             setattr(user_to_update, key, value)
 
     db.commit()
-    db.refresh(user_to_update)
+    invalidate_users_by_role()
+    if department_changed:
+        bump_permission_version(user_to_update.id)
+    invalidate_role_cache(user_to_update.id)
+    invalidate_token_cache(user_id=user_to_update.id)
 
-    sentry_sdk.capture_message(f"Utilisateur modifié: {user_to_update.complete_name}, ID: {user_to_update.id}")
+    capture_message(f"Utilisateur modifié: {user_to_update.complete_name}, ID: {user_to_update.id}")
 
     return user_to_update
 
 
 @handle_errors
+@track_round_trips
 @requires_permission("delete_user")
 def delete_user(db: Session, user_id: int, token: str, selected_user_id: int):
     """
@@ -96,21 +196,31 @@ def delete_user(db: Session, user_id: int, token: str, selected_user_id: int):
 
     db.delete(user_to_delete)
     db.commit()
+    invalidate_users_by_role()
+    bump_permission_version(user_to_delete.id)
+    invalidate_role_cache(user_to_delete.id)
+    invalidate_token_cache(user_id=user_to_delete.id)
     return user_to_delete
 
 
+@read_only
 def get_users_by_role(db: Session, role: str):
     """
     Récupère tous les utilisateurs ayant un rôle spécifique.
+    La liste est servie depuis le cache des données de référence.
     """
-    return (
-        db.query(User)
-        .join(Department)
-        .filter(Department.name == role)
-        .all()
-    )
+    users = cached_users_by_role(role)
+    if users is None:
+        users = store_users_by_role(role, (
+            db.query(User)
+            .join(Department)
+            .filter(Department.name == role)
+            .all()
+        ))
+    return users
 
 
+@read_only
 def get_user_by_id(db: Session, user_id: int) -> User:
     """
     Récupère un événement spécifique par son ID.
@@ -118,13 +228,9 @@ def get_user_by_id(db: Session, user_id: int) -> User:
     return db.query(User).filter(User.id == user_id).first()
 
 
+@read_only
 def get_commercials(db: Session):
     """
     Fonction pour récupérer tous les utilisateurs ayant le rôle de commercial.
     """
-    return (
-        db.query(User)
-        .join(Department)
-        .filter(Department.name == "commercial")
-        .all()
-    )
+    return get_users_by_role(db, "commercial")
@@ -0,0 +1,102 @@
+import argparse
+from datetime import datetime
+from config import get_session, remove_session
+from authentication.auth_token import load_token, get_user_from_token
+from controller.contract_controller import contract_filters
+from controller.event_controller import event_filters
+from controller.export_controller import (
+    EXPORT_FORMATS,
+    export_clients,
+    export_contracts,
+    export_events,
+    export_users
+    )
+
+
+def parse_date(value: str) -> datetime:
+    """Convertit une date au format YYYY-MM-DD."""
+    return datetime.strptime(value, "%Y-%m-%d")
+
+
+def build_filters(args) -> list:
+    """Construit les filtres SQL correspondant aux options de la commande."""
+    if args.entity == "events":
+        return event_filters(
+            unassigned=args.unassigned,
+            support_contact_id=args.support_contact_id,
+            date_from=args.date_from,
+            date_to=args.date_to
+        )
+    if args.entity == "contracts":
+        return contract_filters(
+            statut=args.statut,
+            fully_paid=args.fully_paid,
+            date_from=args.date_from,
+            date_to=args.date_to
+        )
+    return []
+
+
+def main():
+    """Fonction principale pour exporter une table dans un fichier."""
+
+    parser = argparse.ArgumentParser(
+        description="Export des clients, contrats, événements ou utilisateurs."
+    )
+    parser.add_argument(
+        "entity", choices=["clients", "contracts", "events", "users"]
+    )
+    parser.add_argument("path", help="Fichier de destination")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="csv")
+    parser.add_argument(
+        "--compression",
+        help="gzip ou bz2 (CSV/JSONL) ; snappy, gzip ou zstd (Parquet)"
+    )
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--unassigned", action="store_true",
+                        help="Événements sans support")
+    parser.add_argument("--support-contact-id", type=int,
+                        help="Événements attribués à ce support")
+    parser.add_argument("--statut", help="Contrats ayant ce statut")
+    parser.add_argument("--fully-paid", action="store_true",
+                        help="Contrats payés intégralement")
+    parser.add_argument("--date-from", type=parse_date,
+                        help="Date de début incluse (YYYY-MM-DD)")
+    parser.add_argument("--date-to", type=parse_date,
+                        help="Date de fin exclue (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    db = get_session()
+    try:
+        token = load_token()
+        if token is None:
+            print("Aucun jeton trouvé. Veuillez vous connecter avec main.py.")
+            return
+        user = get_user_from_token(token, db)
+
+        options = {
+            "path": args.path,
+            "fmt": args.format,
+            "compression": args.compression,
+            "batch_size": args.batch_size,
+        }
+        if args.entity == "clients":
+            count = export_clients(db, user.id, token, **options)
+        elif args.entity == "users":
+            count = export_users(db, user.id, token, **options)
+        elif args.entity == "contracts":
+            count = export_contracts(
+                db, user.id, token, filters=build_filters(args), **options
+            )
+        else:
+            count = export_events(
+                db, user.id, token, filters=build_filters(args), **options
+            )
+    finally:
+        remove_session()
+
+    print(f"{count} ligne(s) exportée(s) dans {args.path}.")
+
+
+if __name__ == "__main__":
+    main()
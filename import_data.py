@@ -0,0 +1,72 @@
+import argparse
+import csv
+from config import get_session, remove_session
+from authentication.auth_token import load_token, get_user_from_token
+from controller.import_controller import (
+    DEFAULT_IMPORT_BATCH_SIZE,
+    import_clients,
+    import_contracts,
+    import_events,
+    iter_rows
+    )
+
+
+IMPORTERS = {
+    "clients": import_clients,
+    "contracts": import_contracts,
+    "events": import_events,
+}
+
+
+def write_report(path: str, errors: list):
+    """Enregistre les lignes rejetées dans un fichier CSV."""
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["ligne", "erreur"])
+        writer.writerows(errors)
+
+
+def main():
+    """Fonction principale pour importer un fichier CSV ou JSONL."""
+
+    parser = argparse.ArgumentParser(
+        description="Import en masse de clients, contrats ou événements."
+    )
+    parser.add_argument("entity", choices=sorted(IMPORTERS))
+    parser.add_argument("path", help="Fichier .csv ou .jsonl à importer")
+    parser.add_argument(
+        "--batch-size", type=int, default=DEFAULT_IMPORT_BATCH_SIZE
+    )
+    parser.add_argument(
+        "--report", help="Fichier CSV où enregistrer les lignes rejetées"
+    )
+    args = parser.parse_args()
+
+    db = get_session()
+    try:
+        token = load_token()
+        if token is None:
+            print("Aucun jeton trouvé. Veuillez vous connecter avec main.py.")
+            return
+        user = get_user_from_token(token, db)
+
+        report = IMPORTERS[args.entity](
+            db, user.id, token, iter_rows(args.path),
+            batch_size=args.batch_size
+        )
+    finally:
+        remove_session()
+
+    print(f"{report['inserted']} ligne(s) importée(s) avec succès.")
+    if report["errors"]:
+        print(f"{len(report['errors'])} ligne(s) rejetée(s).")
+        if args.report:
+            write_report(args.report, report["errors"])
+            print(f"Rapport d'erreurs enregistré dans {args.report}.")
+        else:
+            for line, message in report["errors"]:
+                print(f"Ligne {line} : {message}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,61 @@
-from sqlalchemy.orm import Session
-import sentry_sdk
-from config import SessionLocal
+import importlib
+import threading
 from InquirerPy import inquirer
 from rich.console import Console
-from view.user_view import user_menu
-from view.client_view import client_menu
-from view.contract_view import contract_menu
-from view.event_view import event_menu
-from authentication.auth_service import (
-    can_perform_action,
-    get_current_user_department,
-    login_user
-    )
-from authentication.auth_controller import authenticate_user
-from authentication.auth_token import (
-    load_token,
-    delete_token,
-    check_token_expiry
-    )
-from authentication.auth import login, logout
 
 
-sentry_sdk.init(
-    dsn=(
-        "https://7ca766726f13e2fedaf654f7d4401130@o4507843819405312.ingest"
-        ".de.sentry.io/4507843832053840"),
-    traces_sample_rate=1.0,
-    profiles_sample_rate=1.0,
-)
-
 console = Console()
 current_user_department = None
 current_user_id = None
 
+# Les modules lourds (SQLAlchemy, modèles, Sentry) ne sont pas importés au
+# lancement : ils sont chargés en arrière-plan pendant la saisie des
+# identifiants, et chaque menu est importé à sa première ouverture.
+SERVICE_MODULES = (
+    "config",
+    "monitoring",
+    "authentication.auth",
+    "authentication.auth_service",
+    "authentication.auth_token",
+    )
+MENUS = {
+    "Utilisateur": ("view.user_view", "user_menu", "get_all_users"),
+    "Contrat": ("view.contract_view", "contract_menu", "get_all_contracts"),
+    "Événement": ("view.event_view", "event_menu", "get_all_events"),
+    "Client": ("view.client_view", "client_menu", "get_all_clients"),
+    "Recherche": ("view.search_view", "search_menu", "get_all_clients"),
+}
+
+
+def load_services():
+    """
+    Importe les modules nécessaires à la connexion et initialise Sentry.
+    """
+    for module_name in SERVICE_MODULES:
+        importlib.import_module(module_name)
+    importlib.import_module("monitoring").init_sentry()
+
+
+def preload_services() -> threading.Thread:
+    """
+    Lance load_services dans un thread pour que le chargement se fasse
+    pendant que l'utilisateur saisit ses identifiants.
+    """
+    thread = threading.Thread(
+        target=load_services, name="preload-services", daemon=True
+        )
+    thread.start()
+    return thread
+
+
+def open_menu(choice: str, *args):
+    """
+    Importe le module du menu choisi à la première ouverture puis l'affiche.
+    """
+    module_name, function_name, _ = MENUS[choice]
+    menu = getattr(importlib.import_module(module_name), function_name)
+    menu(*args)
+
 
 def main_menu():
     """
@@ -40,7 +63,9 @@ def main_menu():
     """
     global current_user_department
     global current_user_id
-    db: Session = SessionLocal()
+    preloader = None
+    db = None
+    token = None
 
     try:
         while True:
@@ -56,6 +81,8 @@ def main_menu():
                 ).execute()
 
                 if choice == "Connexion":
+                    if preloader is None:
+                        preloader = preload_services()
                     employee_number = inquirer.text(
                         message="Numéro d'employé:"
                         ).execute()
@@ -63,28 +90,27 @@ def main_menu():
                         message="Mot de passe:"
                         ).execute()
 
-                    user = authenticate_user(db, employee_number, password)
-
-                    if user:
-                        token = login_user(db, employee_number, password)
-
-                        if token:
-                            login(user)
-                            token = load_token()
-                            current_user_department = get_current_user_department(
-                                user.id, db
-                                )
-                            global current_user_id
-                            current_user_id = user.id
-
-                            console.print(
-                                f"\n [blue]Connexion réussie!"
-                                f"Bienvenue {user.complete_name}.[/blue]"
-                                )
-                        else:
-                            console.print(
-                                "[red]Erreur lors de la création du jeton.[/red]"
-                                )
+                    with console.status("Vérification du mot de passe..."):
+                        preloader.join()
+                        from config import get_session
+                        from authentication.auth import login
+                        from authentication.auth_service import (
+                            authenticate_and_login
+                            )
+                        db = get_session()
+                        session = authenticate_and_login(
+                            db, employee_number, password
+                            )
+
+                    if session:
+                        user, token, current_user_department = session
+                        login(user)
+                        current_user_id = user.id
+
+                        console.print(
+                            f"\n [blue]Connexion réussie!"
+                            f"Bienvenue {user.complete_name}.[/blue]"
+                            )
                     else:
                         console.print(
                             "[red]Numéro d'employé ou mot de passe incorrect.[/red]"
@@ -95,6 +121,18 @@ def main_menu():
                     break
 
             else:
+                from config import release_session
+                from authentication.auth import logout
+                from authentication.auth_service import allowed_actions
+                from authentication.auth_token import (
+                    delete_token,
+                    renew_access_token
+                    )
+
+                # Chaque action utilise sa propre transaction : la connexion
+                # est rendue au pool pendant la saisie de l'utilisateur
+                release_session()
+
                 if token is None:
                     console.print(
                         "[red]Aucun jeton trouvé."
@@ -106,7 +144,10 @@ def main_menu():
                     current_user_id = None
                     continue
 
-                if not check_token_expiry(token):
+                try:
+                    # Renouvelle silencieusement un jeton d'accès expiré
+                    token = renew_access_token(token, db)
+                except PermissionError:
                     console.print(
                         "[red]Votre session a expiré."
                         "Vous allez être déconnecté.[/red]"
@@ -118,27 +159,11 @@ def main_menu():
                     token = None
                     continue
 
-                menu_options = []
-                if can_perform_action(
-                    current_user_department, "get_all_users"
-                ):
-                    menu_options.append("Utilisateur")
-
-                if can_perform_action(
-                    current_user_department, "get_all_contracts"
-                ):
-                    menu_options.append("Contrat")
-
-                if can_perform_action(
-                    current_user_department, "get_all_events"
-                ):
-                    menu_options.append("Événement")
-
-                if can_perform_action(
-                    current_user_department, "get_all_clients"
-                ):
-                    menu_options.append("Client")
-
+                actions = allowed_actions(current_user_department)
+                menu_options = [
+                    name for name, (_, _, action) in MENUS.items()
+                    if action in actions
+                ]
                 menu_options.append("Déconnexion")
                 menu_options.append("Quitter")
 
@@ -148,25 +173,11 @@ def main_menu():
                 ).execute()
 
                 try:
-                    if choice == "Utilisateur" and can_perform_action(
-                        current_user_department, "get_all_users"
-                    ):
-                        user_menu(current_user_department, current_user_id, token)
-
-                    elif choice == "Contrat" and can_perform_action(
-                        current_user_department, "get_all_contracts"
-                    ):
-                        contract_menu(current_user_department, current_user_id, token)
-
-                    elif choice == "Événement" and can_perform_action(
-                        current_user_department, "get_all_events"
-                    ):
-                        event_menu(current_user_department, current_user_id, token)
-
-                    elif choice == "Client" and can_perform_action(
-                        current_user_department, "get_all_clients"
-                    ):
-                        client_menu(current_user_department, current_user_id, token)
+                    if choice in MENUS and MENUS[choice][2] in actions:
+                        open_menu(
+                            choice, current_user_department,
+                            current_user_id, token
+                            )
 
                     elif choice == "Déconnexion":
                         delete_token()
@@ -184,7 +195,9 @@ def main_menu():
                     console.print(f"[red]{str(e)}[/red]")
 
     finally:
-        db.close()
+        if db is not None:
+            from config import remove_session
+            remove_session()
 
 
 if __name__ == "__main__":
@@ -1,10 +1,15 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from config import Base
 
 
 class Client(Base):
     __tablename__ = 'clients'
+    __table_args__ = (
+        Index('ix_clients_commercial_contact_id', 'commercial_contact_id'),
+        # Recherche par début de nom dans les listes de sélection
+        Index('ix_clients_full_name', 'full_name'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     full_name = Column(String(255), nullable=False)
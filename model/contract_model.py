@@ -1,10 +1,28 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Numeric, DateTime
+from sqlalchemy import (
+    Column, Integer, String, ForeignKey, Numeric, DateTime, Index
+    )
 from sqlalchemy.orm import relationship
 from config import Base
 
 
+STATUTS_CONTRAT = [
+    "En négociation",
+    "Signé",
+    "En cours",
+    "Terminé",
+    "Annulé"
+]
+
+
 class Contract(Base):
     __tablename__ = 'contracts'
+    __table_args__ = (
+        Index('ix_contracts_client_id', 'client_id'),
+        Index('ix_contracts_commercial_contact_id', 'commercial_contact_id'),
+        Index('ix_contracts_statut_remaining_price',
+              'statut', 'remaining_price'),
+        Index('ix_contracts_creation_date', 'creation_date'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     client_id = Column(
@@ -1,10 +1,21 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import (
+    Column, Integer, String, Text, DateTime, ForeignKey, Index
+    )
 from sqlalchemy.orm import relationship
 from config import Base
 
 
 class Event(Base):
     __tablename__ = 'events'
+    __table_args__ = (
+        Index('ix_events_contract_id', 'contract_id'),
+        Index('ix_events_client_id', 'client_id'),
+        Index('ix_events_date_start', 'date_start'),
+        Index('ix_events_event_name', 'event_name'),
+        # Couvre aussi la clé étrangère support_contact_id seule
+        Index('ix_events_support_contact_id_date_start',
+              'support_contact_id', 'date_start'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     event_name = Column(String(255), nullable=False)
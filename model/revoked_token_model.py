@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, String, DateTime, Index
+from config import Base
+
+
+class RevokedToken(Base):
+    __tablename__ = 'revoked_tokens'
+    __table_args__ = (
+        Index('ix_revoked_tokens_expires_at', 'expires_at'),
+        # Lecture incrémentale de la liste par date de révocation
+        Index('ix_revoked_tokens_revoked_at', 'revoked_at'),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    # Empreinte SHA-256 du jeton : le jeton lui-même n'est jamais stocké
+    token_digest = Column(String(64), unique=True, nullable=False)
+    user_id = Column(Integer, nullable=True)
+    expires_at = Column(DateTime, nullable=False)
+    revoked_at = Column(DateTime, nullable=False)
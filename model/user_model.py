@@ -1,11 +1,21 @@
 import bcrypt
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
-from config import Base
+from config import Base, BCRYPT_ROUNDS
+
+
+def hash_password(raw_password: str) -> str:
+    """Hache un mot de passe avec bcrypt au coût BCRYPT_ROUNDS."""
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    return bcrypt.hashpw(raw_password.encode('utf-8'), salt).decode('utf-8')
 
 
 class User(Base):
     __tablename__ = 'users'
+    __table_args__ = (
+        Index('ix_users_department_id', 'department_id'),
+        Index('ix_users_complete_name', 'complete_name'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     employee_number = Column(String(30), unique=True, nullable=False)
@@ -27,15 +37,24 @@ class User(Base):
         )
 
     def set_password(self, raw_password):
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(raw_password.encode('utf-8'), salt)
-        self.password = hashed.decode('utf-8')
+        self.password = hash_password(raw_password)
 
     def check_password(self, raw_password):
         return bcrypt.checkpw(
             raw_password.encode('utf-8'), self.password.encode('utf-8')
             )
 
+    def password_rounds(self):
+        """Facteur de coût utilisé pour hacher le mot de passe ($2b$12$...)."""
+        try:
+            return int(self.password.split('$')[2])
+        except (AttributeError, IndexError, ValueError):
+            return None
+
+    def needs_rehash(self):
+        """Indique si le mot de passe a été haché avec un autre coût."""
+        return self.password_rounds() != BCRYPT_ROUNDS
+
 
 class Department(Base):
     __tablename__ = 'departments'
@@ -0,0 +1,207 @@
+import atexit
+import inspect
+import queue
+import random
+import threading
+import time
+from datetime import datetime
+from functools import wraps
+import sentry_sdk
+from config import (
+    SENTRY_DSN,
+    SENTRY_ENVIRONMENT,
+    SENTRY_TRACES_SAMPLE_RATE,
+    SENTRY_PROFILES_SAMPLE_RATE,
+    SENTRY_SLOW_OPERATION_MS,
+    SENTRY_QUEUE_SIZE,
+    SENTRY_SHUTDOWN_TIMEOUT
+    )
+
+
+# Envois vers Sentry en attente, traités par un thread dédié
+_capture_queue = queue.Queue(maxsize=SENTRY_QUEUE_SIZE)
+_worker = {"thread": None}
+_worker_lock = threading.Lock()
+capture_stats = {"queued": 0, "sent": 0, "dropped": 0}
+
+
+def init_sentry() -> bool:
+    """
+    Initialise Sentry à partir de la configuration.
+    Retourne False si aucun DSN n'est configuré.
+    """
+    if not SENTRY_DSN:
+        return False
+
+    sentry_sdk.init(
+        dsn=SENTRY_DSN,
+        environment=SENTRY_ENVIRONMENT,
+        # Toutes les opérations sont tracées localement ; le tri est fait
+        # à la fin de chaque transaction par before_send_transaction
+        traces_sampler=traces_sampler,
+        before_send_transaction=keep_transaction,
+        profiles_sample_rate=SENTRY_PROFILES_SAMPLE_RATE,
+    )
+    # Enregistré après Sentry pour vider la file avant son arrêt
+    atexit.register(flush_captures)
+    return True
+
+
+def traces_sampler(sampling_context: dict) -> float:
+    """
+    Suit la décision de la transaction parente, sinon trace l'opération
+    pour pouvoir décider après coup si elle est conservée.
+    """
+    parent_sampled = sampling_context.get("parent_sampled")
+    if parent_sampled is not None:
+        return float(parent_sampled)
+    return 1.0
+
+
+def _timestamp(value) -> float:
+    """Convertit un horodatage d'événement Sentry en secondes."""
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    return float(value)
+
+
+def keep_transaction(event: dict, hint: dict):
+    """
+    Conserve toujours les opérations lentes (au moins
+    SENTRY_SLOW_OPERATION_MS) ou en erreur, et seulement une proportion
+    SENTRY_TRACES_SAMPLE_RATE des autres.
+    """
+    status = event.get("contexts", {}).get("trace", {}).get("status")
+    if status not in (None, "ok"):
+        return event
+
+    try:
+        duration = _timestamp(event["timestamp"]) - _timestamp(
+            event["start_timestamp"]
+            )
+    except (KeyError, TypeError, ValueError):
+        return event
+    if duration * 1000 >= SENTRY_SLOW_OPERATION_MS:
+        return event
+
+    return event if random.random() < SENTRY_TRACES_SAMPLE_RATE else None
+
+
+def trace_operation(func):
+    """
+    Décorateur qui trace l'appel dans une transaction Sentry,
+    ou dans un span si une transaction est déjà en cours.
+    Les coroutines sont tracées jusqu'à la fin de leur exécution.
+    """
+    def start_trace():
+        if sentry_sdk.get_current_span() is not None:
+            return sentry_sdk.start_span(op="controller", name=func.__name__)
+        return sentry_sdk.start_transaction(
+            op="controller", name=func.__name__
+            )
+
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            with start_trace():
+                return await func(*args, **kwargs)
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with start_trace():
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def _send_captures():
+    """
+    Envoie à Sentry les messages et exceptions mis en file,
+    chacun avec le scope copié dans le thread de l'appelant.
+    """
+    while True:
+        kind, payload, scope = _capture_queue.get()
+        try:
+            if kind == "message":
+                sentry_sdk.capture_message(payload, scope=scope)
+            else:
+                sentry_sdk.capture_exception(payload, scope=scope)
+            capture_stats["sent"] += 1
+        except Exception:
+            capture_stats["dropped"] += 1
+        finally:
+            _capture_queue.task_done()
+
+
+def _ensure_worker():
+    """
+    Démarre le thread d'envoi au premier usage.
+    """
+    if _worker["thread"] is not None:
+        return
+    with _worker_lock:
+        if _worker["thread"] is None:
+            thread = threading.Thread(
+                target=_send_captures, name="sentry-capture", daemon=True
+                )
+            thread.start()
+            _worker["thread"] = thread
+
+
+def _caller_scope(kwargs: dict):
+    """
+    Copie les scopes Sentry de l'appelant (isolation puis courant :
+    utilisateur, tags, breadcrumbs, transaction en cours) et y ajoute
+    les paramètres de l'envoi (level, tags, extras...). Le thread d'envoi
+    a ses propres scopes, vides : la copie est faite avant la mise en file.
+    """
+    scope = sentry_sdk.get_isolation_scope().fork()
+    scope.update_from_scope(sentry_sdk.get_current_scope())
+    if kwargs:
+        scope.update_from_kwargs(**kwargs)
+    return scope
+
+
+def _enqueue(kind: str, payload, kwargs: dict) -> bool:
+    """
+    Ajoute un envoi à la file sans jamais attendre.
+    Si la file est pleine, l'envoi est abandonné.
+    """
+    _ensure_worker()
+    try:
+        _capture_queue.put_nowait((kind, payload, _caller_scope(kwargs)))
+    except queue.Full:
+        capture_stats["dropped"] += 1
+        return False
+    capture_stats["queued"] += 1
+    return True
+
+
+def capture_message(message: str, **kwargs) -> bool:
+    """
+    Envoie un message à Sentry en arrière-plan.
+    """
+    return _enqueue("message", message, kwargs)
+
+
+def capture_exception(error: BaseException, **kwargs) -> bool:
+    """
+    Envoie une exception à Sentry en arrière-plan.
+    """
+    return _enqueue("exception", error, kwargs)
+
+
+def flush_captures(timeout: float = SENTRY_SHUTDOWN_TIMEOUT) -> bool:
+    """
+    Attend au plus timeout secondes que la file soit vidée.
+    Retourne True si tous les envois ont été traités.
+    """
+    deadline = time.monotonic() + timeout
+    while _capture_queue.unfinished_tasks:
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.01)
+    sentry_sdk.flush(timeout=max(0.0, deadline - time.monotonic()))
+    return True
@@ -1,9 +1,12 @@
 from sqlalchemy.orm import Session
-from config import SessionLocal, Base
+from config import SessionLocal, Base, get_engine
 from model.user_model import User, Department
 from model.client_model import Client
 from model.contract_model import Contract
 from model.event_model import Event
+from model.revoked_token_model import RevokedToken  # noqa: F401
+# Crée l'index de recherche plein texte avec les tables
+import controller.search_index  # noqa: F401
 import bcrypt
 from datetime import datetime
 
@@ -50,7 +53,7 @@ def main():
     """Fonction principale pour configurer la base de données."""
 
     db = SessionLocal()
-    Base.metadata.create_all(bind=db.bind)
+    Base.metadata.create_all(bind=get_engine())
 
     init_db(db)
 
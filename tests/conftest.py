@@ -0,0 +1,41 @@
+import pytest
+from unittest import mock
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from model.revoked_token_model import RevokedToken
+from authentication import revocation
+from controller.reference_cache import (
+    invalidate_reference_cache,
+    reference_cache_stats
+    )
+
+
+@pytest.fixture(autouse=True)
+def revocation_db():
+    """
+    Liste de révocation vide dans une base SQLite en mémoire.
+    """
+    engine = create_engine(
+        "sqlite://", poolclass=StaticPool,
+        connect_args={"check_same_thread": False}
+    )
+    RevokedToken.__table__.create(bind=engine)
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+
+    revocation.reset_revocation_filter()
+    with mock.patch.object(revocation, "SessionLocal", session_factory):
+        yield session_factory
+    revocation.reset_revocation_filter()
+    engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def empty_reference_cache():
+    """
+    Vide le cache des données de référence et ses compteurs entre les tests.
+    """
+    invalidate_reference_cache()
+    reference_cache_stats.update(hits=0, misses=0)
+    yield
+    invalidate_reference_cache()
@@ -0,0 +1,299 @@
+import asyncio
+import pytest
+from datetime import datetime
+from unittest import mock
+from aiohttp.test_utils import TestClient, TestServer
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from config import Base
+from model.user_model import User, Department
+from model.client_model import Client
+from model.contract_model import Contract
+from model.event_model import Event  # noqa: F401
+from api.server import create_app
+from authentication.auth_service import invalidate_role_cache
+
+
+@pytest.fixture
+def api_engine(tmp_path):
+    """
+    Fonction qui crée une base SQLite (aiosqlite) avec
+    un manager et un support.
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'api.db'}")
+
+    async def setup():
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine) as db:
+            db.add_all([
+                Department(id=2, name="support"),
+                Department(id=4, name="manager"),
+            ])
+            for user_id, number, department_id in (
+                (1, "ma0001", 4), (2, "su0001", 2)
+            ):
+                user = User(
+                    id=user_id, employee_number=number,
+                    complete_name=f"Employé {number}",
+                    email=f"{number}@exemple.com",
+                    department_id=department_id, creation_date=datetime.now()
+                    )
+                with mock.patch("model.user_model.BCRYPT_ROUNDS", 4):
+                    user.set_password("secret")
+                db.add(user)
+            await db.commit()
+
+    asyncio.run(setup())
+    invalidate_role_cache()
+    yield engine
+    asyncio.run(engine.dispose())
+    invalidate_role_cache()
+
+
+def run_api(engine, scenario):
+    """
+    Lance l'application sur un serveur de test et exécute le scénario
+    avec un client HTTP.
+    """
+    def session_factory():
+        return AsyncSession(engine, autoflush=False, expire_on_commit=False)
+
+    async def run():
+        app = create_app(session_factory)
+        app.on_cleanup.clear()
+        async with TestClient(TestServer(app)) as client:
+            return await scenario(client)
+
+    return asyncio.run(run())
+
+
+async def login(client, employee_number: str) -> dict:
+    response = await client.post("/api/login", json={
+        "employee_number": employee_number, "password": "secret"
+    })
+    assert response.status == 200
+    token = (await response.json())["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_login_and_authentication(api_engine):
+    """
+    Test pour la connexion et le refus des requêtes sans jeton valide.
+    """
+    async def scenario(client):
+        refused = await client.post("/api/login", json={
+            "employee_number": "ma0001", "password": "wrong"
+        })
+        anonymous = await client.get("/api/clients")
+        forged = await client.get(
+            "/api/clients", headers={"Authorization": "Bearer abc"}
+            )
+        headers = await login(client, "ma0001")
+        allowed = await client.get("/api/clients", headers=headers)
+        return refused.status, anonymous.status, forged.status, allowed.status
+
+    assert run_api(api_engine, scenario) == (401, 401, 401, 200)
+
+
+def test_login_body_is_validated(api_engine):
+    """
+    Test qu'un corps de connexion invalide est refusé (400)
+    sans vérification du mot de passe.
+    """
+    async def scenario(client):
+        statuses = []
+        for body in (
+            {"employee_number": "ma0001"},
+            {"employee_number": "ma0001", "password": None},
+            {"employee_number": "ma0001", "password": 1234},
+            {"employee_number": "", "password": "secret"},
+            {"employee_number": "ma0001", "password": "faux"},
+        ):
+            response = await client.post("/api/login", json=body)
+            statuses.append(response.status)
+        return statuses
+
+    assert run_api(api_engine, scenario) == [400, 400, 400, 400, 401]
+
+
+def test_clients_pagination(api_engine):
+    """
+    Test pour la création de clients puis leur lecture page par page.
+    """
+    async def scenario(client):
+        headers = await login(client, "ma0001")
+        for letter in "ABCDE":
+            response = await client.post("/api/clients", headers=headers, json={
+                "full_name": f"Client {letter}",
+                "email": f"client{letter}@exemple.com",
+            })
+            assert response.status == 201
+
+        names, cursor = [], None
+        while True:
+            params = {"limit": "2"}
+            if cursor:
+                params["after"] = cursor
+            page = await (await client.get(
+                "/api/clients", headers=headers, params=params
+                )).json()
+            names.append([item["full_name"] for item in page["items"]])
+            cursor = page["next"]
+            if cursor is None:
+                return names
+
+    assert run_api(api_engine, scenario) == [
+        ["Client A", "Client B"], ["Client C", "Client D"], ["Client E"]
+    ]
+
+
+def test_events_paged_by_date(api_engine):
+    """
+    Test pour la pagination des événements triés par date de début.
+    """
+    async def scenario(client):
+        headers = await login(client, "ma0001")
+        async with AsyncSession(api_engine) as db:
+            db.add(Client(
+                id=1, full_name="Client", email="c@exemple.com",
+                creation_date=datetime.now(), last_update=datetime.now()
+                ))
+            db.add(Contract(
+                id=1, client_id=1, commercial_contact_id=1, total_price=10,
+                remaining_price=0, statut="Signé", creation_date=datetime.now()
+                ))
+            await db.commit()
+        for day in (3, 1, 2):
+            response = await client.post("/api/events", headers=headers, json={
+                "event_name": f"Jour {day}", "contract_id": 1,
+                "client_id": 1, "client_name": "Client",
+                "client_contact": "c@exemple.com", "location": "Paris",
+                "date_start": f"2025-06-0{day}T10:00:00",
+                "date_end": f"2025-06-0{day}T18:00:00",
+            })
+            assert response.status == 201
+
+        first = await (await client.get("/api/events", headers=headers, params={
+            "order_by": "date_start", "limit": "2"
+        })).json()
+        second = await (await client.get("/api/events", headers=headers, params={
+            "order_by": "date_start", "limit": "2", "after": first["next"]
+        })).json()
+        return first, second
+
+    first, second = run_api(api_engine, scenario)
+
+    assert [item["event_name"] for item in first["items"]] == [
+        "Jour 1", "Jour 2"
+    ]
+    assert [item["event_name"] for item in second["items"]] == ["Jour 3"]
+    assert second["next"] is None
+
+
+def test_errors(api_engine):
+    """
+    Test pour les réponses d'erreur : permission, validation et 404.
+    """
+    async def scenario(client):
+        support = await login(client, "su0001")
+        manager = await login(client, "ma0001")
+        forbidden = await client.post("/api/users", headers=support, json={
+            "employee_number": "su0002", "complete_name": "Paul Martin",
+            "email": "paul@exemple.com", "password": "Secret123",
+            "department_name": "support",
+        })
+        invalid = await client.post("/api/clients", headers=manager, json={
+            "full_name": "Client", "email": "c@exemple.com", "id": 3
+        })
+        missing = await client.delete("/api/clients/42", headers=manager)
+        users = await (await client.get("/api/users", headers=manager)).json()
+        return forbidden.status, invalid.status, missing.status, users
+
+    forbidden, invalid, missing, users = run_api(api_engine, scenario)
+
+    assert (forbidden, invalid, missing) == (403, 400, 404)
+    assert [user["employee_number"] for user in users["items"]] == ["su0001"]
+    assert "password" not in users["items"][0]
+
+
+def test_validation(api_engine):
+    """
+    Test que les corps des requêtes suivent les règles de saisie du CLI.
+    """
+    async def scenario(client):
+        headers = await login(client, "ma0001")
+        statuses = []
+        for path, body in (
+            ("/api/clients", {"full_name": "Client", "email": "pas-un-email"}),
+            ("/api/clients", {
+                "full_name": "Client", "email": "c@exemple.com",
+                "phone_number": "12ab"
+            }),
+            ("/api/contracts", {
+                "client_id": 1, "commercial_contact_id": 1,
+                "total_price": 100, "remaining_price": 10, "statut": "Payé"
+            }),
+            ("/api/contracts", {
+                "client_id": 1, "commercial_contact_id": 1,
+                "total_price": 100, "remaining_price": 150, "statut": "Signé"
+            }),
+            ("/api/users", {
+                "employee_number": "su0002", "complete_name": "Paul Martin",
+                "email": "paul@exemple.com", "password": "faible",
+                "department_name": "support"
+            }),
+        ):
+            response = await client.post(path, headers=headers, json=body)
+            statuses.append(response.status)
+
+        async with AsyncSession(api_engine) as db:
+            db.add(Client(
+                id=1, full_name="Client", email="c@exemple.com",
+                creation_date=datetime.now(), last_update=datetime.now()
+                ))
+            db.add(Contract(
+                id=1, client_id=1, commercial_contact_id=1, total_price=100,
+                remaining_price=0, statut="Signé", creation_date=datetime.now()
+                ))
+            await db.commit()
+        # Le prix restant est comparé au prix total déjà enregistré
+        update = await client.patch("/api/contracts/1", headers=headers, json={
+            "remaining_price": 150
+        })
+        statuses.append(update.status)
+        return statuses
+
+    assert run_api(api_engine, scenario) == [400] * 6
+
+
+def test_users_pagination(api_engine):
+    """
+    Test que la liste des utilisateurs est paginée comme les autres listes.
+    """
+    async def scenario(client):
+        headers = await login(client, "ma0001")
+        for letter in "AB":
+            response = await client.post("/api/users", headers=headers, json={
+                "employee_number": f"su000{ord(letter) - 63}",
+                "complete_name": f"Support {letter}",
+                "email": f"support{letter}@exemple.com",
+                "password": "Secret123", "department_name": "support",
+            })
+            assert response.status == 201
+
+        first = await (await client.get(
+            "/api/users", headers=headers, params={"limit": "2"}
+            )).json()
+        second = await (await client.get(
+            "/api/users", headers=headers,
+            params={"limit": "2", "after": first["next"]}
+            )).json()
+        return first, second
+
+    first, second = run_api(api_engine, scenario)
+
+    assert [user["employee_number"] for user in first["items"]] == [
+        "su0001", "su0002"
+    ]
+    assert [user["employee_number"] for user in second["items"]] == ["su0003"]
+    assert second["next"] is None
@@ -0,0 +1,173 @@
+import asyncio
+import pytest
+from datetime import datetime
+from unittest import mock
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from config import Base
+from model.user_model import User, Department
+from model.contract_model import Contract  # noqa: F401
+from model.event_model import Event  # noqa: F401
+from controller import async_client_controller, async_user_controller
+from controller.round_trips import (
+    get_round_trip_stats,
+    reset_round_trip_stats
+    )
+
+
+@pytest.fixture
+def async_engine(tmp_path):
+    """
+    Fonction qui crée une base SQLite (aiosqlite) avec un commercial.
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+
+    async def setup():
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine) as db:
+            db.add_all([
+                Department(id=1, name="commercial"),
+                Department(id=4, name="manager"),
+                User(
+                    id=1, employee_number="co0001", complete_name="Jean Bon",
+                    email="bon@exemple.com", password="x", department_id=1,
+                    creation_date=datetime.now()
+                    ),
+                ])
+            await db.commit()
+
+    asyncio.run(setup())
+    reset_round_trip_stats()
+    yield engine
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture(autouse=True)
+def mock_get_current_user_role():
+    """
+    Simule un utilisateur manager pour les vérifications de permission.
+    """
+    with mock.patch(
+        "authentication.auth_utils.get_current_user_role_async",
+        new=mock.AsyncMock(return_value="manager")
+    ):
+        yield
+
+
+def session(engine):
+    return AsyncSession(engine, autoflush=False, expire_on_commit=False)
+
+
+def test_create_and_page_clients(async_engine):
+    """
+    Test pour la création puis la pagination des clients en asynchrone.
+    """
+    async def scenario():
+        async with session(async_engine) as db:
+            for index in range(5):
+                await async_client_controller.create_client(
+                    db, 1, "fake_token", f"Client {index}",
+                    f"client{index}@exemple.com", commercial_contact_id=1
+                    )
+            with mock.patch(
+                "controller.async_client_controller.get_user_from_token_async",
+                new=mock.AsyncMock()
+            ):
+                first = await async_client_controller.get_clients_page(
+                    db, "fake_token", limit=3, load="display"
+                    )
+                second = await async_client_controller.get_clients_page(
+                    db, "fake_token", limit=3, after=(first[-1].id,)
+                    )
+                pages = [
+                    page async for page in
+                    async_client_controller.iter_client_pages(
+                        db, "fake_token", page_size=2
+                        )
+                    ]
+            return first, second, pages
+
+    first, second, pages = asyncio.run(scenario())
+
+    assert [client.full_name for client in first] == [
+        "Client 0", "Client 1", "Client 2"
+    ]
+    assert first[0].commercial_contact.complete_name == "Jean Bon"
+    assert [client.full_name for client in second] == ["Client 3", "Client 4"]
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert get_round_trip_stats()["create_client"]["last"] == 4
+
+
+def test_concurrent_operations(async_engine):
+    """
+    Test que plusieurs opérations concurrentes utilisent chacune
+    leur session et comptent leurs propres allers-retours.
+    """
+    async def create(index):
+        async with session(async_engine) as db:
+            return await async_client_controller.create_client(
+                db, 1, "fake_token", f"Client {index}",
+                f"client{index}@exemple.com"
+                )
+
+    async def scenario():
+        clients = await asyncio.gather(*(create(index) for index in range(10)))
+        async with session(async_engine) as db:
+            count = await async_client_controller.reassign_commercial_contact(
+                db, 1, "fake_token", [client.id for client in clients], 1
+                )
+            stored = await async_client_controller.get_client_by_id(
+                db, clients[0].id
+                )
+        return clients, count, stored
+
+    clients, count, stored = asyncio.run(scenario())
+
+    assert len({client.id for client in clients}) == 10
+    assert count == 10
+    assert stored.commercial_contact_id == 1
+    stats = get_round_trip_stats()["create_client"]
+    assert stats["calls"] == 10
+    assert stats["round_trips"] == 30
+
+
+def test_permission_denied(async_engine):
+    """
+    Test que le décorateur de permission s'applique aux coroutines.
+    """
+    async def scenario():
+        async with session(async_engine) as db:
+            await async_client_controller.create_client(
+                db, 1, "fake_token", "Client", "client@exemple.com"
+                )
+
+    with mock.patch(
+        "authentication.auth_utils.get_current_user_role_async",
+        new=mock.AsyncMock(return_value="support")
+    ):
+        with pytest.raises(PermissionError, match="Action non autorisée"):
+            asyncio.run(scenario())
+
+
+def test_update_user_department(async_engine):
+    """
+    Test pour le changement de département d'un utilisateur en asynchrone.
+    """
+    async def scenario():
+        async with session(async_engine) as db:
+            user = await async_user_controller.update_user(
+                db, 1, "fake_token", 1, department_name="manager"
+                )
+            managers = await async_user_controller.get_users_by_role(
+                db, "manager"
+                )
+        return user, managers
+
+    with mock.patch(
+        "controller.async_user_controller.capture_message"
+    ) as capture:
+        user, managers = asyncio.run(scenario())
+
+    assert user.department_id == 4
+    assert [manager.id for manager in managers] == [1]
+    capture.assert_called_once()
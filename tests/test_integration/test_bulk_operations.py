@@ -0,0 +1,142 @@
+import pytest
+from unittest import mock
+from datetime import datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from config import Base
+from model.user_model import User, Department
+from model.client_model import Client
+from model.contract_model import Contract
+from model.event_model import Event
+from controller.client_controller import reassign_commercial_contact
+from controller.contract_controller import (
+    contract_filters,
+    update_contracts_status
+    )
+from controller.event_controller import (
+    delete_events_of_contract,
+    event_filters,
+    reassign_support_contact,
+    update_events
+    )
+
+
+@pytest.fixture
+def test_db():
+    """
+    Fonction qui crée une base SQLite en mémoire avec
+    deux contrats et leurs événements.
+    """
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+    db.add_all([
+        Department(id=2, name="support"),
+        User(
+            id=5, employee_number="su0005", complete_name="Support",
+            email="su@exemple.com", password="x", department_id=2,
+            creation_date=datetime.now()
+        ),
+        Client(
+            id=1, full_name="Client Test", email="client@exemple.com",
+            creation_date=datetime.now(), last_update=datetime.now()
+        ),
+        Contract(
+            id=1, client_id=1, commercial_contact_id=5, total_price=100,
+            remaining_price=0, creation_date=datetime.now(), statut="Signé"
+        ),
+        Contract(
+            id=2, client_id=1, commercial_contact_id=5, total_price=100,
+            remaining_price=50, creation_date=datetime.now(),
+            statut="En cours"
+        ),
+    ])
+    for index in range(1, 6):
+        db.add(Event(
+            id=index, event_name=f"Event {index}",
+            contract_id=1 if index <= 3 else 2, client_id=1,
+            client_name="Client Test", client_contact="c",
+            date_start=datetime(2024, 1, index),
+            date_end=datetime(2024, 1, index, 12), location="Paris"
+        ))
+    db.commit()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture(autouse=True)
+def mock_get_current_user_role():
+    """
+    Simule un utilisateur manager pour les vérifications de permission.
+    """
+    with mock.patch(
+        "authentication.auth_utils.get_current_user_role",
+        return_value="manager"
+    ) as mocked:
+        yield mocked
+
+
+def test_reassign_support_contact(test_db, mock_get_current_user_role):
+    """Test pour l'attribution groupée d'un support."""
+    count = reassign_support_contact(test_db, 1, "fake_token", [1, 2, 4], 5)
+
+    assert count == 3
+    assert mock_get_current_user_role.call_count == 1
+    assigned = test_db.query(Event.id).filter(
+        Event.support_contact_id == 5
+        ).order_by(Event.id).all()
+    assert [event_id for event_id, in assigned] == [1, 2, 4]
+
+
+def test_update_events_with_filters(test_db):
+    """Test pour la mise à jour groupée d'événements filtrés."""
+    count = update_events(
+        test_db, 1, "fake_token",
+        event_filters(date_from=datetime(2024, 1, 4)), location="Lyon"
+        )
+
+    assert count == 2
+    assert test_db.query(Event).filter(Event.location == "Lyon").count() == 2
+
+
+def test_update_contracts_status(test_db):
+    """Test pour le changement de statut des contrats filtrés."""
+    count = update_contracts_status(
+        test_db, 1, "fake_token", contract_filters(statut="En cours"),
+        "Annulé"
+        )
+
+    assert count == 1
+    assert test_db.get(Contract, 2).statut == "Annulé"
+
+
+def test_delete_events_of_contract(test_db):
+    """Test pour la suppression des événements d'un contrat."""
+    count = delete_events_of_contract(test_db, 1, "fake_token", 1)
+
+    assert count == 3
+    assert test_db.query(Event).count() == 2
+
+
+def test_reassign_commercial_contact(test_db):
+    """Test pour l'attribution groupée d'un commercial."""
+    assert reassign_commercial_contact(test_db, 1, "fake_token", [1], 5) == 1
+    assert test_db.get(Client, 1).commercial_contact_id == 5
+
+
+def test_bulk_update_requires_filter(test_db):
+    """Test qu'une mise à jour groupée sans filtre est refusée."""
+    with pytest.raises(ValueError):
+        update_events(test_db, 1, "fake_token", [], location="Lyon")
+
+
+def test_bulk_update_permission(test_db, mock_get_current_user_role):
+    """Test que la permission est vérifiée pour les opérations groupées."""
+    mock_get_current_user_role.return_value = "commercial"
+
+    with pytest.raises(PermissionError):
+        delete_events_of_contract(test_db, 1, "fake_token", 1)
+    assert test_db.query(Event).count() == 5
@@ -0,0 +1,138 @@
+import csv
+import gzip
+import json
+import pytest
+from unittest import mock
+from datetime import datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from config import Base
+from model.user_model import User, Department
+from model.client_model import Client
+from model.contract_model import Contract
+from model.event_model import Event
+from controller.contract_controller import contract_filters
+from controller.export_controller import (
+    export_contracts,
+    export_events,
+    export_users
+    )
+
+
+@pytest.fixture(scope="module")
+def test_db():
+    """
+    Fonction qui crée une base SQLite en mémoire avec
+    des utilisateurs, des contrats et des événements.
+    """
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+    db.add_all([
+        Department(id=1, name="commercial"),
+        Department(id=4, name="manager"),
+        User(
+            id=1, employee_number="co0001", complete_name="Commercial",
+            email="co@exemple.com", password="secret", department_id=1,
+            creation_date=datetime(2024, 1, 1)
+        ),
+        User(
+            id=2, employee_number="ma0001", complete_name="Manager",
+            email="ma@exemple.com", password="secret", department_id=4,
+            creation_date=datetime(2024, 1, 1)
+        ),
+        Client(
+            id=1, full_name="Client Test", email="client@exemple.com",
+            creation_date=datetime.now(), last_update=datetime.now()
+        ),
+    ])
+    for index in range(1, 6):
+        db.add(Contract(
+            id=index, client_id=1, commercial_contact_id=1,
+            total_price=100, remaining_price=0 if index % 2 else 50,
+            creation_date=datetime(2024, 1, index), statut="Signé"
+        ))
+        db.add(Event(
+            id=index, event_name=f"Event {index}", contract_id=index,
+            client_id=1, client_name="Client Test", client_contact="c",
+            date_start=datetime(2024, 2, index, 10),
+            date_end=datetime(2024, 2, index, 12), location="Paris"
+        ))
+    db.commit()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture(autouse=True)
+def mock_get_current_user_role():
+    """
+    Simule un utilisateur manager pour les vérifications de permission.
+    """
+    with mock.patch(
+        "authentication.auth_utils.get_current_user_role",
+        return_value="manager"
+    ):
+        yield
+
+
+def test_export_contracts_csv_with_filters(test_db, tmp_path):
+    """Test pour l'export CSV des contrats payés intégralement."""
+    path = tmp_path / "contracts.csv"
+
+    count = export_contracts(
+        test_db, 2, "fake_token", str(path),
+        filters=contract_filters(fully_paid=True), batch_size=2
+        )
+
+    with open(path, newline="", encoding="utf-8") as file:
+        rows = list(csv.DictReader(file))
+    assert count == 3
+    assert [row["id"] for row in rows] == ["1", "3", "5"]
+
+
+def test_export_events_jsonl_gzip(test_db, tmp_path):
+    """Test pour l'export JSONL compressé des événements."""
+    path = tmp_path / "events.jsonl.gz"
+
+    count = export_events(
+        test_db, 2, "fake_token", str(path), fmt="jsonl",
+        compression="gzip", batch_size=2
+        )
+
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        records = [json.loads(line) for line in file]
+    assert count == 5
+    assert records[0]["event_name"] == "Event 1"
+    assert records[0]["date_start"] == "2024-02-01T10:00:00"
+
+
+def test_export_users_excludes_password_and_managers(test_db, tmp_path):
+    """Test pour l'export des utilisateurs."""
+    path = tmp_path / "users.csv"
+
+    export_users(test_db, 2, "fake_token", str(path))
+
+    with open(path, newline="", encoding="utf-8") as file:
+        rows = list(csv.DictReader(file))
+    assert [row["employee_number"] for row in rows] == ["co0001"]
+    assert rows[0]["department"] == "commercial"
+    assert "password" not in rows[0]
+
+
+def test_export_contracts_parquet(test_db, tmp_path):
+    """Test pour l'export Parquet des contrats."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "contracts.parquet"
+
+    count = export_contracts(
+        test_db, 2, "fake_token", str(path), fmt="parquet",
+        compression="snappy", batch_size=2
+        )
+
+    table = pq.read_table(path)
+    assert count == 5
+    assert table.num_rows == 5
+    assert table.column("statut").to_pylist() == ["Signé"] * 5
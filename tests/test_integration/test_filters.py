@@ -0,0 +1,111 @@
+import pytest
+from datetime import datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from config import Base
+from model.user_model import User, Department
+from model.client_model import Client
+from model.contract_model import Contract
+from model.event_model import Event
+from controller.event_controller import event_filters, get_all_events
+from controller.contract_controller import (
+    contract_filters,
+    get_all_contracts,
+    iter_contract_pages
+    )
+
+
+@pytest.fixture(scope="module")
+def test_db():
+    """
+    Fonction qui crée une base SQLite en mémoire avec des
+    contrats et des événements aux statuts variés.
+    """
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+    db.add(Department(id=1, name="support"))
+    db.add(User(
+        id=7, employee_number="su0007", complete_name="Support Test",
+        email="support@exemple.com", password="x", department_id=1,
+        creation_date=datetime.now()
+    ))
+    db.add(Client(
+        id=1, full_name="Client Test", email="client@exemple.com",
+        creation_date=datetime.now(), last_update=datetime.now()
+    ))
+    db.add_all([
+        Contract(
+            id=1, client_id=1, commercial_contact_id=7, total_price=100,
+            remaining_price=0, creation_date=datetime(2024, 1, 1),
+            statut="Signé"
+        ),
+        Contract(
+            id=2, client_id=1, commercial_contact_id=7, total_price=100,
+            remaining_price=50, creation_date=datetime(2024, 2, 1),
+            statut="Signé"
+        ),
+        Contract(
+            id=3, client_id=1, commercial_contact_id=7, total_price=100,
+            remaining_price=0, creation_date=datetime(2024, 3, 1),
+            statut="En négociation"
+        ),
+    ])
+    for index, support_id in enumerate([None, 7, None, 7], start=1):
+        db.add(Event(
+            id=index, event_name=f"Event {index}", contract_id=1,
+            client_id=1, client_name="Client Test", client_contact="c",
+            date_start=datetime(2024, index, 1),
+            date_end=datetime(2024, index, 2), location="Paris",
+            support_contact_id=support_id
+        ))
+    db.commit()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def test_unassigned_events(test_db):
+    """Test du filtre des événements sans support."""
+    events = get_all_events(
+        test_db, "fake_token", filters=event_filters(unassigned=True)
+        )
+    assert [event.id for event in events] == [1, 3]
+
+
+def test_events_assigned_to_user_and_date_range(test_db):
+    """Test de la combinaison des filtres sur les événements."""
+    filters = event_filters(support_contact_id=7) + event_filters(
+        date_from=datetime(2024, 3, 1), date_to=datetime(2024, 5, 1)
+        )
+    events = get_all_events(test_db, "fake_token", filters=filters)
+    assert [event.id for event in events] == [4]
+
+
+def test_contract_filters(test_db):
+    """Test des filtres de statut et de paiement des contrats."""
+    signed = get_all_contracts(
+        test_db, "fake_token", filters=contract_filters(statut="Signé")
+        )
+    paid = get_all_contracts(
+        test_db, "fake_token", filters=contract_filters(fully_paid=True)
+        )
+    signed_and_paid = get_all_contracts(
+        test_db, "fake_token",
+        filters=contract_filters(statut="Signé", fully_paid=True)
+        )
+
+    assert [contract.id for contract in signed] == [1, 2]
+    assert [contract.id for contract in paid] == [1, 3]
+    assert [contract.id for contract in signed_and_paid] == [1]
+
+
+def test_contract_pages_with_filters(test_db):
+    """Test de la pagination combinée aux filtres."""
+    pages = list(iter_contract_pages(
+        test_db, "fake_token", page_size=1,
+        filters=contract_filters(date_from=datetime(2024, 2, 1))
+        ))
+    assert [contract.id for page in pages for contract in page] == [2, 3]
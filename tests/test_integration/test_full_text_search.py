@@ -0,0 +1,203 @@
+import pytest
+from unittest import mock
+from datetime import datetime
+from sqlalchemy import create_engine, insert
+from config import Base, SessionLocal
+from model.user_model import User, Department
+from model.client_model import Client
+from model.contract_model import Contract  # noqa: F401
+from model.event_model import Event
+from controller.client_controller import (
+    create_client,
+    delete_client,
+    update_client
+    )
+from controller.contract_controller import create_contract
+from controller.event_controller import (
+    create_event,
+    delete_events_of_contract,
+    update_events
+    )
+from controller.import_controller import import_clients
+from controller.search_controller import search
+
+
+@pytest.fixture
+def test_db():
+    """
+    Fonction qui crée une base SQLite en mémoire (avec son index
+    plein texte) contenant un commercial et un client.
+    """
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal(bind=engine)
+
+    db.add(Department(id=1, name="commercial"))
+    db.add(User(
+        id=1, employee_number="co0001", complete_name="Jean Bon",
+        email="commercial@exemple.com", password="x", department_id=1,
+        creation_date=datetime.now()
+    ))
+    db.commit()
+    with mock.patch(
+        "authentication.auth_utils.get_current_user_role",
+        return_value="manager"
+    ):
+        create_client(
+            db, 1, "fake_token", full_name="Kevin Casey",
+            email="kevin@startup.io", company_name="Cool Startup LLC"
+            )
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture(autouse=True)
+def mock_authentication():
+    """
+    Simule un manager connecté pour les contrôleurs.
+    """
+    with mock.patch(
+        "authentication.auth_utils.get_current_user_role",
+        return_value="manager"
+    ), mock.patch("controller.search_controller.get_user_from_token"):
+        yield
+
+
+def found(db, query: str, entity: str = None) -> list:
+    """Retourne les (entité, id) trouvés dans l'ordre du classement."""
+    return [
+        (result.entity, result.id)
+        for result in search(db, "fake_token", query, entity)
+    ]
+
+
+def add_event(db, **values):
+    """Crée un contrat et un événement du client 1."""
+    contract = create_contract(
+        db, 1, "fake_token", client_id=1, commercial_contact_id=1,
+        total_price=100, remaining_price=0, statut="Signé"
+        )
+    event = create_event(
+        db, 1, "fake_token", contract_id=contract.id, client_id=1,
+        client_name="Kevin Casey", client_contact="kevin@startup.io",
+        date_start=datetime(2024, 6, 4, 13), date_end=datetime(2024, 6, 5, 2),
+        support_contact_id=None, attendees=75, **values
+        )
+    return contract, event
+
+
+def test_prefix_search(test_db):
+    """Test de la recherche par préfixe, sans accents ni casse."""
+    assert found(test_db, "startup") == [("client", 1)]
+    assert found(test_db, "KÉV cas") == [("client", 1)]
+    assert found(test_db, "kevin lyon") == []
+
+
+def test_write_paths_keep_index_in_sync(test_db):
+    """
+    Test que les créations, modifications et suppressions
+    mettent l'index à jour.
+    """
+    client = create_client(
+        test_db, 1, "fake_token", full_name="Anne Marchal",
+        email="anne@exemple.com", company_name="Château Lumière"
+        )
+    assert found(test_db, "chateau") == [("client", client.id)]
+
+    update_client(
+        test_db, 1, "fake_token", client_id=client.id,
+        company_name="Domaine du Lac"
+        )
+    assert found(test_db, "chateau") == []
+    assert found(test_db, "lac") == [("client", client.id)]
+
+    delete_client(test_db, 1, "fake_token", client.id)
+    assert found(test_db, "anne") == []
+
+
+def test_events_and_bulk_writes(test_db):
+    """Test de l'indexation des événements et des écritures groupées."""
+    contract, event = add_event(
+        test_db, event_name="John Quick Wedding",
+        location="53 Rue du Château-Hanap, Lyon", notes="Wedding at 3PM"
+        )
+    assert found(test_db, "lyon") == [("event", event.id)]
+
+    update_events(
+        test_db, 1, "fake_token", [Event.id == event.id], location="Paris"
+        )
+    assert found(test_db, "lyon") == []
+    assert found(test_db, "paris") == [("event", event.id)]
+
+    delete_events_of_contract(test_db, 1, "fake_token", contract.id)
+    assert found(test_db, "wedding") == []
+
+
+def test_ranking_and_entity_filter(test_db):
+    """
+    Test que les correspondances dans le nom passent avant celles du
+    détail et que la recherche peut être limitée à un type.
+    """
+    _, event = add_event(
+        test_db, event_name="Soirée Startup", location="Lyon", notes=None
+        )
+
+    assert found(test_db, "startup") == [("event", event.id), ("client", 1)]
+    assert found(test_db, "startup", "client") == [("client", 1)]
+
+
+def test_contract_id(test_db):
+    """Test qu'un numéro seul retourne d'abord le contrat de cet id."""
+    contract, _ = add_event(
+        test_db, event_name="Salon", location="Lyon", notes=None
+        )
+
+    assert found(test_db, str(contract.id))[0] == ("contract", contract.id)
+    assert found(test_db, str(contract.id), "event") == []
+
+
+def test_imported_rows_are_indexed(test_db):
+    """Test que les lignes importées en masse sont indexées."""
+    rows = [
+        (2, {"full_name": "Paul Importé", "email": "paul@exemple.com",
+             "company_name": "Import SA", "phone_number": None,
+             "commercial_employee_number": "co0001"}, None),
+    ]
+    report = import_clients(test_db, 1, "fake_token", rows)
+
+    assert report["inserted"] == 1
+    results = search(test_db, "fake_token", "import")
+    assert [result.title for result in results] == ["Paul Importé"]
+
+
+@pytest.mark.parametrize("returning", [True, False])
+def test_import_indexes_only_its_rows(test_db, returning):
+    """
+    Test que l'import n'indexe que les lignes qu'il insère, avec ou
+    sans RETURNING : une ligne non indexée existante reste hors index.
+    """
+    test_db.execute(insert(Client), [{
+        "full_name": "Hors Index", "email": "hors@exemple.com",
+        "creation_date": datetime.now(), "last_update": datetime.now()
+        }])
+    test_db.commit()
+    rows = [
+        (2, {"full_name": "Paul Importé", "email": "paul@exemple.com",
+             "company_name": None, "phone_number": None,
+             "commercial_employee_number": "co0001"}, None),
+        (3, {"full_name": "Anne Importée", "email": "anne@exemple.com",
+             "company_name": None, "phone_number": None,
+             "commercial_employee_number": "co0001"}, None),
+    ]
+    with mock.patch.object(
+        test_db.get_bind().dialect, "insert_executemany_returning", returning
+    ):
+        report = import_clients(test_db, 1, "fake_token", rows)
+
+    assert report["inserted"] == 2
+    assert sorted(
+        result.title for result in search(test_db, "fake_token", "import")
+        ) == ["Anne Importée", "Paul Importé"]
+    assert found(test_db, "hors") == []
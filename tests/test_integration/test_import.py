@@ -0,0 +1,133 @@
+import json
+import pytest
+from unittest import mock
+from datetime import datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from config import Base
+from model.user_model import User, Department
+from model.client_model import Client
+from model.contract_model import Contract
+from model.event_model import Event
+from controller.import_controller import (
+    import_clients,
+    import_contracts,
+    import_events,
+    iter_rows
+    )
+
+
+@pytest.fixture
+def test_db():
+    """
+    Fonction qui crée une base SQLite en mémoire avec
+    un commercial et un support.
+    """
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+    db.add_all([
+        Department(id=1, name="commercial"),
+        Department(id=2, name="support"),
+        User(
+            id=1, employee_number="co0001", complete_name="Commercial",
+            email="co@exemple.com", password="x", department_id=1,
+            creation_date=datetime.now()
+        ),
+        User(
+            id=2, employee_number="su0001", complete_name="Support",
+            email="su@exemple.com", password="x", department_id=2,
+            creation_date=datetime.now()
+        ),
+    ])
+    db.commit()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture(autouse=True)
+def mock_get_current_user_role():
+    """
+    Simule un utilisateur manager pour les vérifications de permission.
+    """
+    with mock.patch(
+        "authentication.auth_utils.get_current_user_role",
+        return_value="manager"
+    ):
+        yield
+
+
+def test_import_clients_from_csv(test_db, tmp_path):
+    """Test pour l'import de clients avec rapport d'erreurs."""
+    path = tmp_path / "clients.csv"
+    path.write_text(
+        "full_name,email,phone_number,company_name,commercial_employee_number\n"
+        "Laura Tatouille,laura@exemple.com,0600102030,Tatouille,co0001\n"
+        "Jean Bon,jean@exemple.com,,,\n"
+        "Email Faux,pas-un-email,,,\n"
+        "Doublon,laura@exemple.com,,,\n"
+        "Inconnu,inconnu@exemple.com,,,zz9999\n",
+        encoding="utf-8"
+    )
+
+    report = import_clients(
+        test_db, 1, "fake_token", iter_rows(str(path)), batch_size=2
+        )
+
+    assert report["inserted"] == 2
+    assert [line for line, _ in report["errors"]] == [4, 5, 6]
+    laura = test_db.query(Client).filter_by(email="laura@exemple.com").one()
+    assert laura.commercial_contact_id == 1
+
+
+def test_import_contracts_and_events_from_jsonl(test_db, tmp_path):
+    """Test pour l'import de contrats puis d'événements."""
+    test_db.add(Client(
+        id=10, full_name="Client Test", email="client@exemple.com",
+        creation_date=datetime.now(), last_update=datetime.now()
+    ))
+    test_db.commit()
+
+    contracts_path = tmp_path / "contracts.jsonl"
+    contracts_path.write_text("\n".join([
+        json.dumps({
+            "client_email": "client@exemple.com",
+            "commercial_employee_number": "co0001",
+            "total_price": "1000", "remaining_price": "0", "statut": "Signé"
+        }),
+        json.dumps({
+            "client_email": "client@exemple.com",
+            "commercial_employee_number": "co0001",
+            "total_price": "100", "remaining_price": "500", "statut": "Signé"
+        }),
+        "{pas du json",
+    ]), encoding="utf-8")
+
+    report = import_contracts(
+        test_db, 1, "fake_token", iter_rows(str(contracts_path))
+        )
+    assert report["inserted"] == 1
+    assert [line for line, _ in report["errors"]] == [2, 3]
+
+    contract = test_db.query(Contract).one()
+    events_path = tmp_path / "events.jsonl"
+    events_path.write_text(json.dumps({
+        "contract_id": contract.id, "event_name": "Gala",
+        "client_contact": "client@exemple.com",
+        "date_start": "2024-06-01 18:00", "date_end": "2024-06-01 23:00",
+        "location": "Paris", "attendees": "120",
+        "support_employee_number": "su0001"
+    }), encoding="utf-8")
+
+    report = import_events(
+        test_db, 1, "fake_token", iter_rows(str(events_path))
+        )
+    assert report == {"inserted": 1, "errors": []}
+
+    event = test_db.query(Event).one()
+    assert event.client_id == 10
+    assert event.client_name == "Client Test"
+    assert event.support_contact_id == 2
@@ -0,0 +1,155 @@
+import pytest
+from unittest import mock
+from datetime import datetime
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from config import Base
+from model.user_model import User, Department
+from model.client_model import Client
+from model.contract_model import Contract
+from model.event_model import Event
+from controller.event_controller import get_all_events, iter_event_pages
+from controller.contract_controller import get_all_contracts
+from controller.client_controller import get_all_clients
+from controller.user_controller import get_all_users
+
+
+@pytest.fixture(scope="module")
+def engine():
+    """
+    Fonction qui crée une base SQLite en mémoire avec plusieurs
+    utilisateurs, clients, contrats et événements.
+    """
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    db.add_all([
+        Department(id=1, name="commercial"),
+        Department(id=2, name="support"),
+    ])
+    for index in range(1, 6):
+        db.add(User(
+            id=index, employee_number=f"us000{index}",
+            complete_name=f"User {index}", email=f"user{index}@exemple.com",
+            password="x", department_id=1 if index % 2 else 2,
+            creation_date=datetime.now()
+        ))
+        db.add(Client(
+            id=index, full_name=f"Client {index}",
+            email=f"client{index}@exemple.com",
+            creation_date=datetime.now(), last_update=datetime.now(),
+            commercial_contact_id=index
+        ))
+        db.add(Contract(
+            id=index, client_id=index, commercial_contact_id=index,
+            total_price=100, remaining_price=0,
+            creation_date=datetime.now(), statut="Signé"
+        ))
+        db.add(Event(
+            id=index, event_name=f"Event {index}", contract_id=index,
+            client_id=index, client_name=f"Client {index}",
+            client_contact="c", date_start=datetime(2024, 1, index),
+            date_end=datetime(2024, 1, index, 12), location="Paris",
+            support_contact_id=index
+        ))
+    db.commit()
+    db.close()
+    return engine
+
+
+@pytest.fixture
+def db(engine):
+    """
+    Session neuve pour que chaque test parte d'une identity map vide.
+    """
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def count_queries(engine):
+    """
+    Compte les requêtes SELECT envoyées à la base.
+    """
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture(autouse=True)
+def mock_get_user_from_token():
+    """
+    Simule la vérification du jeton pour les fonctions de listing.
+    """
+    with mock.patch("controller.client_controller.get_user_from_token"), \
+            mock.patch("controller.user_controller.get_user_from_token"):
+        yield
+
+
+def test_events_display_profile(db, count_queries):
+    """Test du nombre de requêtes pour afficher les événements."""
+    events = get_all_events(db, "fake_token", load="display")
+    names = [
+        (event.client.full_name, event.support_contact.complete_name)
+        for event in events
+    ]
+
+    assert len(names) == 5
+    assert len(count_queries) == 1
+
+
+def test_events_without_profile_lazy_loads(db, count_queries):
+    """Test que sans profil les relations sont chargées à la demande."""
+    events = get_all_events(db, "fake_token")
+    for event_row in events:
+        event_row.client.full_name
+
+    assert len(count_queries) > 1
+
+
+def test_event_pages_display_profile(db, count_queries):
+    """Test du nombre de requêtes pour un parcours page par page."""
+    pages = list(iter_event_pages(db, "fake_token", page_size=2, load="display"))
+    for page in pages:
+        for event_row in page:
+            event_row.support_contact.complete_name
+
+    assert len(count_queries) == len(pages)
+
+
+def test_contracts_and_clients_display_profile(db, count_queries):
+    """Test du nombre de requêtes pour les contrats et les clients."""
+    for contract in get_all_contracts(db, "fake_token", load="display"):
+        contract.client.full_name
+        contract.commercial_contact.complete_name
+    for client in get_all_clients(db, "fake_token", load="display"):
+        client.commercial_contact.complete_name
+
+    assert len(count_queries) == 2
+
+
+def test_users_display_profile(db, count_queries):
+    """Test du nombre de requêtes pour afficher les utilisateurs."""
+    users = get_all_users(db, "fake_token", load="display")
+    departments = {user.department.name for user in users}
+
+    assert departments == {"commercial", "support"}
+    assert len(count_queries) == 1
+
+
+def test_unknown_profile(db):
+    """Test d'un profil de chargement inconnu."""
+    with pytest.raises(ValueError):
+        get_all_events(db, "fake_token", load="inconnu")
@@ -0,0 +1,117 @@
+import pytest
+from unittest import mock
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from config import Base
+from model.user_model import User, Department
+from model.client_model import Client
+from model.contract_model import Contract
+from model.event_model import Event
+from controller.event_controller import (
+    get_all_events,
+    get_events_page,
+    iter_event_pages,
+    stream_events
+    )
+from controller.client_controller import iter_client_pages
+
+
+@pytest.fixture(scope="module")
+def test_db():
+    """
+    Fonction qui crée une base de données SQLite en mémoire
+    contenant quelques clients et événements.
+    """
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = SessionLocal()
+
+    db.add(Department(id=1, name="support"))
+    db.add(User(
+        id=1, employee_number="su0001", complete_name="Support Test",
+        email="support@exemple.com", password="x", department_id=1,
+        creation_date=datetime.now()
+    ))
+    db.add(Client(
+        id=1, full_name="Client Test", email="client@exemple.com",
+        creation_date=datetime.now(), last_update=datetime.now()
+    ))
+    db.add(Contract(
+        id=1, client_id=1, commercial_contact_id=1, total_price=100,
+        remaining_price=0, creation_date=datetime.now(), statut="Signé"
+    ))
+    start = datetime(2024, 1, 1, 10, 0)
+    for index in range(1, 8):
+        db.add(Event(
+            id=index, event_name=f"Event {index}", contract_id=1,
+            client_id=1, client_name="Client Test", client_contact="c",
+            # Les dates sont volontairement dans l'ordre inverse des id
+            date_start=start - timedelta(days=index),
+            date_end=start, location="Paris"
+        ))
+    db.commit()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture(autouse=True)
+def mock_get_user_from_token():
+    """
+    Simule la vérification du jeton pour les fonctions de listing.
+    """
+    with mock.patch("controller.client_controller.get_user_from_token"):
+        yield
+
+
+def test_events_page_keyset_on_id(test_db):
+    """Test pour la pagination des événements par id."""
+    first_page = get_events_page(test_db, "fake_token", limit=3)
+    assert [event.id for event in first_page] == [1, 2, 3]
+
+    second_page = get_events_page(
+        test_db, "fake_token", limit=3, after=(first_page[-1].id,)
+        )
+    assert [event.id for event in second_page] == [4, 5, 6]
+
+
+def test_events_page_keyset_on_date_start(test_db):
+    """Test pour la pagination des événements par date de début."""
+    first_page = get_events_page(
+        test_db, "fake_token", limit=3, order_by="date_start"
+        )
+    assert [event.id for event in first_page] == [7, 6, 5]
+
+    last = first_page[-1]
+    second_page = get_events_page(
+        test_db, "fake_token", limit=3, order_by="date_start",
+        after=(last.date_start, last.id)
+        )
+    assert [event.id for event in second_page] == [4, 3, 2]
+
+
+def test_iter_event_pages_covers_all_rows(test_db):
+    """Test pour le parcours complet des événements page par page."""
+    pages = list(iter_event_pages(test_db, "fake_token", page_size=3))
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert [event.id for page in pages for event in page] == list(range(1, 8))
+
+
+def test_stream_events_and_wrapper(test_db):
+    """Test pour le streaming et la fonction historique get_all_events."""
+    streamed = [event.id for event in stream_events(
+        test_db, "fake_token", batch_size=2
+        )]
+
+    assert streamed == list(range(1, 8))
+    assert [event.id for event in get_all_events(test_db, "fake_token")] == streamed
+
+
+def test_iter_client_pages(test_db):
+    """Test pour le parcours des clients page par page."""
+    pages = list(iter_client_pages(test_db, "fake_token", page_size=3))
+    assert [client.id for page in pages for client in page] == [1]
@@ -0,0 +1,120 @@
+import pytest
+from datetime import datetime
+from unittest import mock
+from sqlalchemy import create_engine
+import config
+from config import Base, SessionLocal, get_replica_engines
+from model.user_model import User  # noqa: F401
+from model.client_model import Client
+from model.contract_model import Contract  # noqa: F401
+from model.event_model import Event  # noqa: F401
+from controller.bulk import bulk_update
+from controller.client_controller import get_client_by_id
+
+
+def _add_client(engine, name: str):
+    db = SessionLocal(bind=engine)
+    db.add(Client(
+        id=1, full_name=name, email="client@exemple.com",
+        creation_date=datetime.now(), last_update=datetime.now()
+        ))
+    db.commit()
+    db.close()
+
+
+@pytest.fixture
+def replicas(tmp_path):
+    """
+    Fonction qui crée une base primaire et deux réplicas SQLite.
+    Le client 1 porte le nom de la base qui l'a servi.
+    """
+    primary = create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    urls = [f"sqlite:///{tmp_path / f'replica{i}.db'}" for i in (1, 2)]
+
+    with mock.patch.multiple(
+        config, _engine=primary, _replica_engines=None,
+        DATABASE_REPLICA_URLS=urls, DB_REPLICA_SELECTION="round_robin",
+        routing_stats={"primary": 0, "replica": 0}
+    ):
+        engines = [primary] + get_replica_engines()
+        for engine, name in zip(engines, ("Primaire", "Réplica 1", "Réplica 2")):
+            Base.metadata.create_all(bind=engine)
+            _add_client(engine, name)
+        yield engines
+        for engine in engines:
+            engine.dispose()
+
+
+def _read(db=None) -> str:
+    """Lit le client 1 dans une nouvelle session (ou celle donnée)."""
+    session = db or SessionLocal()
+    try:
+        session.expire_all()
+        return get_client_by_id(session, 1).full_name
+    finally:
+        if db is None:
+            session.close()
+
+
+def test_reads_round_robin(replicas):
+    """
+    Test que les lectures read_only alternent entre les réplicas
+    et que les autres requêtes restent sur le primaire.
+    """
+    assert sorted(_read() for _ in range(4)) == [
+        "Réplica 1", "Réplica 1", "Réplica 2", "Réplica 2"
+    ]
+
+    db = SessionLocal()
+    assert db.query(Client).first().full_name == "Primaire"
+    db.close()
+    assert config.routing_stats == {"primary": 0, "replica": 4}
+
+
+def test_least_loaded(replicas):
+    """
+    Test que le réplica qui a le moins de connexions prêtées est choisi.
+    """
+    busy = replicas[1].connect()
+    try:
+        with mock.patch.object(config, "DB_REPLICA_SELECTION", "least_loaded"):
+            assert {_read() for _ in range(4)} == {"Réplica 2"}
+    finally:
+        busy.close()
+
+
+def test_read_your_writes(replicas):
+    """
+    Test que la session relit le primaire après avoir écrit,
+    puis revient aux réplicas à la fin du délai.
+    """
+    db = SessionLocal()
+    try:
+        db.add(Client(
+            id=2, full_name="Nouveau", email="nouveau@exemple.com",
+            creation_date=datetime.now(), last_update=datetime.now()
+            ))
+        assert get_client_by_id(db, 1).full_name == "Primaire"
+        db.commit()
+        assert _read(db) == "Primaire"
+
+        db.info["sticky_until"] = 0
+        assert _read(db).startswith("Réplica")
+
+        bulk_update(db, Client, [Client.id == 1], {"company_name": "Epic"})
+        assert _read(db) == "Primaire"
+    finally:
+        db.close()
+
+
+def test_without_replicas():
+    """
+    Test que les lectures read_only vont au primaire sans réplica configuré.
+    """
+    primary = create_engine("sqlite://")
+    db = SessionLocal()
+    with mock.patch.multiple(
+        config, _engine=primary, DATABASE_REPLICA_URLS=[]
+    ):
+        assert config.read_only(db.get_bind)() is primary
+    db.close()
@@ -0,0 +1,84 @@
+import pytest
+from unittest import mock
+from sqlalchemy import create_engine
+from config import Base, SessionLocal
+from model.user_model import User  # noqa: F401
+from model.contract_model import Contract  # noqa: F401
+from model.event_model import Event  # noqa: F401
+from controller.client_controller import create_client, update_client
+from controller.round_trips import (
+    get_round_trip_stats,
+    reset_round_trip_stats
+    )
+
+
+@pytest.fixture
+def test_db():
+    """
+    Fonction qui crée une base SQLite en mémoire avec
+    la configuration de session de l'application.
+    """
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal(bind=engine)
+    reset_round_trip_stats()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture(autouse=True)
+def mock_get_current_user_role():
+    """
+    Simule un utilisateur manager pour les vérifications de permission.
+    """
+    with mock.patch(
+        "authentication.auth_utils.get_current_user_role",
+        return_value="manager"
+    ):
+        yield
+
+
+def test_create_client_round_trips(test_db):
+    """
+    Test qu'une création ne coûte qu'un INSERT, l'INSERT de son document
+    de recherche et un commit, sans SELECT pour relire l'objet.
+    """
+    new_client = create_client(
+        db=test_db,
+        user_id=1,
+        token="fake_token",
+        full_name="Laura Tatouille",
+        email="tatouille@exemple.com"
+    )
+
+    assert get_round_trip_stats()["create_client"]["last"] == 3
+    # L'objet en mémoire reste utilisable sans nouvelle requête
+    assert new_client.id is not None
+    assert new_client.full_name == "Laura Tatouille"
+    assert get_round_trip_stats()["create_client"]["last"] == 3
+
+
+def test_update_client_round_trips(test_db):
+    """Test du nombre d'allers-retours pour une mise à jour."""
+    new_client = create_client(
+        db=test_db,
+        user_id=1,
+        token="fake_token",
+        full_name="Laura Tatouille",
+        email="tatouille@exemple.com"
+    )
+
+    updated_client = update_client(
+        db=test_db,
+        user_id=1,
+        token="fake_token",
+        client_id=new_client.id,
+        full_name="Old Tatouille"
+    )
+
+    stats = get_round_trip_stats()["update_client"]
+    assert updated_client.full_name == "Old Tatouille"
+    # SELECT, UPDATE, remplacement du document de recherche et commit
+    assert stats == {"calls": 1, "round_trips": 5, "last": 5}
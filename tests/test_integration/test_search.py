@@ -0,0 +1,161 @@
+import pytest
+from unittest import mock
+from datetime import datetime
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from config import Base
+from model.user_model import User, Department
+from model.client_model import Client
+from model.contract_model import Contract
+from model.event_model import Event
+from controller.client_controller import search_clients
+from controller.contract_controller import search_contracts
+from controller.event_controller import search_events
+from controller.user_controller import search_users
+
+
+CLIENT_NAMES = [
+    "Martin Dupont", "Marie Curie", "Jean Martin", "Anne Marchal",
+    "Paul 100%_Bio", "Paul 100 Bio",
+]
+
+
+@pytest.fixture(scope="module")
+def test_db():
+    """
+    Fonction qui crée une base de données SQLite en mémoire
+    contenant quelques clients, contrats et événements.
+    """
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = SessionLocal()
+
+    db.add(Department(id=1, name="support"))
+    db.add(Department(id=2, name="manager"))
+    db.add(User(
+        id=1, employee_number="su0001", complete_name="Marc Support",
+        email="support@exemple.com", password="x", department_id=1,
+        creation_date=datetime.now()
+    ))
+    db.add(User(
+        id=2, employee_number="ma0001", complete_name="Marc Manager",
+        email="manager@exemple.com", password="x", department_id=2,
+        creation_date=datetime.now()
+    ))
+    for index, name in enumerate(CLIENT_NAMES, start=1):
+        db.add(Client(
+            id=index, full_name=name, email=f"client{index}@exemple.com",
+            creation_date=datetime.now(), last_update=datetime.now()
+        ))
+        db.add(Contract(
+            id=index, client_id=index, commercial_contact_id=1,
+            total_price=100, remaining_price=0,
+            creation_date=datetime.now(), statut="Signé"
+        ))
+        db.add(Event(
+            id=index, event_name=f"Salon {name}", contract_id=index,
+            client_id=index, client_name=name, client_contact="c",
+            date_start=datetime.now(), date_end=datetime.now(),
+            location="Paris"
+        ))
+    db.commit()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture(autouse=True)
+def mock_get_user_from_token():
+    """
+    Simule la vérification du jeton pour les fonctions de recherche.
+    """
+    with mock.patch("controller.client_controller.get_user_from_token"), \
+            mock.patch("controller.user_controller.get_user_from_token"):
+        yield
+
+
+def test_prefix_matches_come_before_contains(test_db):
+    """Test que les noms commençant par le texte sont proposés en premier."""
+    clients = search_clients(test_db, "fake_token", "mar")
+    assert [client.full_name for client in clients] == [
+        "Marie Curie", "Martin Dupont", "Anne Marchal", "Jean Martin"
+    ]
+
+
+def test_search_is_limited(test_db):
+    """Test que chaque recherche retourne au plus `limit` lignes."""
+    queries = []
+
+    def count(conn, cursor, statement, *args):
+        queries.append(statement)
+
+    engine = test_db.get_bind()
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        clients = search_clients(test_db, "fake_token", "mar", limit=1)
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    assert [client.full_name for client in clients] == ["Marie Curie"]
+    # Limite atteinte par le préfixe : pas de recherche par contenu
+    assert len(queries) == 1
+    assert "LIMIT" in queries[0]
+
+
+def test_like_wildcards_are_escaped(test_db):
+    """Test que % et _ saisis sont recherchés tels quels."""
+    clients = search_clients(test_db, "fake_token", "100%_")
+    assert [client.full_name for client in clients] == ["Paul 100%_Bio"]
+
+
+def test_numeric_text_matches_id_first(test_db):
+    """Test qu'un texte numérique retourne d'abord la ligne de cet id."""
+    events = search_events(test_db, "fake_token", "3")
+    assert [event.id for event in events] == [3]
+
+
+def test_id_and_prefix_matches_do_not_share_the_limit(test_db):
+    """
+    Test qu'une ligne trouvée par son id n'est pas comptée une seconde
+    fois par la recherche par préfixe.
+    """
+    test_db.add_all([
+        Client(
+            id=id_, full_name=name, email=f"client{id_}@exemple.com",
+            creation_date=datetime.now(), last_update=datetime.now()
+        )
+        for id_, name in ((7, "7 Lieux"), (8, "77 Studio"))
+    ])
+    test_db.flush()
+    try:
+        found = [
+            client.id
+            for client in search_clients(test_db, "fake_token", "7", limit=2)
+        ]
+    finally:
+        test_db.rollback()
+
+    assert found == [7, 8]
+
+
+def test_empty_text_returns_first_names(test_db):
+    """Test qu'une saisie vide propose les premiers noms par ordre alphabétique."""
+    clients = search_clients(test_db, "fake_token", "", limit=2)
+    assert [client.full_name for client in clients] == [
+        "Anne Marchal", "Jean Martin"
+    ]
+
+
+def test_search_contracts_by_client_name(test_db):
+    """Test de la recherche des contrats par nom du client."""
+    contracts = search_contracts(test_db, "fake_token", "jean")
+    assert [contract.id for contract in contracts] == [3]
+    assert "client" in contracts[0].__dict__
+
+
+def test_search_users_excludes_managers(test_db):
+    """Test que les managers ne sont pas proposés."""
+    users = search_users(test_db, "fake_token", "marc")
+    assert [user.id for user in users] == [1]
@@ -0,0 +1,86 @@
+from datetime import datetime
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.orm import sessionmaker
+from config import Base
+from model.user_model import User  # noqa: F401
+from model.client_model import Client
+from model.contract_model import Contract  # noqa: F401
+from model.event_model import Event  # noqa: F401
+from controller.search_index import SEARCH_TABLE
+from upgrade_db import (
+    create_missing_indexes,
+    create_missing_search_index,
+    create_missing_tables
+    )
+
+
+def test_create_missing_indexes_is_idempotent():
+    """
+    Test pour la création des index sur une base existante
+    qui ne les possède pas encore.
+    """
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+
+    with engine.begin() as connection:
+        connection.exec_driver_sql(
+            "DROP INDEX ix_events_support_contact_id_date_start"
+            )
+        connection.exec_driver_sql("DROP INDEX ix_contracts_client_id")
+
+    created = create_missing_indexes(engine)
+
+    assert created == [
+        "ix_contracts_client_id",
+        "ix_events_support_contact_id_date_start",
+    ]
+    event_indexes = {
+        index["name"]: index["column_names"]
+        for index in inspect(engine).get_indexes("events")
+    }
+    assert event_indexes["ix_events_support_contact_id_date_start"] == [
+        "support_contact_id", "date_start"
+    ]
+
+    assert create_missing_indexes(engine) == []
+
+
+def test_create_missing_tables():
+    """
+    Test pour la création de la table des jetons révoqués
+    sur une base existante.
+    """
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.exec_driver_sql("DROP TABLE revoked_tokens")
+
+    assert create_missing_tables(engine) == ["revoked_tokens"]
+    assert "revoked_tokens" in inspect(engine).get_table_names()
+    assert create_missing_tables(engine) == []
+
+
+def test_create_missing_search_index():
+    """
+    Test pour la création de l'index plein texte sur une base
+    existante : les lignes déjà présentes sont indexées.
+    """
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.exec_driver_sql(f"DROP TABLE {SEARCH_TABLE}")
+    db = sessionmaker(bind=engine)()
+    db.add(Client(
+        full_name="Kevin Casey", email="kevin@startup.io",
+        creation_date=datetime.now(), last_update=datetime.now()
+    ))
+    db.commit()
+    db.close()
+
+    assert create_missing_search_index(engine) is True
+    with engine.connect() as connection:
+        titles = connection.exec_driver_sql(
+            f"SELECT title FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH 'kevin'"
+            ).scalars().all()
+    assert titles == ["Kevin Casey"]
+    assert create_missing_search_index(engine) is False
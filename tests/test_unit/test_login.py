@@ -0,0 +1,103 @@
+import asyncio
+import threading
+import bcrypt
+from unittest import mock
+from authentication import auth_controller
+from authentication.auth_controller import (
+    authenticate_user,
+    authenticate_user_async
+    )
+from authentication.auth_service import authenticate_and_login
+from model.user_model import User, Department
+
+
+def make_user(password="secret", rounds=4):
+    """Crée un utilisateur dont le mot de passe est haché avec un coût donné."""
+    user = User(id=1, employee_number="ab1234", complete_name="Test User")
+    user.department = Department(id=1, name="support")
+    user.password = bcrypt.hashpw(
+        password.encode("utf-8"), bcrypt.gensalt(rounds=rounds)
+        ).decode("utf-8")
+    return user
+
+
+def make_db(user):
+    """Crée une session simulée qui retourne l'utilisateur."""
+    mock_db = mock.Mock()
+    mock_db.query.return_value.filter.return_value.first.return_value = user
+    return mock_db
+
+
+@mock.patch("model.user_model.BCRYPT_ROUNDS", 4)
+@mock.patch(
+    "authentication.auth_service.create_session_tokens",
+    return_value=("access", "refresh")
+    )
+def test_login_checks_password_once(mock_create_session_tokens):
+    """Test que la connexion ne vérifie le mot de passe qu'une fois."""
+    user = make_user()
+    with mock.patch.object(
+        User, "check_password", autospec=True, return_value=True
+    ) as mock_check:
+        session = authenticate_and_login(make_db(user), "ab1234", "secret")
+
+    assert mock_check.call_count == 1
+    assert session == (user, "access", "support")
+    mock_create_session_tokens.assert_called_once_with(1, "support")
+
+
+@mock.patch("model.user_model.BCRYPT_ROUNDS", 4)
+def test_wrong_password():
+    """Test qu'un mauvais mot de passe est refusé."""
+    assert authenticate_user(make_db(make_user()), "ab1234", "faux") is None
+
+
+@mock.patch("model.user_model.BCRYPT_ROUNDS", 5)
+def test_password_is_rehashed_with_configured_rounds():
+    """Test du re-hachage d'un mot de passe haché avec un autre coût."""
+    user = make_user(rounds=4)
+    mock_db = make_db(user)
+
+    assert authenticate_user(mock_db, "ab1234", "secret") is user
+
+    assert user.password_rounds() == 5
+    assert user.check_password("secret")
+    mock_db.commit.assert_called_once()
+
+
+@mock.patch("model.user_model.BCRYPT_ROUNDS", 4)
+def test_password_not_rehashed_with_same_rounds():
+    """Test qu'aucun re-hachage n'a lieu si le coût est inchangé."""
+    user = make_user(rounds=4)
+    mock_db = make_db(user)
+
+    authenticate_user(mock_db, "ab1234", "secret")
+
+    mock_db.commit.assert_not_called()
+
+
+@mock.patch("model.user_model.BCRYPT_ROUNDS", 5)
+def test_async_login_rehashes_off_the_loop():
+    """
+    Test que la connexion asynchrone re-hache aussi un mot de passe au
+    coût dépassé, dans le pool de l'API et non dans la boucle.
+    """
+    user = make_user(rounds=4)
+    mock_db = mock.AsyncMock()
+    mock_db.scalar.return_value = user
+    hashed_in = []
+    original = auth_controller.hash_password
+
+    def hash_password(password):
+        hashed_in.append(threading.current_thread().name)
+        return original(password)
+
+    with mock.patch.object(auth_controller, "hash_password", hash_password):
+        assert asyncio.run(
+            authenticate_user_async(mock_db, "ab1234", "secret")
+            ) is user
+
+    assert user.password_rounds() == 5
+    assert user.check_password("secret")
+    assert hashed_in[0].startswith("bcrypt-api")
+    mock_db.commit.assert_awaited_once()
@@ -0,0 +1,90 @@
+import queue
+import threading
+import time
+from unittest import mock
+import sentry_sdk
+import monitoring
+from monitoring import (
+    capture_message,
+    capture_stats,
+    flush_captures,
+    keep_transaction,
+    traces_sampler
+    )
+
+
+def make_event(duration, status=None):
+    """Crée un événement de transaction Sentry d'une durée donnée."""
+    return {
+        "start_timestamp": "2024-01-01T10:00:00.000000Z",
+        "timestamp": f"2024-01-01T10:00:{duration:09.6f}Z",
+        "contexts": {"trace": {"status": status}},
+    }
+
+
+def test_slow_and_failed_operations_are_kept():
+    """Test que les opérations lentes ou en erreur sont toujours gardées."""
+    with mock.patch.object(monitoring, "SENTRY_TRACES_SAMPLE_RATE", 0.0):
+        assert keep_transaction(make_event(2.0), {}) is not None
+        assert keep_transaction(
+            make_event(0.01, "internal_error"), {}
+            ) is not None
+        assert keep_transaction(make_event(0.01), {}) is None
+
+
+def test_fast_operations_are_sampled():
+    """Test que les opérations rapides suivent le taux configuré."""
+    with mock.patch.object(monitoring, "SENTRY_TRACES_SAMPLE_RATE", 1.0):
+        assert keep_transaction(make_event(0.01), {}) is not None
+    assert traces_sampler({"parent_sampled": False}) == 0.0
+    assert traces_sampler({}) == 1.0
+
+
+def test_capture_does_not_wait_for_sentry():
+    """Test qu'un envoi lent à Sentry ne ralentit pas l'appelant."""
+    with mock.patch(
+        "monitoring.sentry_sdk.capture_message",
+        side_effect=lambda *args, **kwargs: time.sleep(0.2)
+    ) as mock_capture:
+        start = time.perf_counter()
+        assert capture_message("Utilisateur créé")
+        assert time.perf_counter() - start < 0.1
+
+        assert flush_captures(timeout=2)
+    mock_capture.assert_called_once_with("Utilisateur créé", scope=mock.ANY)
+
+
+def test_full_queue_drops_captures():
+    """Test qu'une file pleine abandonne l'envoi au lieu d'attendre."""
+    release = threading.Event()
+    dropped = capture_stats["dropped"]
+    with mock.patch.object(
+        monitoring, "_capture_queue", queue.Queue(maxsize=1)
+    ), mock.patch(
+        "monitoring.sentry_sdk.capture_message",
+        side_effect=lambda *args, **kwargs: release.wait(2)
+    ):
+        monitoring._ensure_worker()
+        results = [capture_message(f"message {index}") for index in range(5)]
+        release.set()
+
+    assert not all(results)
+    assert capture_stats["dropped"] > dropped
+
+
+def test_capture_keeps_caller_scope():
+    """
+    Test que l'envoi en arrière-plan garde les tags et l'utilisateur
+    du scope de l'appelant, avec les paramètres donnés.
+    """
+    with mock.patch("monitoring.sentry_sdk.capture_message") as mock_capture:
+        with sentry_sdk.new_scope() as scope:
+            scope.set_tag("menu", "clients")
+            scope.set_user({"id": 4})
+            capture_message("Utilisateur créé", level="warning")
+        assert flush_captures(timeout=2)
+
+    scope = mock_capture.call_args.kwargs["scope"]
+    assert scope._tags == {"menu": "clients"}
+    assert scope._user == {"id": 4}
+    assert scope._level == "warning"
@@ -0,0 +1,141 @@
+from types import SimpleNamespace
+from unittest import mock
+from model.client_model import Client
+from view import paged_table
+from view.paged_table import (
+    BACK,
+    JUMP_TO_PAGE,
+    NEXT_PAGE,
+    PREVIOUS_PAGE,
+    PagedTable,
+    browse_table,
+    column
+    )
+
+
+ROWS = [SimpleNamespace(id=i, name=f"Client {i}") for i in range(1, 10001)]
+
+
+class FakeController:
+    """
+    Contrôleur simulé qui sert les lignes par pagination par clé
+    et compte les lignes demandées.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, after, limit):
+        self.calls.append((after, limit))
+        start = after[0] if after else 0
+        return ROWS[start:start + limit]
+
+
+def make_table(formatted: list = None) -> PagedTable:
+    """
+    Crée un tableau paginé qui note les lignes dont il formate le nom.
+    """
+    formatted = [] if formatted is None else formatted
+
+    def name(row):
+        formatted.append(row.id)
+        return row.name
+
+    return PagedTable(
+        "Clients",
+        [column("ID", lambda row: str(row.id)), column("Nom", name)],
+        FakeController(), [Client.id], page_size=20
+        )
+
+
+def test_only_visible_page_is_loaded_and_formatted():
+    """
+    Test que seule la page affichée est chargée et formatée,
+    quel que soit le nombre total de lignes.
+    """
+    formatted = []
+    table = make_table(formatted)
+
+    table.load(0)
+    rendered = table.render()
+
+    assert table.fetch_page.calls == [(None, 21)]
+    assert rendered.row_count == 20
+    assert formatted == list(range(1, 21))
+    assert table.has_next
+
+
+def test_navigation():
+    """
+    Test des pages suivante, précédente et du saut vers une page.
+    """
+    table = make_table()
+
+    table.load(0)
+    table.load(1)
+    assert table.rows[0].id == 21
+    table.load(0)
+    assert table.rows[0].id == 1
+
+    assert table.load(9)
+    assert table.rows[0].id == 181
+    # Les pages 2 à 9 sont parcourues une seule fois
+    assert len(table.fetch_page.calls) == 11
+    table.load(4)
+    assert table.fetch_page.calls[-1] == ((80,), 21)
+
+
+def test_jump_past_last_page():
+    """Test qu'un saut trop loin affiche la dernière page."""
+    table = make_table()
+
+    assert not table.load(1000)
+    assert table.page_number == 499
+    assert table.rows[-1].id == 10000
+    assert not table.has_next
+    assert table.navigation_choices() == [
+        PREVIOUS_PAGE, JUMP_TO_PAGE, "Choisir les colonnes", BACK
+    ]
+
+
+def test_select_columns():
+    """Test du choix des colonnes affichées."""
+    table = make_table()
+    table.load(0)
+
+    with mock.patch.object(paged_table.inquirer, "checkbox") as checkbox:
+        checkbox.return_value.execute.return_value = [1]
+        table.select_columns()
+
+    rendered = table.render()
+    assert [item.header for item in rendered.columns] == ["Nom"]
+
+
+def test_browse_table():
+    """Test de la navigation interactive jusqu'au retour au menu."""
+    table = make_table()
+
+    with mock.patch.object(paged_table.inquirer, "select") as select, \
+            mock.patch.object(paged_table, "release_session") as release, \
+            mock.patch.object(paged_table, "console"):
+        select.return_value.execute.side_effect = [
+            NEXT_PAGE, PREVIOUS_PAGE, BACK
+        ]
+        browse_table(table, "Aucun client.")
+
+    assert [after for after, _ in table.fetch_page.calls] == [
+        None, (20,), None
+    ]
+    assert release.call_count == 3
+
+
+def test_browse_empty_table():
+    """Test du message affiché si la liste est vide."""
+    table = PagedTable(
+        "Clients", [column("ID", str)], lambda after, limit: [], [Client.id]
+        )
+
+    with mock.patch.object(paged_table, "console") as console:
+        browse_table(table, "Aucun client.")
+
+    console.print.assert_called_once_with("Aucun client.")
@@ -0,0 +1,37 @@
+from authentication.auth_service import (
+    ACTIONS,
+    allowed,
+    allowed_actions,
+    can_perform_action
+    )
+
+
+def test_manager_can_do_everything():
+    """Test que le manager a accès à toutes les actions."""
+    assert allowed_actions("manager") == frozenset(ACTIONS)
+    assert all(allowed("manager", action) for action in ACTIONS)
+
+
+def test_role_permissions():
+    """Test de quelques permissions de la matrice compilée."""
+    assert can_perform_action("gestion", "create_contract")
+    assert not can_perform_action("gestion", "create_client")
+    assert can_perform_action("commercial", "create_event")
+    assert not can_perform_action("commercial", "update_event")
+    assert can_perform_action("support", "update_event")
+    assert not can_perform_action("support", "delete_event")
+
+
+def test_unknown_role_and_action():
+    """Test des permissions par défaut et des actions inconnues."""
+    assert can_perform_action(None, "get_all_events")
+    assert not can_perform_action(None, "get_all_users")
+    assert not can_perform_action("manager", "action_inconnue")
+
+
+def test_allowed_actions_matches_allowed():
+    """Test que allowed_actions et allowed sont cohérents."""
+    for role in ["gestion", "commercial", "support", "inconnu"]:
+        assert allowed_actions(role) == {
+            action for action in ACTIONS if allowed(role, action)
+        }
@@ -0,0 +1,89 @@
+from unittest import mock
+from controller import reference_cache
+from controller.reference_cache import get_reference_cache_stats
+from controller.user_controller import (
+    create_user,
+    delete_user,
+    get_commercials,
+    get_users_by_role
+    )
+from model.user_model import User, Department
+from model.client_model import Client  # noqa: F401
+from model.contract_model import Contract  # noqa: F401
+from model.event_model import Event  # noqa: F401
+
+
+def make_db(users):
+    """
+    Crée une session simulée qui retourne les utilisateurs d'un rôle.
+    """
+    mock_db = mock.Mock()
+    mock_db.query.return_value.join.return_value.filter.return_value \
+        .all.return_value = users
+    return mock_db
+
+
+def test_users_by_role_are_cached():
+    """Test que la liste d'un rôle n'est lue en base qu'une seule fois."""
+    mock_db = make_db([User(id=2, complete_name="Jean Bon", department_id=1)])
+
+    supports = get_users_by_role(mock_db, "support")
+    assert get_users_by_role(mock_db, "support") == supports
+    assert [(user.id, user.complete_name) for user in supports] == [
+        (2, "Jean Bon")
+    ]
+    mock_db.query.assert_called_once()
+
+    get_commercials(mock_db)
+    assert mock_db.query.call_count == 2
+    stats = get_reference_cache_stats()
+    assert (stats["hits"], stats["roles"]) == (1, 2)
+
+
+def test_cache_expires():
+    """Test que la liste est relue après REFERENCE_CACHE_TTL_SECONDS."""
+    mock_db = make_db([])
+
+    with mock.patch.object(reference_cache, "REFERENCE_CACHE_TTL_SECONDS", 0):
+        get_users_by_role(mock_db, "support")
+        get_users_by_role(mock_db, "support")
+
+    assert mock_db.query.call_count == 2
+
+
+@mock.patch(
+    "authentication.auth_utils.get_current_user_role",
+    return_value="manager"
+    )
+def test_user_writes_invalidate_cache(mock_get_current_user_role):
+    """
+    Test que la création et la suppression d'un utilisateur vident
+    les listes par rôle, et que le département reste en cache.
+    """
+    mock_db = make_db([])
+    get_users_by_role(mock_db, "support")
+    mock_db.query.return_value.filter.return_value.first.return_value = (
+        Department(id=2, name="support")
+    )
+
+    for number in ("su0001", "su0002"):
+        create_user(
+            db=mock_db, user_id=1, token="fake_token",
+            employee_number=number, complete_name="Test User",
+            email=f"{number}@exemple.com", password="Password1",
+            department_name="support"
+        )
+        assert get_reference_cache_stats()["roles"] == 0
+        get_users_by_role(mock_db, "support")
+
+    # Département lu une fois, liste du rôle relue après chaque création
+    assert mock_db.query.return_value.filter.call_count == 1
+    assert mock_db.query.return_value.join.call_count == 3
+
+    mock_db.query.return_value.filter.return_value.first.return_value = (
+        User(id=5, complete_name="Test User")
+    )
+    delete_user(
+        db=mock_db, user_id=1, token="fake_token", selected_user_id=5
+    )
+    assert get_reference_cache_stats()["roles"] == 0
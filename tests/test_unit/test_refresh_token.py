@@ -0,0 +1,127 @@
+import asyncio
+import pytest
+from unittest import mock
+from datetime import timedelta
+from authentication import auth_token
+from authentication.auth_token import (
+    create_jwt_token,
+    create_session_tokens,
+    decode_jwt_token,
+    TokenExpiredError,
+    get_user_from_token,
+    get_user_from_token_async,
+    invalidate_token_cache,
+    load_refresh_token,
+    load_token,
+    renew_access_token,
+    rotate_refresh_token
+    )
+from config import SECRET_KEY_TOKEN, ALGORITHM
+from model.user_model import User
+
+
+@pytest.fixture(autouse=True)
+def token_files(tmp_path):
+    """
+    Enregistre les jetons dans un dossier temporaire.
+    """
+    with mock.patch.object(
+        auth_token, "TOKEN_FILE", str(tmp_path / "token.txt")
+    ), mock.patch.object(
+        auth_token, "REFRESH_TOKEN_FILE", str(tmp_path / "refresh.txt")
+    ):
+        invalidate_token_cache()
+        auth_token._renewed_tokens.clear()
+        yield
+        invalidate_token_cache()
+        auth_token._renewed_tokens.clear()
+
+
+def make_expired_token(user_id=1):
+    """Crée un jeton d'accès déjà expiré."""
+    return create_jwt_token(
+        user_id, SECRET_KEY_TOKEN, ALGORITHM, timedelta(seconds=-10)
+        )
+
+
+def test_session_tokens_are_saved():
+    """Test de l'enregistrement des deux jetons de la session."""
+    access_token, refresh_token = create_session_tokens(1)
+
+    assert load_token() == access_token
+    assert load_refresh_token() == refresh_token
+    assert decode_jwt_token(
+        refresh_token, SECRET_KEY_TOKEN, ALGORITHM, token_type="refresh"
+        )["sub"] == "1"
+
+
+def test_refresh_token_is_not_an_access_token():
+    """Test qu'un jeton de rafraîchissement ne donne pas accès aux données."""
+    _, refresh_token = create_session_tokens(1)
+
+    with pytest.raises(PermissionError, match="Type de jeton invalide."):
+        decode_jwt_token(refresh_token, SECRET_KEY_TOKEN, ALGORITHM)
+
+
+def test_refresh_token_rotation():
+    """Test qu'un jeton de rafraîchissement ne sert qu'une seule fois."""
+    _, refresh_token = create_session_tokens(1)
+
+    _, new_refresh_token = rotate_refresh_token(refresh_token)
+
+    assert new_refresh_token != refresh_token
+    assert load_refresh_token() == new_refresh_token
+    with pytest.raises(PermissionError, match="révoqué"):
+        rotate_refresh_token(refresh_token)
+
+
+def test_expired_access_token_is_renewed_once():
+    """Test du renouvellement silencieux d'un jeton d'accès expiré."""
+    create_session_tokens(1)
+    expired_token = make_expired_token()
+
+    with mock.patch.object(
+        auth_token, "rotate_refresh_token",
+        wraps=auth_token.rotate_refresh_token
+    ) as mock_rotate:
+        renewed = renew_access_token(expired_token)
+        assert renew_access_token(expired_token) == renewed
+
+    assert mock_rotate.call_count == 1
+    assert load_token() == renewed
+    assert decode_jwt_token(renewed, SECRET_KEY_TOKEN, ALGORITHM)["sub"] == "1"
+
+
+def test_expired_token_without_refresh_token():
+    """Test qu'un jeton expiré sans jeton de rafraîchissement est refusé."""
+    with pytest.raises(PermissionError, match="Le jeton a expiré."):
+        renew_access_token(make_expired_token())
+
+
+def test_get_user_from_expired_token():
+    """Test qu'un menu ouvert avec un jeton expiré continue de fonctionner."""
+    create_session_tokens(1)
+    mock_db = mock.Mock()
+    mock_db.query.return_value.filter.return_value.first.return_value = User(
+        id=1, employee_number="ab1234", complete_name="Test User",
+        email="test@exemple.com", department_id=2
+    )
+
+    user = get_user_from_token(make_expired_token(), mock_db)
+
+    assert user.id == 1
+
+
+def test_async_expired_token_is_not_renewed():
+    """
+    Test que la version asynchrone refuse un jeton expiré sans
+    toucher aux jetons locaux du CLI.
+    """
+    _, refresh_token = create_session_tokens(1)
+
+    with mock.patch.object(auth_token, "rotate_refresh_token") as rotate, \
+            pytest.raises(TokenExpiredError):
+        asyncio.run(get_user_from_token_async(make_expired_token(), None))
+
+    rotate.assert_not_called()
+    assert load_refresh_token() == refresh_token
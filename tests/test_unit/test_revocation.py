@@ -0,0 +1,196 @@
+import asyncio
+import pytest
+from unittest import mock
+from datetime import datetime, timedelta
+from authentication import auth_token, revocation
+from authentication.auth_token import (
+    create_jwt_token,
+    create_session_tokens,
+    delete_token,
+    get_user_from_token,
+    invalidate_token_cache,
+    verify_jwt_token
+    )
+from authentication.revocation import (
+    BloomFilter,
+    is_token_revoked,
+    is_token_revoked_async,
+    revocation_stats,
+    revoke_token,
+    token_digest
+    )
+from config import SECRET_KEY_TOKEN, ALGORITHM
+from model.revoked_token_model import RevokedToken
+from model.user_model import User
+
+
+def make_token(user_id=1):
+    """Crée un jeton d'accès valide."""
+    return create_jwt_token(
+        user_id, SECRET_KEY_TOKEN, ALGORITHM, timedelta(minutes=5)
+        )
+
+
+def test_bloom_filter():
+    """Test que le filtre ne manque aucun élément ajouté."""
+    bloom = BloomFilter(1000, 0.01)
+    digests = [token_digest(f"jeton-{index}") for index in range(1000)]
+    for digest in digests:
+        bloom.add(digest)
+
+    assert all(digest in bloom for digest in digests)
+    others = [token_digest(f"autre-{index}") for index in range(1000)]
+    assert sum(digest in bloom for digest in others) < 50
+
+
+def test_valid_token_uses_fast_path(revocation_db):
+    """Test qu'un jeton non révoqué est accepté sans requête."""
+    token = make_token()
+    verify_jwt_token(token, SECRET_KEY_TOKEN, ALGORITHM)
+
+    with mock.patch.object(revocation, "SessionLocal") as mock_session:
+        assert verify_jwt_token(token, SECRET_KEY_TOKEN, ALGORITHM) == 1
+
+    mock_session.assert_not_called()
+    assert revocation_stats["fast_path"] == 2
+
+
+def test_async_check_reads_table_off_the_loop(revocation_db):
+    """
+    Test que la version asynchrone répond depuis la mémoire sur le chemin
+    rapide et ne lit la table que dans un thread.
+    """
+    token = make_token()
+    revoke_token(token)
+    revocation.reset_revocation_filter()
+
+    with mock.patch.object(
+        revocation.asyncio, "to_thread", wraps=asyncio.to_thread
+    ) as to_thread:
+        assert asyncio.run(is_token_revoked_async(token))
+        assert to_thread.call_count == 1
+        with mock.patch.object(revocation, "SessionLocal") as mock_session:
+            assert asyncio.run(is_token_revoked_async(token))
+            assert not asyncio.run(is_token_revoked_async(make_token(2)))
+
+    mock_session.assert_not_called()
+    assert to_thread.call_count == 1
+
+
+def test_revoked_token_is_refused(revocation_db):
+    """Test qu'un jeton révoqué est refusé et enregistré dans la table."""
+    token = make_token()
+
+    assert revoke_token(token)
+    assert not revoke_token(token)
+
+    with pytest.raises(PermissionError, match="révoqué"):
+        verify_jwt_token(token, SECRET_KEY_TOKEN, ALGORITHM)
+    db = revocation_db()
+    assert db.query(RevokedToken).one().token_digest == token_digest(token)
+    db.close()
+
+
+def test_revocation_from_another_process(revocation_db):
+    """Test de la mise à jour périodique du filtre depuis la table."""
+    token = make_token()
+    with mock.patch("authentication.revocation.time.monotonic") as clock:
+        clock.return_value = 1000.0
+        assert not is_token_revoked(token)
+
+        db = revocation_db()
+        db.add(RevokedToken(
+            token_digest=token_digest(token), user_id=1,
+            expires_at=datetime(2100, 1, 1), revoked_at=datetime.now()
+        ))
+        db.commit()
+        db.close()
+
+        assert not is_token_revoked(token)
+        clock.return_value = 1000.0 + 3600
+        assert is_token_revoked(token)
+
+
+def test_late_commit_is_read_again(revocation_db):
+    """
+    Test qu'une révocation validée après la lecture suivante, mais datée
+    d'avant, est tout de même relue (id validés dans le désordre).
+    """
+    token = make_token()
+    with mock.patch("authentication.revocation.time.monotonic") as clock:
+        clock.return_value = 1000.0
+        assert not is_token_revoked(token)
+
+        # La ligne 10 est validée et lue avant la ligne 5
+        db = revocation_db()
+        db.add(RevokedToken(
+            id=10, token_digest=token_digest("autre"), user_id=2,
+            expires_at=datetime(2100, 1, 1), revoked_at=revocation._utcnow()
+        ))
+        db.commit()
+        clock.return_value = 1000.0 + 3600
+        assert not is_token_revoked(token)
+
+        db.add(RevokedToken(
+            id=5, token_digest=token_digest(token), user_id=1,
+            expires_at=datetime(2100, 1, 1),
+            revoked_at=revocation._utcnow() - timedelta(seconds=5)
+        ))
+        db.commit()
+        db.close()
+
+        clock.return_value = 1000.0 + 7200
+        assert is_token_revoked(token)
+
+
+def test_rotation_keeps_caller_transaction(tmp_path):
+    """
+    Test que la révocation du jeton de rafraîchissement n'utilise
+    pas la session de l'appelant.
+    """
+    with mock.patch.object(
+        auth_token, "TOKEN_FILE", str(tmp_path / "token.txt")
+    ), mock.patch.object(
+        auth_token, "REFRESH_TOKEN_FILE", str(tmp_path / "refresh.txt")
+    ):
+        _, refresh_token = create_session_tokens(1)
+        mock_db = mock.Mock()
+        mock_db.query.return_value.filter.return_value.first.return_value = (
+            None
+            )
+        auth_token.rotate_refresh_token(refresh_token, mock_db)
+
+    assert is_token_revoked(refresh_token)
+    mock_db.commit.assert_not_called()
+    mock_db.rollback.assert_not_called()
+
+
+def test_logout_revokes_session(tmp_path):
+    """Test que la déconnexion révoque les deux jetons de la session."""
+    with mock.patch.object(
+        auth_token, "TOKEN_FILE", str(tmp_path / "token.txt")
+    ), mock.patch.object(
+        auth_token, "REFRESH_TOKEN_FILE", str(tmp_path / "refresh.txt")
+    ):
+        access_token, refresh_token = create_session_tokens(1)
+        delete_token()
+
+    assert is_token_revoked(access_token)
+    assert is_token_revoked(refresh_token)
+
+
+def test_cached_token_is_revoked():
+    """Test qu'un jeton déjà en cache est refusé après sa révocation."""
+    invalidate_token_cache()
+    token = make_token()
+    mock_db = mock.Mock()
+    mock_db.query.return_value.filter.return_value.first.return_value = User(
+        id=1, employee_number="ab1234", complete_name="Test User",
+        email="test@exemple.com", department_id=2
+    )
+    get_user_from_token(token, mock_db)
+
+    revoke_token(token)
+
+    with pytest.raises(PermissionError, match="révoqué"):
+        get_user_from_token(token, mock_db)
@@ -0,0 +1,77 @@
+import pytest
+from unittest import mock
+from authentication.auth_service import (
+    get_current_user_role,
+    get_role_cache_stats,
+    invalidate_role_cache,
+    role_cache_stats
+    )
+from controller.user_controller import update_user
+from model.user_model import User, Department
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """
+    Vide le cache des rôles et ses compteurs avant chaque test.
+    """
+    invalidate_role_cache()
+    role_cache_stats.update(hits=0, misses=0)
+    yield
+    invalidate_role_cache()
+
+
+def make_db(department_name):
+    """
+    Crée une session simulée qui retourne un utilisateur du département.
+    """
+    mock_db = mock.Mock()
+    user = User(id=3, complete_name="Test User")
+    user.department = Department(id=1, name=department_name)
+    mock_db.query.return_value.filter.return_value.first.return_value = user
+    return mock_db
+
+
+def test_role_is_cached():
+    """Test que le rôle n'est lu en base qu'une seule fois."""
+    mock_db = make_db("support")
+
+    assert get_current_user_role(3, mock_db, "fake_token") == "support"
+    assert get_current_user_role(3, mock_db, "fake_token") == "support"
+
+    assert mock_db.query.call_count == 1
+    assert get_role_cache_stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_role_cache_expires():
+    """Test que le rôle est relu en base après expiration."""
+    mock_db = make_db("support")
+
+    with mock.patch("authentication.auth_service.time.monotonic") as clock:
+        clock.return_value = 1000.0
+        get_current_user_role(3, mock_db, "fake_token")
+        clock.return_value = 1000.0 + 24 * 3600
+        get_current_user_role(3, mock_db, "fake_token")
+
+    assert mock_db.query.call_count == 2
+
+
+@mock.patch(
+    "authentication.auth_utils.can_perform_action", return_value=True
+    )
+def test_update_user_invalidates_cache(mock_can_perform_action):
+    """Test que la modification d'un utilisateur invalide son rôle."""
+    mock_db = make_db("support")
+    get_current_user_role(3, mock_db, "fake_token")
+
+    update_user(
+        db=mock_db,
+        user_id=3,
+        token="fake_token",
+        selected_user_id=3,
+        complete_name="New Name"
+    )
+
+    assert get_role_cache_stats()["size"] == 0
+    mock_db.query.return_value.filter.return_value.first.return_value = None
+    assert get_current_user_role(3, mock_db, "fake_token") is None
@@ -0,0 +1,95 @@
+import pytest
+from unittest import mock
+from datetime import timedelta
+from authentication import auth_token
+from authentication.auth_token import (
+    bump_permission_version,
+    create_jwt_token,
+    get_role_claim
+    )
+from authentication.auth_utils import requires_permission
+from controller.user_controller import update_user
+from config import SECRET_KEY_TOKEN, ALGORITHM
+from model.user_model import User, Department
+
+
+def make_token(user_id=3, role="support"):
+    """Crée un jeton d'accès contenant le rôle de l'utilisateur."""
+    return create_jwt_token(
+        user_id, SECRET_KEY_TOKEN, ALGORITHM, timedelta(minutes=5), role=role
+        )
+
+
+@requires_permission("update_event")
+def protected_action(db, user_id, token):
+    """Action protégée utilisée par les tests."""
+    return "ok"
+
+
+@pytest.fixture(autouse=True)
+def reset_versions():
+    """
+    Remet à zéro les versions des droits avant chaque test.
+    """
+    auth_token._permission_versions.clear()
+    yield
+    auth_token._permission_versions.clear()
+
+
+def test_role_claim():
+    """Test de la lecture du rôle signé dans le jeton."""
+    token = make_token()
+
+    assert get_role_claim(token, 3) == "support"
+    assert get_role_claim(token, 4) is None
+    assert get_role_claim("fake_token", 3) is None
+    assert get_role_claim(make_token(role=None), 3) is None
+
+
+@mock.patch("authentication.auth_utils.get_current_user_role")
+def test_permission_from_claim_without_query(mock_get_current_user_role):
+    """Test que l'autorisation n'interroge pas la base."""
+    mock_db = mock.Mock()
+
+    assert protected_action(mock_db, 3, make_token()) == "ok"
+
+    mock_get_current_user_role.assert_not_called()
+    mock_db.query.assert_not_called()
+
+
+@mock.patch(
+    "authentication.auth_utils.get_current_user_role",
+    return_value="commercial"
+    )
+def test_bumped_version_falls_back_to_database(mock_get_current_user_role):
+    """Test qu'un jeton émis avant un changement de droits est revérifié."""
+    token = make_token()
+    bump_permission_version(3)
+
+    assert get_role_claim(token, 3) is None
+    with pytest.raises(PermissionError):
+        protected_action(mock.Mock(), 3, token)
+    mock_get_current_user_role.assert_called_once()
+    assert get_role_claim(make_token(role="commercial"), 3) == "commercial"
+
+
+@mock.patch(
+    "authentication.auth_utils.get_current_user_role",
+    return_value="manager"
+    )
+def test_update_user_department_bumps_version(mock_get_current_user_role):
+    """Test que le changement de département invalide le rôle du jeton."""
+    user = User(id=3, complete_name="Test User", department_id=2)
+    mock_db = mock.Mock()
+    mock_db.query.return_value.filter.return_value.first.side_effect = [
+        user, Department(id=1, name="commercial")
+    ]
+    token = make_token()
+
+    update_user(
+        db=mock_db, user_id=1, token="fake_token", selected_user_id=3,
+        department_name="commercial"
+    )
+
+    assert user.department.name == "commercial"
+    assert get_role_claim(token, 3) is None
@@ -0,0 +1,138 @@
+import asyncio
+from types import SimpleNamespace
+from unittest import mock
+from prompt_toolkit.document import Document
+from config import SEARCH_RESULT_LIMIT
+from view import search_select as module
+from view.search_select import NEW_SEARCH, SearchCompleter, search_select
+
+
+ROWS = [SimpleNamespace(id=i, name=f"Client {i:05d}") for i in range(1, 100001)]
+
+
+class FakeSearch:
+    """
+    Recherche simulée par préfixe qui note les textes recherchés.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, text, limit):
+        self.calls.append((text, limit))
+        found = []
+        for row in ROWS:
+            if row.name.lower().startswith(text.lower()):
+                found.append(row)
+                if len(found) == limit:
+                    break
+        return found
+
+
+def label(row):
+    return f"{row.id} - {row.name}"
+
+
+def test_completions_are_limited_and_cached():
+    """
+    Test que les propositions sont limitées et que la recherche
+    n'est relancée que si le texte saisi change.
+    """
+    search = FakeSearch()
+    completer = SearchCompleter(search, label, limit=5)
+
+    with mock.patch.object(module, "release_session"):
+        first = list(completer.get_completions(Document("client 0"), None))
+        again = list(completer.get_completions(Document("client 0"), None))
+        list(completer.get_completions(Document("client 001"), None))
+
+    assert [completion.text for completion in first] == [
+        "1 - Client 00001", "2 - Client 00002", "3 - Client 00003",
+        "4 - Client 00004", "5 - Client 00005"
+    ]
+    assert [completion.text for completion in again] == [
+        completion.text for completion in first
+    ]
+    assert search.calls == [("client 0", 5), ("client 001", 5)]
+
+
+def test_lookup_waits_for_typing_pause():
+    """
+    Test que la recherche n'est lancée qu'une fois la frappe
+    interrompue pendant le délai prévu.
+    """
+    search = FakeSearch()
+    completer = SearchCompleter(search, label, limit=5, debounce=0)
+
+    async def complete(typed, current):
+        app = SimpleNamespace(current_buffer=SimpleNamespace(text=current))
+        with mock.patch.object(module, "get_app", return_value=app), \
+                mock.patch.object(module, "release_session"):
+            return [
+                completion.text async for completion in
+                completer.get_completions_async(Document(typed), None)
+            ]
+
+    assert asyncio.run(complete("client 0", "client 00")) == []
+    assert search.calls == []
+    assert len(asyncio.run(complete("client 00", "client 00"))) == 5
+    assert search.calls == [("client 00", 5)]
+
+
+def test_no_completion_for_empty_text():
+    """Test qu'aucune recherche n'est lancée tant que rien n'est saisi."""
+    search = FakeSearch()
+    completer = SearchCompleter(search, label)
+
+    assert list(completer.get_completions(Document(""), None)) == []
+    assert search.calls == []
+
+
+def test_search_select_accepts_completion():
+    """Test qu'une proposition acceptée retourne directement son id."""
+    search = FakeSearch()
+
+    def type_and_accept(message, completer, **kwargs):
+        # L'utilisateur tape "client 0004" puis accepte une proposition
+        list(completer.get_completions(Document("client 0004"), None))
+        return mock.Mock(**{"execute.return_value": "42 - Client 00042"})
+
+    with mock.patch.object(module.inquirer, "text", type_and_accept), \
+            mock.patch.object(module.inquirer, "select") as select, \
+            mock.patch.object(module, "release_session"):
+        selected = search_select("Client :", search, label)
+
+    assert selected == 42
+    assert search.calls == [("client 0004", SEARCH_RESULT_LIMIT)]
+    select.assert_not_called()
+
+
+def test_search_select_partial_text():
+    """
+    Test qu'un texte partiel propose les résultats limités,
+    puis qu'une nouvelle recherche est possible.
+    """
+    with mock.patch.object(module.inquirer, "text") as text, \
+            mock.patch.object(module.inquirer, "select") as select, \
+            mock.patch.object(module, "release_session"), \
+            mock.patch.object(module, "console"):
+        text.return_value.execute.side_effect = ["client 0999", "client 1"]
+        select.return_value.execute.side_effect = [NEW_SEARCH, 10000]
+        selected = search_select("Client :", FakeSearch(), label, limit=3)
+
+    assert selected == 10000
+    first_choices = select.call_args_list[0].kwargs["choices"]
+    assert [choice.value for choice in first_choices] == [
+        9990, 9991, 9992, NEW_SEARCH, None
+    ]
+
+
+def test_search_select_back():
+    """Test qu'une saisie vide revient en arrière."""
+    search = FakeSearch()
+    with mock.patch.object(module.inquirer, "text") as text, \
+            mock.patch.object(module, "release_session"):
+        text.return_value.execute.return_value = ""
+        assert search_select("Client :", search, label) is None
+
+    assert search.calls == []
@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+
+def run_python(code: str, env: dict = None) -> str:
+    """
+    Exécute du code dans un nouvel interpréteur à la racine du projet,
+    avec les variables d'environnement `env` en plus de celles du test.
+    """
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, check=True, cwd=ROOT,
+        env=dict(os.environ, **(env or {}))
+    ).stdout.strip()
+
+
+def test_main_does_not_import_heavy_modules():
+    """Test que le lancement n'importe ni SQLAlchemy, ni Sentry, ni les menus."""
+    loaded = run_python(
+        "import sys, main\n"
+        "heavy = ('sqlalchemy', 'sentry_sdk', 'config', 'view.user_view',"
+        " 'view.client_view', 'view.contract_view', 'view.event_view')\n"
+        "print(','.join(name for name in heavy if name in sys.modules))"
+    )
+
+    assert loaded == ""
+
+
+def test_engine_is_created_on_first_query(tmp_path):
+    """Test que le moteur n'est créé qu'à la première requête."""
+    database_url = f"sqlite:///{tmp_path / 'epicevent.db'}"
+    output = run_python(
+        "import config\n"
+        "from sqlalchemy import text\n"
+        "print(config._engine is None)\n"
+        "db = config.SessionLocal()\n"
+        "print(config._engine is None)\n"
+        "db.execute(text('SELECT 1'))\n"
+        "print(config._engine is None)",
+        env={"DATABASE_URL": database_url}
+    )
+
+    assert output.split() == ["True", "True", "False"]
@@ -0,0 +1,93 @@
+import pytest
+from unittest import mock
+from datetime import timedelta
+from authentication import auth_token
+from authentication.auth_token import (
+    create_jwt_token,
+    get_user_from_token,
+    invalidate_token_cache,
+    token_cache_stats
+    )
+from config import SECRET_KEY_TOKEN, ALGORITHM
+from model.user_model import User
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """
+    Vide le cache des jetons et ses compteurs avant chaque test.
+    """
+    invalidate_token_cache()
+    token_cache_stats.update(hits=0, misses=0)
+    yield
+    invalidate_token_cache()
+
+
+def make_token(user_id=1, minutes=5):
+    """Crée un jeton valide pour l'utilisateur."""
+    return create_jwt_token(
+        user_id=user_id,
+        secret_key=SECRET_KEY_TOKEN,
+        algorithm=ALGORITHM,
+        expires_delta=timedelta(minutes=minutes)
+    )
+
+
+def make_db(user_id=1):
+    """Crée une session simulée qui retourne un utilisateur."""
+    mock_db = mock.Mock()
+    mock_db.query.return_value.filter.return_value.first.return_value = User(
+        id=user_id, employee_number="ab1234", complete_name="Test User",
+        email="test@exemple.com", department_id=2
+    )
+    return mock_db
+
+
+def test_verified_token_is_cached():
+    """Test que le jeton n'est vérifié et l'utilisateur lu qu'une fois."""
+    token = make_token()
+    mock_db = make_db()
+
+    first = get_user_from_token(token, mock_db)
+    second = get_user_from_token(token, mock_db)
+
+    assert first == second
+    assert first.id == 1 and first.complete_name == "Test User"
+    assert mock_db.query.call_count == 1
+    assert token_cache_stats == {"hits": 1, "misses": 1}
+
+
+def test_cached_token_expires():
+    """Test qu'un jeton en cache expiré est refusé."""
+    token = make_token()
+    get_user_from_token(token, make_db())
+
+    with mock.patch("authentication.auth_token.time.time") as clock:
+        clock.return_value = 4102444800  # 2100-01-01
+        with pytest.raises(PermissionError):
+            get_user_from_token(token, make_db())
+
+
+def test_cache_is_bounded():
+    """Test que le cache retire les jetons les plus anciens."""
+    with mock.patch.object(auth_token, "TOKEN_CACHE_SIZE", 2):
+        tokens = [make_token(user_id) for user_id in (1, 2, 3)]
+        for user_id, token in zip((1, 2, 3), tokens):
+            get_user_from_token(token, make_db(user_id))
+
+    assert len(auth_token._token_cache) == 2
+    mock_db = make_db(1)
+    get_user_from_token(tokens[0], mock_db)
+    assert mock_db.query.call_count == 1
+
+
+def test_invalidate_by_user():
+    """Test de l'invalidation des jetons d'un utilisateur."""
+    token = make_token(user_id=1)
+    get_user_from_token(token, make_db(1))
+
+    invalidate_token_cache(user_id=1)
+
+    mock_db = make_db(1)
+    get_user_from_token(token, mock_db)
+    assert mock_db.query.call_count == 1
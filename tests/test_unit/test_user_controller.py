@@ -78,6 +78,36 @@ def test_update_user(
     mock_db.commit.assert_called_once()
 
 
+@mock.patch("authentication.auth_utils.get_current_user_role")
+@mock.patch(
+    "authentication.auth_utils.can_perform_action", return_value=True
+    )
+def test_update_user_blank_password_keeps_hash(
+    mock_can_perform_action, mock_get_current_user_role
+):
+    """Test qu'un mot de passe laissé vide conserve le mot de passe actuel."""
+    mock_db = mock.Mock()
+    mock_get_current_user_role.return_value = "manager"
+
+    user = User(id=1, complete_name="Test User", email="test@example.com")
+    with mock.patch("model.user_model.BCRYPT_ROUNDS", 4):
+        user.set_password("Password1")
+    password_hash = user.password
+    mock_db.query.return_value.filter.return_value.first.return_value = user
+
+    update_user(
+        db=mock_db,
+        user_id=1,
+        token="fake_token",
+        selected_user_id=user.id,
+        password=""
+    )
+
+    assert user.password == password_hash
+    assert user.check_password("Password1")
+    assert not user.check_password("")
+
+
 @mock.patch("sqlalchemy.orm.Session")
 @mock.patch("authentication.auth_utils.get_current_user_role")
 @mock.patch(
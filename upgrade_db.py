@@ -0,0 +1,87 @@
+from sqlalchemy import inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import CreateIndex
+from config import get_engine, Base
+import model.user_model  # noqa: F401
+import model.client_model  # noqa: F401
+import model.contract_model  # noqa: F401
+import model.event_model  # noqa: F401
+import model.revoked_token_model  # noqa: F401
+from controller.search_index import create_search_index
+
+
+def create_missing_tables(bind: Engine) -> list:
+    """
+    Crée les tables déclarées sur les modèles qui n'existent pas encore
+    dans la base (avec leurs index). Retourne la liste des tables créées.
+    """
+    existing_tables = inspect(bind).get_table_names()
+    missing = [
+        table for table in Base.metadata.sorted_tables
+        if table.name not in existing_tables
+    ]
+    Base.metadata.create_all(bind=bind, tables=missing)
+    return [table.name for table in missing]
+
+
+def create_missing_indexes(bind: Engine) -> list:
+    """
+    Crée les index déclarés sur les modèles qui n'existent pas encore
+    dans la base. Peut être relancé sans effet sur une base à jour.
+    Retourne la liste des index créés.
+    """
+    inspector = inspect(bind)
+    existing_tables = inspector.get_table_names()
+    created = []
+
+    with bind.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+
+            existing_indexes = {
+                index["name"] for index in inspector.get_indexes(table.name)
+            }
+            for index in sorted(table.indexes, key=lambda index: index.name):
+                if index.name in existing_indexes:
+                    continue
+
+                ddl = str(CreateIndex(index).compile(dialect=bind.dialect))
+                if bind.dialect.name == "mysql":
+                    # Construction en ligne : la table reste lisible et modifiable
+                    ddl += " ALGORITHM=INPLACE LOCK=NONE"
+                connection.exec_driver_sql(ddl)
+                created.append(index.name)
+
+    return created
+
+
+def create_missing_search_index(bind: Engine) -> bool:
+    """
+    Crée et remplit l'index de recherche plein texte s'il manque.
+    Retourne True s'il a été créé.
+    """
+    with bind.begin() as connection:
+        return create_search_index(connection)
+
+
+def main():
+    """Fonction principale pour mettre à jour le schéma de la base de données."""
+
+    engine = get_engine()
+    # Avant create_missing_tables, qui le crée sans le signaler
+    if create_missing_search_index(engine):
+        print("Index de recherche plein texte créé avec succès.")
+    for table_name in create_missing_tables(engine):
+        print(f"Table '{table_name}' créée avec succès.")
+
+    created = create_missing_indexes(engine)
+
+    for index_name in created:
+        print(f"Index '{index_name}' créé avec succès.")
+    if not created:
+        print("Tous les index sont déjà présents.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,26 @@
 from rich.console import Console
-from rich.table import Table
 from InquirerPy import inquirer
+from InquirerPy.base.control import Choice
 from sqlalchemy.orm import Session
-from config import SessionLocal
+from config import get_session, release_session
 from controller.client_controller import (
-    get_all_clients,
     create_client,
     update_client,
     delete_client,
-    get_client_by_id
+    get_client_by_id,
+    get_clients_page,
+    search_clients,
+    CLIENT_KEYSET
     )
 from authentication.auth_service import (
+    allowed_actions,
     can_perform_action,
     get_current_user_role
     )
 from authentication.auth_token import get_user_from_token, load_token
 from controller.user_controller import get_commercials
+from view.paged_table import PagedTable, browse_table, column
+from view.search_select import search_select
 from view.validation import (
     validate_email,
     validate_phone_number,
@@ -25,45 +30,40 @@ from view.validation import (
 console = Console()
 
 
+CLIENT_COLUMNS = [
+    column("ID", lambda client: str(client.id),
+           justify="right", style="cyan", no_wrap=True),
+    column("Nom Complet", lambda client: client.full_name, style="blue"),
+    column("Email", lambda client: client.email, style="blue"),
+    column("Téléphone", lambda client: client.phone_number or "N/A",
+           style="blue"),
+    column("Entreprise", lambda client: client.company_name or "N/A",
+           style="blue"),
+    column("Date de Création", lambda client: str(client.creation_date),
+           style="blue"),
+    column("Dernière Mise à Jour", lambda client: str(client.last_update),
+           style="blue"),
+    column("Commercial", lambda client: (
+        client.commercial_contact.complete_name
+        if client.commercial_contact else "N/A"
+        ), style="blue"),
+]
+
+
 def display_clients(db: Session, token: str):
     """
-    Affiche la liste des clients.
+    Affiche la liste des clients page par page.
     """
-    clients = get_all_clients(db, token)
-    if not clients:
-        console.print("\n[blue]Aucun client trouvé.[/blue]\n")
-        return
-
-    table = Table(title="Liste des Clients")
-
-    table.add_column("ID", justify="right", style="cyan", no_wrap=True)
-    table.add_column("Nom Complet", style="blue")
-    table.add_column("Email", style="blue")
-    table.add_column("Téléphone", style="blue")
-    table.add_column("Entreprise", style="blue")
-    table.add_column("Date de Création", style="blue")
-    table.add_column("Dernière Mise à Jour", style="blue")
-    table.add_column("Commercial", style="blue")
-
-    for client in clients:
-        commercial_name = (
-            client.commercial_contact.complete_name
-            if client.commercial_contact else "N/A"
+    browse_table(
+        PagedTable(
+            "Liste des Clients", CLIENT_COLUMNS,
+            lambda after, limit: get_clients_page(
+                db, token, limit=limit, after=after, load="display"
+                ),
+            CLIENT_KEYSET
+            ),
+        "\n[blue]Aucun client trouvé.[/blue]\n"
         )
-        table.add_row(
-            str(client.id),
-            client.full_name,
-            client.email,
-            client.phone_number or "N/A",
-            client.company_name or "N/A",
-            str(client.creation_date),
-            str(client.last_update),
-            commercial_name,
-        )
-
-    console.print("\n")
-    console.print(table)
-    console.print("\n")
 
 
 def select_commercial(db: Session, token: str):
@@ -77,23 +77,33 @@ def select_commercial(db: Session, token: str):
         ("\n[[blue]Aucun commercial disponible.[/blue]\n[")
         return None
 
-    choices = [(f"{commercial.id} - {commercial.complete_name}",
-                commercial.id) for commercial in commercials]
-    choices.insert(0, ("Retour en arrière", None))
+    choices = [Choice(None, name="Retour en arrière")] + [
+        Choice(commercial.id, name=f"{commercial.id} - {commercial.complete_name}")
+        for commercial in commercials
+    ]
 
-    choice = inquirer.select(
+    commercial_id = inquirer.select(
         message="Sélectionnez un commercial :",
-        choices=[choice for choice, _ in choices],
+        choices=choices,
     ).execute()
 
-    if choice == "Retour en arrière":
+    if commercial_id is None:
         console.print("\n[blue]Retour en arrière.[/blue]\n")
-        return None
-
-    commercial_id = next((id for text, id in choices if text == choice), None)
     return commercial_id
 
 
+def select_client(db: Session, token: str, message: str):
+    """
+    Sélectionne un client par recherche sur son nom ou son id.
+    Retourne l'id du client choisi ou None.
+    """
+    return search_select(
+        message,
+        lambda text, limit: search_clients(db, token, text, limit),
+        lambda client: f"{client.id} - {client.full_name}",
+    )
+
+
 def prompt_create_client(db: Session, user_id: int, token: str):
     """
     Demande à l'utilisateur de saisir les
@@ -174,29 +184,11 @@ def prompt_update_client(db: Session, user_id: int, token: str):
     Demande à l'utilisateur de sélectionner un
     client et de mettre à jour ses informations.
     """
-    clients = get_all_clients(db, token)
-    if not clients:
-        console.print("\n[blue]Aucun client disponible.[/blue]\n")
-        return
-
-    client_choices = [
-        (f"{client.id} - {client.full_name}", client.id) for client in clients
-        ]
-    client_choices.insert(0, ("Retour en arrière", None))
-
-    selected_client_text = inquirer.select(
-        message="Sélectionnez un client à modifier :",
-        choices=[choice for choice, _ in client_choices],
-    ).execute()
-
-    if selected_client_text == "Retour en arrière":
+    client_id = select_client(db, token, "Recherchez un client à modifier :")
+    if client_id is None:
         console.print("\n[blue]Retour en arrière.[/blue]\n")
         return
 
-    client_id = next(
-        (id for text, id in client_choices if text == selected_client_text), None
-        )
-
     client = get_client_by_id(db, client_id)
     if not client:
         console.print("\n[red]Client non trouvé.[/red]\n")
@@ -260,30 +252,11 @@ def prompt_delete_client(db: Session, user_id: int, token: str):
     """
     Demande à l'utilisateur de sélectionner un client à supprimer.
     """
-    clients = get_all_clients(db, token)
-    if not clients:
-        console.print(
-            "\n[red]Aucun client disponible pour suppression.[/red]\n"
-            )
-        return
-
-    client_choices = [(f"Client ID {client.id} - {client.full_name}", client.id) for client in clients]
-    client_choices.insert(0, ("Retour en arrière", None))
-
-    selected_client_text = inquirer.select(
-        message="Sélectionnez un client à supprimer :",
-        choices=[choice for choice, _ in client_choices],
-    ).execute()
-
-    if selected_client_text == "Retour en arrière":
+    client_id = select_client(db, token, "Recherchez un client à supprimer :")
+    if client_id is None:
         console.print("\n[blue]Retour en arrière.[/blue]\n")
         return
 
-    client_id = next(
-        (id for text, id in client_choices
-            if text == selected_client_text), None
-    )
-
     confirmation = inquirer.confirm(
         message=f"Êtes-vous sûr de vouloir supprimer le client {client_id} ?",
         default=False
@@ -302,7 +275,7 @@ def prompt_delete_client(db: Session, user_id: int, token: str):
 
 def client_menu(current_user_role, user_id, token):
     """Affiche le menu de gestion des clients."""
-    db: Session = SessionLocal()
+    db: Session = get_session()
     try:
         token = load_token()
         user = get_user_from_token(token, db)
@@ -314,14 +287,16 @@ def client_menu(current_user_role, user_id, token):
             return
 
         while True:
+            release_session()
             menu_options = []
-            if can_perform_action(current_user_role, "get_all_clients"):
+            actions = allowed_actions(current_user_role)
+            if "get_all_clients" in actions:
                 menu_options.append("Afficher tous les clients")
-            if can_perform_action(current_user_role, "create_client"):
+            if "create_client" in actions:
                 menu_options.append("Créer un nouveau client")
-            if can_perform_action(current_user_role, "update_client"):
+            if "update_client" in actions:
                 menu_options.append("Modifier un client")
-            if can_perform_action(current_user_role, "delete_client"):
+            if "delete_client" in actions:
                 menu_options.append("Supprimer un client")
 
             menu_options.append("Retour au menu principal")
@@ -342,4 +317,4 @@ def client_menu(current_user_role, user_id, token):
             elif choice == "Retour au menu principal":
                 break
     finally:
-        db.close()
+        release_session()
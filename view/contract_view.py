@@ -1,41 +1,51 @@
 from sqlalchemy.orm import Session
 from InquirerPy import inquirer
 from rich.console import Console
-from rich.table import Table
-from config import SessionLocal
+from config import get_session, release_session
 from controller.contract_controller import (
-    get_all_contracts,
     create_contract,
     update_contract,
     delete_contract,
     get_contract_by_id,
+    get_contracts_page,
+    search_contracts,
+    contract_filters,
+    CONTRACT_KEYSET,
 )
-from controller.client_controller import get_all_clients
-from authentication.auth_service import can_perform_action
+from authentication.auth_service import allowed_actions
 from controller.user_controller import get_commercials
+from model.contract_model import STATUTS_CONTRAT
+from view.client_view import select_client
+from view.paged_table import PagedTable, browse_table, column
+from view.search_select import search_select
 
 
 console = Console()
 
 
-STATUTS_CONTRAT = [
-    "En négociation",
-    "Signé",
-    "En cours",
-    "Terminé",
-    "Annulé"
+CONTRACT_COLUMNS = [
+    column("ID", lambda contract: str(contract.id),
+           justify="center", style="cyan", no_wrap=True),
+    column("Client", lambda contract: (
+        contract.client.full_name if contract.client else "N/A"
+        ), justify="center", style="blue"),
+    column("Commercial", lambda contract: (
+        contract.commercial_contact.complete_name
+        if contract.commercial_contact else "N/A"
+        ), justify="center", style="blue"),
+    column("Prix Total", lambda contract: f"{contract.total_price:.2f} €",
+           justify="center", style="blue"),
+    column("Prix Restant", lambda contract: f"{contract.remaining_price:.2f} €",
+           justify="center", style="blue"),
+    column("Statut", lambda contract: contract.statut,
+           justify="center", style="blue"),
 ]
 
 
 def display_contracts(db: Session, token: str, current_user_role: str):
     """
-    Fonction pour afficher tous les contrats
+    Fonction pour afficher les contrats page par page
     """
-    contracts = get_all_contracts(db, token)
-    if not contracts:
-        console.print("\n[blue]Aucun contrat trouvé.[/blue]\n")
-        return
-    
     filter_choice = "Tous les contrats"
 
     if current_user_role == "commercial":
@@ -44,39 +54,36 @@ def display_contracts(db: Session, token: str, current_user_role: str):
             choices=["Tous les contrats", "Contrats signés", "Contrats payés intégralement"]
         ).execute()
 
-        if filter_choice == "Contrats signés":
-            contracts = [contract for contract in contracts if contract.statut == "Signé"]
-        elif filter_choice == "Contrats payés intégralement":
-            contracts = [contract for contract in contracts if contract.remaining_price == 0]
-
-    if not contracts:
-        console.print(f"\n[blue]Aucun contrat trouvé pour le filtre : {filter_choice}.[/blue]\n")
-        return
-
-    table = Table(title=f"\nListe des Contrats ({filter_choice})\n")
-    table.add_column("ID", justify="center", style="cyan", no_wrap=True)
-    table.add_column("Client", justify="center", style="blue")
-    table.add_column("Commercial", justify="center", style="blue")
-    table.add_column("Prix Total", justify="center", style="blue")
-    table.add_column("Prix Restant", justify="center", style="blue")
-    table.add_column("Statut", justify="center", style="blue")
-
-    for contract in contracts:
-        commercial_name = contract.commercial_contact.complete_name if contract.commercial_contact else "N/A"
-        client_name = contract.client.full_name if contract.client else "N/A"
-
-        table.add_row(
-            str(contract.id),
-            client_name,
-            commercial_name,
-            f"{contract.total_price:.2f} €",
-            f"{contract.remaining_price:.2f} €",
-            contract.statut
+    if filter_choice == "Contrats signés":
+        filters = contract_filters(statut="Signé")
+    elif filter_choice == "Contrats payés intégralement":
+        filters = contract_filters(fully_paid=True)
+    else:
+        filters = []
+
+    browse_table(
+        PagedTable(
+            f"\nListe des Contrats ({filter_choice})\n", CONTRACT_COLUMNS,
+            lambda after, limit: get_contracts_page(
+                db, token, limit=limit, after=after, load="display",
+                filters=filters
+                ),
+            CONTRACT_KEYSET
+            ),
+        f"\n[blue]Aucun contrat trouvé pour le filtre : {filter_choice}.[/blue]\n"
         )
 
-    console.print("\n")
-    console.print(table)
-    console.print("\n")
+
+def select_contract(db: Session, token: str, message: str):
+    """
+    Sélectionne un contrat par recherche sur son id ou le nom du client.
+    Retourne l'id du contrat choisi ou None.
+    """
+    return search_select(
+        message,
+        lambda text, limit: search_contracts(db, token, text, limit),
+        lambda contract: f"Contrat ID {contract.id} - {contract.client.full_name}",
+    )
 
 
 def prompt_create_contract(db: Session, user_id: int, token: str):
@@ -84,45 +91,24 @@ def prompt_create_contract(db: Session, user_id: int, token: str):
     Demande à l'utilisateur de saisir les
     informations pour créer un nouveau contrat.
     """
-    clients = get_all_clients(db, token)
     commercials = get_commercials(db)
 
-    if not clients:
-        console.print(
-            "\n[blue]Aucun client disponible pour créer un contrat.[/blue]\n"
-            )
-        return
-
     if not commercials:
         console.print(
             "\n[blue]Aucun commercial disponible pour créer un contrat.[/blue]\n"
             )
         return
 
-    client_choices = [
-        (f"{client.id} - {client.full_name}", client.id) for client in clients
-        ]
-    client_choices.insert(0, ("Retour en arrière", None))
-
     commercial_choices = [
         (f"{commercial.id} - {commercial.complete_name}", commercial.id)
         for commercial in commercials
         ]
 
-    selected_client_text = inquirer.select(
-        message="Sélectionnez un client :",
-        choices=[choice for choice, _ in client_choices]
-    ).execute()
-
-    if selected_client_text == "Retour en arrière":
+    client_id = select_client(db, token, "Recherchez un client :")
+    if client_id is None:
         console.print("\n[blue]Retour en arrière.[/blue]\n")
         return
 
-    client_id = next(
-        (id for text, id in client_choices
-            if text == selected_client_text), None
-        )
-
     commercial_contact_id = inquirer.select(
         message="Sélectionnez un commercial :",
         choices=[choice for choice, _ in commercial_choices]
@@ -172,33 +158,11 @@ def prompt_update_contract(db: Session, user_id: int, token: str):
     Demande à l'utilisateur de sélectionner un contrat
     à mettre à jour et les modifications à apporter.
     """
-    contracts = get_all_contracts(db, token)
-    if not contracts:
-        console.print(
-            "\n[blue]Aucun contrat disponible pour mise à jour.[/blue]\n"
-            )
-        return
-
-    contract_choices = [
-        (f"Contrat ID {contract.id} - {contract.client.full_name if contract.client else 'N/A'}", contract.id)
-        for contract in contracts
-        ]
-    contract_choices.insert(0, ("Retour en arrière", None))
-
-    selected_contract_text = inquirer.select(
-        message="Sélectionnez un contrat à modifier :",
-        choices=[choice for choice, _ in contract_choices]
-    ).execute()
-
-    if selected_contract_text == "Retour en arrière":
+    contract_id = select_contract(db, token, "Recherchez un contrat à modifier :")
+    if contract_id is None:
         console.print("\n[blue]Retour en arrière.[/blue]\n")
         return
 
-    contract_id = next(
-        (id for text, id in contract_choices
-            if text == selected_contract_text), None
-        )
-
     contract = get_contract_by_id(db, contract_id)
     if not contract:
         console.print("\n[blue]Contrat non trouvé.[/blue]\n")
@@ -267,36 +231,11 @@ def prompt_delete_contract(db: Session, user_id: int, token: str):
     """
     Demande à l'utilisateur de sélectionner un contrat à supprimer.
     """
-    contracts = get_all_contracts(db, token)
-    if not contracts:
-        console.print(
-            "\n[red]Aucun contrat disponible pour suppression.[/red]\n"
-            )
-        return
-
-    contract_choices = [
-        (
-            f"Contrat ID {contract.id} - {contract.client.full_name if contract.client else 'Client non spécifié'}",
-            contract.id
-        )
-        for contract in contracts
-    ]
-    contract_choices.insert(0, ("Retour en arrière", None))
-
-    selected_contract_text = inquirer.select(
-        message="Sélectionnez un contrat à supprimer :",
-        choices=[choice for choice, _ in contract_choices]
-    ).execute()
-
-    if selected_contract_text == "Retour en arrière":
+    contract_id = select_contract(db, token, "Recherchez un contrat à supprimer :")
+    if contract_id is None:
         console.print("\n[blue]Retour en arrière.[/blue]\n")
         return
 
-    contract_id = next(
-        (id for text, id in contract_choices
-            if text == selected_contract_text), None
-        )
-
     confirmation = inquirer.confirm(
         message=f"Êtes-vous sûr de vouloir supprimer le contrat {contract_id} ?",
         default=False
@@ -314,18 +253,20 @@ def contract_menu(current_user_role, user_id, token):
     """
     Menu principal pour la gestion des contrats.
     """
-    db: Session = SessionLocal()
+    db: Session = get_session()
 
     try:
         while True:
+            release_session()
             menu_options = []
-            if can_perform_action(current_user_role, "get_all_contracts"):
+            actions = allowed_actions(current_user_role)
+            if "get_all_contracts" in actions:
                 menu_options.append("Lister les contrats")
-            if can_perform_action(current_user_role, "create_contract"):
+            if "create_contract" in actions:
                 menu_options.append("Ajouter un contrat")
-            if can_perform_action(current_user_role, "update_contract"):
+            if "update_contract" in actions:
                 menu_options.append("Modifier un contrat")
-            if can_perform_action(current_user_role, "delete_contract"):
+            if "delete_contract" in actions:
                 menu_options.append("Supprimer un contrat")
 
             menu_options.append("Retour au menu principal")
@@ -346,4 +287,4 @@ def contract_menu(current_user_role, user_id, token):
             elif choice == "Retour au menu principal":
                 break
     finally:
-        db.close()
+        release_session()
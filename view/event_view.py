@@ -1,37 +1,68 @@
 from sqlalchemy.orm import Session
 from InquirerPy import inquirer
 from rich.console import Console
-from rich.table import Table
-from config import SessionLocal
+from config import get_session, release_session
 from datetime import datetime
 from controller.event_controller import (
-    get_all_events,
     create_event,
     update_event,
     delete_event,
     get_event_by_id,
+    get_events_page,
+    search_events,
+    event_filters,
+    EVENT_KEYSET,
 )
-from controller.client_controller import get_all_clients
+from controller.client_controller import get_client_by_id
 from controller.contract_controller import get_contracts_by_client_id
 from controller.user_controller import get_users_by_role
-from authentication.auth_service import can_perform_action
+from authentication.auth_service import allowed_actions
 from authentication.auth_token import get_user_from_token, load_token
+from view.client_view import select_client
+from view.paged_table import PagedTable, browse_table, column
+from view.search_select import search_select
 from view.validation import validate_digits, validate_text
 
 
 console = Console()
 
 
+EVENT_COLUMNS = [
+    column("ID", lambda event: str(event.id),
+           justify="center", style="cyan", no_wrap=True),
+    column("Nom de l'événement", lambda event: event.event_name,
+           justify="center", style="blue"),
+    column("Contrat", lambda event: (
+        str(event.contract_id) if event.contract_id else "N/A"
+        ), justify="center", style="blue"),
+    column("Client", lambda event: (
+        event.client.full_name if event.client else "N/A"
+        ), justify="center", style="blue"),
+    column("Contact Client", lambda event: event.client_contact or "N/A",
+           justify="center", style="blue"),
+    column("Date de début",
+           lambda event: event.date_start.strftime("%Y-%m-%d %H:%M"),
+           justify="center", style="blue"),
+    column("Date de fin",
+           lambda event: event.date_end.strftime("%Y-%m-%d %H:%M"),
+           justify="center", style="blue"),
+    column("Lieu", lambda event: event.location,
+           justify="center", style="blue"),
+    column("Contact Support", lambda event: (
+        event.support_contact.complete_name if event.support_contact else "N/A"
+        ), justify="center", style="blue"),
+    column("Participants", lambda event: (
+        str(event.attendees) if event.attendees is not None else "0"
+        ), justify="center", style="blue"),
+    column("Notes", lambda event: event.notes or "Pas de notes",
+           justify="center", style="blue"),
+]
+
+
 def display_events(db: Session, current_user_role: str, user_id: int, token: str):
     """
-    Affiche tous les événements.
+    Affiche les événements page par page.
     """
-    events = get_all_events(db, token)
-
-    if not events:
-        console.print("\n[blue]Aucun événement trouvé.[/blue]\n")
-        return
-
     if current_user_role == "gestion":
         filter_choice = inquirer.select(
             message="Souhaitez-vous appliquer un filtre ?",
@@ -44,55 +75,37 @@ def display_events(db: Session, current_user_role: str, user_id: int, token: str
         ).execute()
     else:
         filter_choice = "Tous les événements"
+
     if filter_choice == "Événements sans support" and current_user_role == "gestion":
-        filtered_events = [event for event in events if not event.support_contact]
+        filters = event_filters(unassigned=True)
     elif filter_choice == "Événements attribués à moi" and current_user_role == "support":
-        filtered_events = [event for event in events if event.support_contact and event.support_contact.id == user_id]
+        filters = event_filters(support_contact_id=user_id)
     else:
-        filtered_events = events
-
-    if not filtered_events:
-        console.print(f"\n[blue]Aucun événement trouvé pour le filtre : {filter_choice}.[/blue]\n")
-        return
-
-    table = Table(title="\nListe des Événements\n")
-    table.add_column("ID", justify="center", style="cyan", no_wrap=True)
-    table.add_column("Nom de l'événement", justify="center", style="blue")
-    table.add_column("Contrat", justify="center", style="blue")
-    table.add_column("Client", justify="center", style="blue")
-    table.add_column("Contact Client", justify="center", style="blue")
-    table.add_column("Date de début", justify="center", style="blue")
-    table.add_column("Date de fin", justify="center", style="blue")
-    table.add_column("Lieu", justify="center", style="blue")
-    table.add_column("Contact Support", justify="center", style="blue")
-    table.add_column("Participants", justify="center", style="blue")
-    table.add_column("Notes", justify="center", style="blue")
-
-    for event in filtered_events:
-        client_name = event.client.full_name if event.client else "N/A"
-        support_contact = event.support_contact.complete_name if event.support_contact else "N/A"
-        attendees = str(event.attendees) if event.attendees is not None else "0"
-        notes = event.notes if event.notes else "Pas de notes"
-        contract_id = str(event.contract_id) if event.contract_id else "N/A"
-        client_contact = event.client_contact if event.client_contact else "N/A"
-
-        table.add_row(
-            str(event.id),
-            event.event_name,
-            contract_id,
-            client_name,
-            client_contact,
-            event.date_start.strftime("%Y-%m-%d %H:%M"),
-            event.date_end.strftime("%Y-%m-%d %H:%M"),
-            event.location,
-            support_contact,
-            attendees,
-            notes
+        filters = []
+
+    browse_table(
+        PagedTable(
+            "\nListe des Événements\n", EVENT_COLUMNS,
+            lambda after, limit: get_events_page(
+                db, token, limit=limit, after=after, load="display",
+                filters=filters
+                ),
+            EVENT_KEYSET
+            ),
+        f"\n[blue]Aucun événement trouvé pour le filtre : {filter_choice}.[/blue]\n"
         )
 
-    console.print("\n")
-    console.print(table)
-    console.print("\n")
+
+def select_event(db: Session, token: str, message: str):
+    """
+    Sélectionne un événement par recherche sur son nom ou son id.
+    Retourne l'id de l'événement choisi ou None.
+    """
+    return search_select(
+        message,
+        lambda text, limit: search_events(db, token, text, limit),
+        lambda event: f"{event.id} - {event.event_name}",
+    )
 
 
 def prompt_create_event(db: Session, user_id: int, token: str):
@@ -100,38 +113,19 @@ def prompt_create_event(db: Session, user_id: int, token: str):
     Demande à l'utilisateur de saisir les
     informations pour créer un nouvel événement.
     """
-    clients = get_all_clients(db, token)
     supports = get_users_by_role(db, role='support')
 
-    if not clients:
-        console.print(
-            "\n[blue]Aucun client disponible pour créer un événement.[/blue]\n"
-            )
-        return
     if not supports:
         console.print(
             "\n[blue]Aucun contact support disponible pour créer un événement.[/blue]\n"
             )
         return
 
-    client_choices = [(f"{client.id} - {client.full_name}", client.id) for client in clients]
-    client_choices.insert(0, ("Retour en arrière", None))
-
-    selected_client_text = inquirer.select(
-        message="Sélectionnez un client :",
-        choices=[choice for choice, _ in client_choices]
-    ).execute()
-
-    if selected_client_text == "Retour en arrière":
+    selected_client_id = select_client(db, token, "Recherchez un client :")
+    if selected_client_id is None:
         console.print("\n[blue]Retour en arrière.[/blue]\n")
         return
-
-    selected_client_id = next(
-        (id for text, id in client_choices if text == selected_client_text), None
-        )
-    selected_client = next(
-        client for client in clients if client.id == selected_client_id
-        )
+    selected_client = get_client_by_id(db, selected_client_id)
 
     contracts = get_contracts_by_client_id(db, selected_client_id)
     if not contracts:
@@ -255,29 +249,11 @@ def prompt_update_event(db: Session, user_id: int, token: str):
     Demande à l'utilisateur de sélectionner un événement
     à mettre à jour et les modifications à apporter.
     """
-    events = get_all_events(db, token)
-    if not events:
-        console.print("\n[blue]Aucun événement disponible pour mise à jour.[/blue]\n")
-        return
-
-    event_choices = [
-        (f"{event.id} - {event.event_name}", event.id) for event in events
-    ]
-    event_choices.insert(0, ("Retour en arrière", None))
-
-    event_id = inquirer.select(
-        message="Sélectionnez un événement à modifier :",
-        choices=[choice for choice, _ in event_choices]
-    ).execute()
-
-    if event_id == "Retour en arrière":
+    event_id = select_event(db, token, "Recherchez un événement à modifier :")
+    if event_id is None:
         console.print("\n[blue]Retour en arrière.[/blue]\n")
         return
 
-    event_id = next(
-        (id for text, id in event_choices if text == event_id), None
-    )
-
     event = get_event_by_id(db, event_id)
     if not event:
         console.print("\n[blue]Événement non trouvé.[/blue]\n")
@@ -397,32 +373,11 @@ def prompt_delete_event(db: Session, user_id: int, token: str):
     """
     Demande à l'utilisateur de sélectionner un événement à supprimer.
     """
-    events = get_all_events(db, token)
-    if not events:
-        console.print(
-            "\n[blue]Aucun événement disponible pour suppression.[/blue]\n"
-            )
-        return
-
-    event_choices = [
-        (f"{event.id} - {event.event_name}", event.id) for event in events
-        ]
-    event_choices.insert(0, ("Retour en arrière", None))
-
-    event_id_text = inquirer.select(
-        message="Sélectionnez un événement à supprimer :",
-        choices=[choice for choice, _ in event_choices]
-    ).execute()
-
-    if event_id_text == "Retour en arrière":
+    event_id = select_event(db, token, "Recherchez un événement à supprimer :")
+    if event_id is None:
         console.print("\n[blue]Retour en arrière.[/blue]\n")
         return
 
-    event_id = next((
-        id for text, id in event_choices
-        if text == event_id_text), None
-        )
-
     confirmation = inquirer.confirm(
         message=f"Êtes-vous sûr de vouloir supprimer l'événement' {event_id} ?",
         default=False
@@ -440,7 +395,7 @@ def event_menu(current_user_role, user_id, token):
     """
     Menu principal pour la gestion des événements.
     """
-    db: Session = SessionLocal()
+    db: Session = get_session()
 
     try:
         token = load_token()
@@ -451,14 +406,16 @@ def event_menu(current_user_role, user_id, token):
                 )
             return
         while True:
+            release_session()
             menu_options = []
-            if can_perform_action(current_user_role, "get_all_events"):
+            actions = allowed_actions(current_user_role)
+            if "get_all_events" in actions:
                 menu_options.append("Lister les événements")
-            if can_perform_action(current_user_role, "create_event"):
+            if "create_event" in actions:
                 menu_options.append("Ajouter un événement")
-            if can_perform_action(current_user_role, "update_event"):
+            if "update_event" in actions:
                 menu_options.append("Modifier un événement")
-            if can_perform_action(current_user_role, "delete_event"):
+            if "delete_event" in actions:
                 menu_options.append("Supprimer un événement")
 
             menu_options.append("Retour au menu principal")
@@ -479,4 +436,4 @@ def event_menu(current_user_role, user_id, token):
             elif choice == "Retour au menu principal":
                 break
     finally:
-        db.close()
+        release_session()
@@ -0,0 +1,161 @@
+from collections import namedtuple
+from InquirerPy import inquirer
+from InquirerPy.base.control import Choice
+from rich.console import Console
+from rich.table import Table
+from config import DISPLAY_PAGE_SIZE, release_session
+from controller.pagination import cursor_of
+from view.validation import validate_digits
+
+
+console = Console()
+
+# Colonne d'un tableau : en-tête, fonction qui formate la cellule d'une ligne
+# et options de Table.add_column (style, justify...)
+TableColumn = namedtuple("TableColumn", ["header", "value", "options"])
+
+NEXT_PAGE = "Page suivante"
+PREVIOUS_PAGE = "Page précédente"
+JUMP_TO_PAGE = "Aller à la page..."
+SELECT_COLUMNS = "Choisir les colonnes"
+BACK = "Retour"
+
+
+def column(header: str, value, **options) -> TableColumn:
+    """
+    Décrit une colonne du tableau.
+    """
+    return TableColumn(header, value, options)
+
+
+class PagedTable:
+    """
+    Tableau Rich affiché page par page.
+    Les lignes sont demandées au contrôleur page par page (pagination par
+    clé) et seules celles de la page affichée sont formatées : le temps
+    d'affichage ne dépend pas du nombre total de lignes.
+    """
+
+    def __init__(self, title: str, columns: list, fetch_page, keyset: list,
+                 page_size: int = DISPLAY_PAGE_SIZE, **table_options):
+        """
+        `fetch_page(after, limit)` retourne au plus `limit` lignes après le
+        curseur `after` (valeurs des colonnes `keyset`).
+        """
+        self.title = title
+        self.columns = list(columns)
+        self.visible = list(columns)
+        self.fetch_page = fetch_page
+        self.keyset = keyset
+        self.page_size = page_size
+        self.table_options = table_options
+        # Curseur de début de chaque page déjà atteinte
+        self._cursors = [None]
+        self.page_number = 0
+        self.rows = []
+        self.has_next = False
+
+    def load(self, page_number: int) -> bool:
+        """
+        Charge la page demandée (la première page est 0). Les pages
+        intermédiaires jamais atteintes sont parcourues sans être formatées.
+        Retourne False si la page n'existe pas : la dernière page est
+        alors chargée.
+        """
+        number = min(page_number, len(self._cursors) - 1)
+        while True:
+            rows = list(self.fetch_page(self._cursors[number], self.page_size + 1))
+            has_next = len(rows) > self.page_size
+            rows = rows[:self.page_size]
+            if has_next and number + 1 == len(self._cursors):
+                self._cursors.append(cursor_of(rows[-1], self.keyset))
+            if number >= page_number or not has_next:
+                break
+            number += 1
+
+        self.page_number, self.rows, self.has_next = number, rows, has_next
+        return number == page_number
+
+    def render(self) -> Table:
+        """
+        Construit le tableau de la page chargée avec les colonnes visibles.
+        """
+        table = Table(
+            title=self.title, caption=f"Page {self.page_number + 1}",
+            **self.table_options
+            )
+        for visible in self.visible:
+            table.add_column(visible.header, **visible.options)
+        for row in self.rows:
+            table.add_row(*(visible.value(row) for visible in self.visible))
+        return table
+
+    def select_columns(self):
+        """
+        Demande à l'utilisateur les colonnes à afficher.
+        """
+        selected = inquirer.checkbox(
+            message="Colonnes à afficher :",
+            choices=[
+                Choice(index, name=item.header, enabled=item in self.visible)
+                for index, item in enumerate(self.columns)
+            ],
+        ).execute()
+        if selected:
+            self.visible = [self.columns[index] for index in sorted(selected)]
+
+    def navigation_choices(self) -> list:
+        """
+        Options de navigation disponibles depuis la page chargée.
+        """
+        choices = []
+        if self.has_next:
+            choices.append(NEXT_PAGE)
+        if self.page_number > 0:
+            choices.append(PREVIOUS_PAGE)
+        if self.has_next or self.page_number > 0:
+            choices.append(JUMP_TO_PAGE)
+        choices.extend([SELECT_COLUMNS, BACK])
+        return choices
+
+
+def browse_table(paged_table: PagedTable, empty_message: str):
+    """
+    Affiche le tableau page par page jusqu'à ce que l'utilisateur
+    choisisse de revenir au menu.
+    """
+    paged_table.load(0)
+    if not paged_table.rows:
+        console.print(empty_message)
+        return
+
+    while True:
+        console.print("\n")
+        console.print(paged_table.render())
+        console.print("\n")
+
+        # La connexion est rendue au pool pendant la saisie
+        release_session()
+        choice = inquirer.select(
+            message="Navigation :",
+            choices=paged_table.navigation_choices()
+        ).execute()
+
+        if choice == NEXT_PAGE:
+            paged_table.load(paged_table.page_number + 1)
+        elif choice == PREVIOUS_PAGE:
+            paged_table.load(paged_table.page_number - 1)
+        elif choice == JUMP_TO_PAGE:
+            page = inquirer.text(
+                message="Numéro de page :",
+                validate=lambda result: validate_digits(result) and int(result) > 0,
+                invalid_message="Veuillez entrer un numéro de page valide."
+            ).execute()
+            if not paged_table.load(int(page) - 1):
+                console.print(
+                    f"\n[blue]Seulement {paged_table.page_number + 1} pages.[/blue]"
+                    )
+        elif choice == SELECT_COLUMNS:
+            paged_table.select_columns()
+        else:
+            return
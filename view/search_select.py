@@ -0,0 +1,112 @@
+import asyncio
+from InquirerPy import inquirer
+from InquirerPy.base.control import Choice
+from prompt_toolkit.application.current import get_app
+from prompt_toolkit.completion import Completer, Completion
+from rich.console import Console
+from config import SEARCH_DEBOUNCE_SECONDS, SEARCH_RESULT_LIMIT, release_session
+
+
+console = Console()
+
+NEW_SEARCH = "Nouvelle recherche"
+BACK = "Retour en arrière"
+
+
+class SearchCompleter(Completer):
+    """
+    Propose, pendant la saisie, les lignes retournées par une recherche
+    limitée du contrôleur. Seules les propositions de la dernière
+    saisie sont conservées.
+    La requête est synchrone : elle n'est lancée qu'après une pause de
+    `debounce` secondes dans la frappe, pour ne pas bloquer la saisie
+    à chaque touche.
+    """
+
+    def __init__(self, search, label, limit: int = SEARCH_RESULT_LIMIT,
+                 debounce: float = SEARCH_DEBOUNCE_SECONDS):
+        """
+        `search(text, limit)` retourne au plus `limit` lignes correspondant
+        au texte saisi, `label(row)` le libellé proposé pour une ligne.
+        """
+        self.search = search
+        self.label = label
+        self.limit = limit
+        self.debounce = debounce
+        self.text = None
+        self.choices = {}
+
+    def lookup(self, text: str) -> dict:
+        """
+        Retourne les propositions (libellé -> id) pour le texte saisi.
+        La recherche n'est relancée que si le texte a changé.
+        """
+        text = text.strip()
+        if text != self.text:
+            rows = self.search(text, self.limit) or []
+            self.text = text
+            self.choices = {self.label(row): row.id for row in rows}
+            # La connexion est rendue au pool entre deux frappes
+            release_session()
+        return self.choices
+
+    def get_completions(self, document, complete_event):
+        if not document.text.strip():
+            return
+        for label in self.lookup(document.text):
+            yield Completion(label, start_position=-len(document.text))
+
+    async def get_completions_async(self, document, complete_event):
+        await asyncio.sleep(self.debounce)
+        if get_app().current_buffer.text != document.text:
+            # Saisie modifiée pendant l'attente : prompt_toolkit relance
+            # la complétion avec le nouveau texte
+            return
+        for completion in self.get_completions(document, complete_event):
+            yield completion
+
+
+def search_select(message: str, search, label,
+                  limit: int = SEARCH_RESULT_LIMIT):
+    """
+    Sélection avec recherche : les propositions sont chargées pendant la
+    saisie par des requêtes limitées, jamais la table entière.
+    Retourne l'id de la ligne choisie ou None pour revenir en arrière.
+    """
+    completer = SearchCompleter(search, label, limit)
+    while True:
+        release_session()
+        text = inquirer.text(
+            message=message,
+            completer=completer,
+            mandatory=False,
+            long_instruction="Début du nom ou id (laissez vide pour revenir).",
+        ).execute()
+        text = (text or "").strip()
+        if not text:
+            return None
+
+        # Proposition acceptée pendant la saisie
+        if text in completer.choices:
+            return completer.choices[text]
+
+        choices = completer.lookup(text)
+        if not choices:
+            console.print("\n[blue]Aucun résultat, modifiez la recherche.[/blue]\n")
+            continue
+        if len(choices) >= limit:
+            console.print(
+                f"\n[blue]Seuls les {limit} premiers résultats sont proposés, "
+                "précisez la recherche si besoin.[/blue]\n"
+                )
+
+        release_session()
+        selected = inquirer.select(
+            message=message,
+            choices=[
+                Choice(row_id, name=row_label)
+                for row_label, row_id in choices.items()
+            ] + [Choice(NEW_SEARCH), Choice(None, name=BACK)],
+        ).execute()
+        if selected != NEW_SEARCH:
+            return selected
@@ -0,0 +1,92 @@
+from InquirerPy import inquirer
+from InquirerPy.base.control import Choice
+from rich.console import Console
+from rich.table import Table
+from sqlalchemy.orm import Session
+from config import SEARCH_RESULT_LIMIT, get_session, release_session
+from controller.search_controller import search
+from authentication.auth_token import get_user_from_token, load_token
+
+
+console = Console()
+
+ENTITY_NAMES = {
+    "client": "Client",
+    "contract": "Contrat",
+    "event": "Événement",
+}
+
+
+def render_results(results: list, query: str) -> Table:
+    """
+    Construit le tableau des résultats, les plus pertinents en premier.
+    """
+    table = Table(title=f"Résultats pour « {query} »")
+    table.add_column("Type", style="magenta")
+    table.add_column("ID", justify="center", style="cyan", no_wrap=True)
+    table.add_column("Nom", style="blue")
+    table.add_column("Détail", style="green")
+    for result in results:
+        table.add_row(
+            ENTITY_NAMES[result.entity], str(result.id),
+            result.title, result.detail
+            )
+    return table
+
+
+def prompt_search(db: Session, token: str) -> bool:
+    """
+    Demande une recherche et affiche les résultats.
+    Retourne False si l'utilisateur a choisi de revenir au menu.
+    """
+    query = inquirer.text(
+        message=(
+            "Rechercher (nom, email, entreprise, lieu, numéro de contrat) :"
+        ),
+        long_instruction="Laissez vide pour revenir au menu principal.",
+    ).execute().strip()
+    if not query:
+        return False
+
+    entity = inquirer.select(
+        message="Rechercher dans :",
+        choices=[Choice(None, name="Tout")] + [
+            Choice(entity, name=name) for entity, name in ENTITY_NAMES.items()
+        ],
+    ).execute()
+
+    try:
+        results = search(db, token, query, entity, limit=SEARCH_RESULT_LIMIT)
+    except ValueError:
+        return True
+
+    if not results:
+        console.print(f"\n[blue]Aucun résultat pour « {query} ».[/blue]\n")
+        return True
+
+    console.print("\n")
+    console.print(render_results(results, query))
+    console.print("\n")
+    return True
+
+
+def search_menu(current_user_role, user_id, token):
+    """Affiche le menu de recherche plein texte."""
+    db: Session = get_session()
+    try:
+        token = load_token()
+        user = get_user_from_token(token, db)
+        if not user:
+            console.print(
+                "\n[red]Token invalide ou expiré."
+                "Veuillez vous reconnecter.[/red]\n"
+                )
+            return
+
+        while True:
+            # La connexion est rendue au pool pendant la saisie
+            release_session()
+            if not prompt_search(db, token):
+                break
+    finally:
+        release_session()
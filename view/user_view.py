@@ -1,17 +1,20 @@
 from rich.console import Console
-from rich.table import Table
 from InquirerPy import inquirer
 from sqlalchemy.orm import Session
-from config import SessionLocal
+from config import get_session, release_session
 from model.user_model import User
 from controller.user_controller import (
-    get_all_users,
     create_user,
     update_user,
     delete_user,
-    get_user_by_id
+    get_user_by_id,
+    get_users_page,
+    search_users,
+    USER_KEYSET
     )
-from authentication.auth_service import can_perform_action
+from authentication.auth_service import allowed_actions
+from view.paged_table import PagedTable, browse_table, column
+from view.search_select import search_select
 from view.validation import (
     validate_email,
     validate_employee_number,
@@ -35,36 +38,50 @@ def get_department_color(department_name):
     return role_colors.get(department_name, "white")
 
 
+def _colored(value):
+    """
+    Crée le formateur d'une cellule colorée selon le département.
+    """
+    def format_cell(user):
+        department_color = (
+            get_department_color(user.department.name)
+            if user.department else "white"
+            )
+        return f"[{department_color}] {value(user)}[/{department_color}]"
+    return format_cell
+
+
+USER_COLUMNS = [
+    column("ID", _colored(lambda user: user.id),
+           justify="right", style="cyan"),
+    column("Numéro Employé", _colored(lambda user: user.employee_number),
+           style="blue"),
+    column("Nom Complet", _colored(lambda user: user.complete_name),
+           style="blue"),
+    column("Email", _colored(lambda user: user.email), style="blue"),
+    column("Département", _colored(
+        lambda user: user.department.name if user.department else "Inconnu"
+        ), style="blue"),
+    column("Date de Création", _colored(lambda user: user.creation_date),
+           style="blue"),
+]
+
+
 def display_users(db: Session, token: str):
     """
-    Fonction pour afficher tous les utilisateurs.
+    Fonction pour afficher les utilisateurs page par page.
     """
-    users = get_all_users(db, token)
-    console.print("\n")
-    table = Table(title="Liste des Utilisateurs", border_style="cyan", title_style="cyan")
-
-    table.add_column("ID", justify="right", style="cyan")
-    table.add_column("Numéro Employé", style="blue")
-    table.add_column("Nom Complet", style="blue")
-    table.add_column("Email", style="blue")
-    table.add_column("Département", style="blue")
-    table.add_column("Date de Création", style="blue")
-
-    for user in users:
-        department_name = user.department.name if user.department else "Inconnu"
-        department_color = get_department_color(department_name) if user.department else "white"
-        table.add_row(
-            f"[{department_color}] {user.id}[/{department_color}]",
-            f"[{department_color}] {user.employee_number}[/{department_color}]",
-            f"[{department_color}] {user.complete_name}[/{department_color}]",
-            f"[{department_color}] {user.email}[/{department_color}]",
-            f"[{department_color}] {department_name}[/{department_color}]",
-            f"[{department_color}] {user.creation_date}[/{department_color}]"
+    browse_table(
+        PagedTable(
+            "Liste des Utilisateurs", USER_COLUMNS,
+            lambda after, limit: get_users_page(
+                db, token, limit=limit, after=after, load="display"
+                ),
+            USER_KEYSET, border_style="cyan", title_style="cyan"
+            ),
+        "\n[blue]Aucun utilisateur trouvé.[/blue]\n"
         )
 
-    console.print(table)
-    console.print("\n")
-
 
 def prompt_create_user(db: Session, user_id: int, token: str):
     """
@@ -141,34 +158,35 @@ def prompt_create_user(db: Session, user_id: int, token: str):
     )
 
 
-def prompt_update_user(db: Session, user_id: int, token: str):
+def user_label(user: User) -> str:
     """
-    Demande à l'utilisateur de sélectionner un utilisateur
-    à mettre à jour et les modifications à apporter.
+    Libellé d'un utilisateur dans les listes de sélection.
     """
-    users = get_all_users(db, token)
-    if not users:
-        console.print("\n[blue]Aucun utilisateur disponible pour mise à jour.[/blue]\n")
-        return
+    return f"{user.complete_name} (ID: {user.id})"
 
-    user_choices = [
-        (f"{user.complete_name} (ID: {user.id})", user.id) for user in users
-    ]
-    user_choices.insert(0, ("Retour en arrière", None))
 
-    selected_user = inquirer.select(
-        message="Sélectionnez un utilisateur à modifier :",
-        choices=[choice for choice, _ in user_choices]
-    ).execute()
+def select_user(db: Session, token: str, message: str):
+    """
+    Sélectionne un utilisateur par recherche sur son nom ou son id.
+    Retourne l'id de l'utilisateur choisi ou None.
+    """
+    return search_select(
+        message,
+        lambda text, limit: search_users(db, token, text, limit),
+        user_label,
+    )
+
 
-    if selected_user == "Retour en arrière":
+def prompt_update_user(db: Session, user_id: int, token: str):
+    """
+    Demande à l'utilisateur de sélectionner un utilisateur
+    à mettre à jour et les modifications à apporter.
+    """
+    selected_user_id = select_user(db, token, "Recherchez un utilisateur à modifier :")
+    if selected_user_id is None:
         console.print("\n[blue]Retour en arrière.[/blue]\n")
         return
 
-    selected_user_id = next(
-        (id for text, id in user_choices if text == selected_user), None
-    )
-
     user = get_user_by_id(db, selected_user_id)
     if not user:
         console.print("\n[blue]Utilisateur non trouvé.[/blue]\n")
@@ -234,29 +252,18 @@ def prompt_delete_user(db: Session, user_id: int, token: str):
         console.print("\n[blue]Suppression annulée, retour en arrière.[/blue]\n")
         return
 
-    users = get_all_users(db, token)
-    if not users:
-        console.print("\n[red]Aucun utilisateur trouvé.[/red]\n")
-        return
-
-    user_choices = [(f"{user.complete_name} (ID: {user.id})", user.id) for user in users]
-    user_choices.insert(0, ("Retour en arrière", None))
-
-    selected_user_text = inquirer.select(
-        message="Sélectionnez l'utilisateur à supprimer :",
-        choices=[choice for choice, _ in user_choices]
-    ).execute()
-
-    if selected_user_text == "Retour en arrière":
+    selected_user_id = select_user(db, token, "Recherchez l'utilisateur à supprimer :")
+    if selected_user_id is None:
         console.print("\n[blue]Suppression annulée, retour au menu précédent.[/blue]\n")
         return
 
-    selected_user_id = next(
-        (id for text, id in user_choices if text == selected_user_text), None
-    )
+    selected_user = get_user_by_id(db, selected_user_id)
+    if not selected_user:
+        console.print("\n[red]Utilisateur non trouvé.[/red]\n")
+        return
 
     confirmation = inquirer.confirm(
-        message=f"Êtes-vous sûr de vouloir supprimer l'utilisateur {selected_user_text} ?",
+        message=f"Êtes-vous sûr de vouloir supprimer l'utilisateur {user_label(selected_user)} ?",
         default=False
     ).execute()
 
@@ -278,18 +285,20 @@ def user_menu(current_user_role, user_id, token):
     """
     Menu principal pour la gestion des utilisateurs.
     """
-    db: Session = SessionLocal()
+    db: Session = get_session()
 
     try:
         while True:
+            release_session()
             menu_options = []
-            if can_perform_action(current_user_role, "get_all_users"):
+            actions = allowed_actions(current_user_role)
+            if "get_all_users" in actions:
                 menu_options.append("Afficher tous les utilisateurs")
-            if can_perform_action(current_user_role, "create_user"):
+            if "create_user" in actions:
                 menu_options.append("Créer un nouvel utilisateur")
-            if can_perform_action(current_user_role, "update_user"):
+            if "update_user" in actions:
                 menu_options.append("Modifier un utilisateur")
-            if can_perform_action(current_user_role, "delete_user"):
+            if "delete_user" in actions:
                 menu_options.append("Supprimer un utilisateur")
 
             menu_options.append("Retour au menu principal")
@@ -317,4 +326,4 @@ def user_menu(current_user_role, user_id, token):
                 console.print(f"[red]Erreur: {str(e)}[/red]")
 
     finally:
-        db.close()
+        release_session()